@@ -72,7 +72,24 @@ def compareConstants(a, b):
         if len(a) != len(b):
             return False
 
+        # Find the key in a hash lookup first, but 1 and 1.0 are equal keys,
+        # so the key found needs to be compared too.
+        keys_b = dict(
+            (eb1, eb1)
+            for eb1 in
+            b
+        )
+
         for ea1, ea2 in iterItems(a):
+            eb1 = keys_b.get(ea1, keys_b)
+
+            if eb1 is not keys_b and \
+               compareConstants(ea1, eb1) and \
+               compareConstants(ea2, b[eb1]):
+                continue
+
+            # Due to NaN values, we need to compare each key with all the other
+            # keys to be really sure.
             for eb1, eb2 in iterItems(b):
                 if compareConstants(ea1, eb1) and \
                    compareConstants(ea2, eb2):
@@ -85,15 +102,25 @@ def compareConstants(a, b):
         if len(a) != len(b):
             return False
 
+        elements_b = dict(
+            (eb, eb)
+            for eb in
+            b
+        )
+
         for ea in a:
-            if ea not in b:
-                # Due to NaN values, we need to compare each set element with
-                # all the other set to be really sure.
-                for eb in b:
-                    if compareConstants(ea, eb):
-                        break
-                else:
-                    return False
+            eb = elements_b.get(ea, elements_b)
+
+            if eb is not elements_b and compareConstants(ea, eb):
+                continue
+
+            # Due to NaN values, we need to compare each set element with
+            # all the other set to be really sure.
+            for eb in b:
+                if compareConstants(ea, eb):
+                    break
+            else:
+                return False
         return True
 
     if type(a) is xrange:
@@ -358,13 +358,41 @@ def makeSourceDirectory(main_module):
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
-            template_values, module_context = prepared_modules[c_filename]
+            # Release the prepared values as soon as the code is generated,
+            # these can be large.
+            template_values, module_context = prepared_modules.pop(c_filename)
+
+            # Large modules have their functions split into more files, that
+            # share a header with the main file.
+            base_filename = c_filename[:-2]
+
+            header_code, split_codes = CodeGeneration.generateModuleSplitCodes(
+                module_context  = module_context,
+                template_values = template_values,
+                header_name     = os.path.basename(base_filename) + ".h"
+            )
+
+            if split_codes:
+                writeSourceCode(
+                    filename    = base_filename + ".h",
+                    source_code = header_code
+                )
+
+                for count, split_code in enumerate(split_codes):
+                    writeSourceCode(
+                        filename    = "%s-%d.c" % (base_filename, count+1),
+                        source_code = split_code
+                    )
+
+            del header_code, split_codes
 
             source_code = CodeGeneration.generateModuleCode(
                 module_context  = module_context,
                 template_values = template_values
             )
 
+            del template_values
+
             writeSourceCode(
                 filename    = c_filename,
                 source_code = source_code
@@ -526,6 +554,9 @@ def runScons(main_module, quiet):
     if Options.isProfile():
         options["profile_mode"] = "true"
 
+    if Options.isInstrumentation():
+        options["instrumentation_mode"] = "true"
+
     if "no_warnings" in getPythonFlags():
         options["no_python_warnings"] = "true"
 
@@ -553,14 +584,22 @@ def runScons(main_module, quiet):
     return SconsInterface.runScons(options, quiet), options
 
 
+_source_code_chunk_size = 1024 * 1024
+
 def writeSourceCode(filename, source_code):
     # Prevent accidental overwriting. When this happens the collision detection
     # or something else has failed.
     assert not os.path.isfile(filename), filename
 
     if python_version >= 300:
+        # Encode in pieces, so there is no full copy of large source code.
         with open(filename, "wb") as output_file:
-            output_file.write(source_code.encode("latin1"))
+            for start in range(0, len(source_code), _source_code_chunk_size):
+                output_file.write(
+                    source_code[
+                        start:start+_source_code_chunk_size
+                    ].encode("latin1")
+                )
     else:
         with open(filename, 'w') as output_file:
             output_file.write(source_code)
@@ -667,6 +706,13 @@ def compileTree(main_module):
         if not os.path.isfile(os.path.join(source_dir, "__helpers.h")):
             sys.exit("Error, no previous build directory exists.")
 
+    if Options.isShowProgress():
+        info(
+            "Module finding did {count} file system queries.".format(
+                count = Importing.getFileSystemQueryCount()
+            )
+        )
+
     if Options.isShowProgress() or Options.isShowMemory():
         info(
             "Total memory usage before running scons: {memory}:".format(
@@ -370,6 +370,34 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is."""
 )
 
+codegen_group.add_option(
+    "--split-module-size",
+    action  = "store",
+    dest    = "split_module_size",
+    type    = "int",
+    metavar = "KB",
+    default = 4096,
+    help    = """\
+Split the C code of a module into multiple files, once the code of its
+functions exceeds this size in kilobytes. The C compiler can then work on
+the files in parallel and needs less memory for each. Use 0 to never split.
+Defaults to 4096."""
+)
+
+codegen_group.add_option(
+    "--lazy-imports",
+    action  = "store_true",
+    dest    = "lazy_imports",
+    default = False,
+    help    = """\
+Delay module level imports of modules that are only used for attribute
+look-ups until the first such look-up. Only modules included in the
+compilation, whose import is known to have no side effects, e.g. only defines
+functions and constants, are delayed. This speeds up the start of programs
+that import many modules, but errors from the import happen at that first
+use, and the variable is not the module object until then. Defaults to off."""
+)
+
 parser.add_option_group(codegen_group)
 
 outputdir_group = OptionGroup(
@@ -455,6 +483,20 @@ debug_group.add_option(
 Enable vmprof based profiling of time spent. Defaults to off."""
 )
 
+debug_group.add_option(
+    "--instrument",
+    action  = "store_true",
+    dest    = "instrumentation",
+    default = False,
+    help    = """\
+Enable counting of calls, exceptions and time spent for compiled functions.
+These are written at exit to "nuitka-instrumentation.json" and, loadable
+with "pstats", "nuitka-instrumentation.pstats", the environment variable
+"NUITKA_INSTRUMENTATION_OUTPUT" can change the name. Extension modules each
+write their own files, with the module name added, and do not credit time
+spent in other modules to their functions. Defaults to off."""
+)
+
 debug_group.add_option(
     "--graph",
     action  = "store_true",
@@ -817,6 +859,11 @@ Error, '--recurse-not-to' takes only module names, not directory path '%s'.""" %
                 no_case_module
             )
 
+    if options.split_module_size < 0:
+        sys.exit("""\
+Error, '--split-module-size' takes a size in kilobytes, or 0 to never split,
+not '%d'.""" % options.split_module_size)
+
     scons_python = getPythonPathForScons()
 
     if scons_python is not None and not os.path.exists(scons_python):
@@ -934,6 +981,10 @@ def isProfile():
     return options.profile
 
 
+def isInstrumentation():
+    return options.instrumentation
+
+
 def shouldCreateGraph():
     return options.graph
 
@@ -973,6 +1024,14 @@ def getJobLimit():
     return int(options.jobs)
 
 
+def getSplitModuleSize():
+    return options.split_module_size * 1024
+
+
+def shallUseLazyImports():
+    return options.lazy_imports
+
+
 def isLto():
     return options.lto
 
@@ -316,22 +316,21 @@ def updateVariablesFromCollection(old_collection, new_collection):
     touched_variables = set()
 
     if old_collection is not None:
-        for variable_trace in old_collection.getVariableTracesAll().values():
+        for variable_trace in old_collection.getVariableTracesAll():
             variable = variable_trace.getVariable()
 
             variable.removeTrace(variable_trace)
             touched_variables.add(variable)
 
     if new_collection is not None:
-        for variable_trace in new_collection.getVariableTracesAll().values():
+        for variable_trace in new_collection.getVariableTracesAll():
             variable = variable_trace.getVariable()
 
             variable.addTrace(variable_trace)
             touched_variables.add(variable)
 
-        # Release the memory, and prevent the "active" state from being ever
-        # inspected, it's useless now.
-        new_collection.variable_actives.clear()
+        # Prevent the "active" state from being ever inspected, it's useless
+        # now. Not clearing it, as it may be shared with other collections.
         del new_collection.variable_actives
 
     for variable in touched_variables:
@@ -74,7 +74,10 @@ struct Nuitka_GeneratorObject {
     Generator_Status m_status;
 
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    // The yield to resume at, zero when not started, and the storage of the
+    // local variables, which must survive the returns done for yields.
     int m_yield_return_index;
+    void *m_heap_storage;
 #else
     Fiber m_yielder_context;
     Fiber m_caller_context;
@@ -233,6 +236,94 @@ extern PyObject *GENERATOR_YIELD_FROM( struct Nuitka_GeneratorObject *generator,
 extern PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *generator, PyObject *target );
 #endif
 
+#else
+
+// In the state machine mode, the generator code returns the yielded value
+// and gets called again with the value sent into it, continuing after the
+// yield indicated by "m_yield_return_index", so these only do the parts that
+// happen around the return and the resume.
+
+static inline PyObject *GENERATOR_YIELD_EXIT( struct Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+
+    return value;
+}
+
+static inline PyObject *GENERATOR_YIELD_RESUME( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+    // Check for thrown exception.
+    if (unlikely( generator->m_exception_type ))
+    {
+        RESTORE_ERROR_OCCURRED(
+            generator->m_exception_type,
+            generator->m_exception_value,
+            generator->m_exception_tb
+        );
+
+        generator->m_exception_type = NULL;
+        generator->m_exception_value = NULL;
+        generator->m_exception_tb = NULL;
+
+        return NULL;
+    }
+
+    CHECK_OBJECT( yield_return_value );
+    return yield_return_value;
+}
+
+#if PYTHON_VERSION >= 300
+/* When yielding from an exception handler in Python3, the exception preserved
+ * to the frame is restored, while the current one is put there, and the same
+ * exchange is done again when returning from the yield.
+ */
+static inline void SWAP_GENERATOR_FRAME_EXCEPTION( void )
+{
+    PyThreadState *thread_state = PyThreadState_GET();
+
+    PyObject *saved_exception_type = thread_state->exc_type;
+    PyObject *saved_exception_value = thread_state->exc_value;
+    PyObject *saved_exception_traceback = thread_state->exc_traceback;
+
+    thread_state->exc_type = thread_state->frame->f_exc_type;
+    thread_state->exc_value = thread_state->frame->f_exc_value;
+    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+
+    thread_state->frame->f_exc_type = saved_exception_type;
+    thread_state->frame->f_exc_value = saved_exception_value;
+    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
+
+static inline PyObject *GENERATOR_YIELD_IN_HANDLER_EXIT( struct Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    SWAP_GENERATOR_FRAME_EXCEPTION();
+
+    return GENERATOR_YIELD_EXIT( generator, value );
+}
+
+static inline PyObject *GENERATOR_YIELD_IN_HANDLER_RESUME( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    SWAP_GENERATOR_FRAME_EXCEPTION();
+
+    return GENERATOR_YIELD_RESUME( generator, yield_return_value );
+}
+#endif
+
+#if PYTHON_VERSION >= 330
+// The iterator to delegate to for "yield from", a new reference.
+extern PyObject *GENERATOR_YIELD_FROM_ITERATOR( struct Nuitka_GeneratorObject *generator, PyObject *target );
+
+// Resume the delegation to the iterator, with "send_value" being NULL when
+// starting it. Gives the value to yield, or NULL when done, with "result"
+// then being the value of the "yield from", NULL in case of an exception.
+extern PyObject *GENERATOR_YIELD_FROM_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result );
+extern PyObject *GENERATOR_YIELD_FROM_IN_HANDLER_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result );
+#endif
+
 #endif
 
 #endif
@@ -307,5 +307,174 @@ NUITKA_MAY_BE_UNUSED static bool UNPACK_ITERATOR_CHECK( PyObject *iterator )
     }
 }
 
+// For loops over exact lists and tuples, these are iterated by index, with
+// a light weight iterator object that needs no garbage collection.
+struct Nuitka_LoopIteratorObject {
+    PyObject_HEAD
+
+    // The exact list or tuple, NULL when exhausted.
+    PyObject *m_sequence;
+    Py_ssize_t m_index;
+};
+
+extern PyTypeObject Nuitka_LoopIterator_Type;
+
+extern PyObject *MAKE_SEQUENCE_LOOP_ITERATOR( PyObject *sequence );
+
+// Creates the iterator of a loop, which is never visible to the program, so
+// lists and tuples need not have their real iterator type.
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_LOOP_ITERATOR( PyObject *iterated )
+{
+    CHECK_OBJECT( iterated );
+
+    if ( PyList_CheckExact( iterated ) || PyTuple_CheckExact( iterated ) )
+    {
+        return MAKE_SEQUENCE_LOOP_ITERATOR( iterated );
+    }
+
+    return MAKE_ITERATOR( iterated );
+}
+
+// Like "ITERATOR_NEXT", but with the index based iteration of lists and
+// tuples done inline.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOP_ITERATOR_NEXT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    if ( Py_TYPE( iterator ) != &Nuitka_LoopIterator_Type )
+    {
+        return ITERATOR_NEXT( iterator );
+    }
+
+    struct Nuitka_LoopIteratorObject *loop_iterator = (struct Nuitka_LoopIteratorObject *)iterator;
+
+    PyObject *sequence = loop_iterator->m_sequence;
+
+    if ( sequence == NULL )
+    {
+        return NULL;
+    }
+
+    Py_ssize_t index = loop_iterator->m_index;
+    PyObject *result;
+
+    if ( PyList_CheckExact( sequence ) )
+    {
+        // Lists may change size during the loop, checked every time.
+        if (unlikely( index >= PyList_GET_SIZE( sequence ) ))
+        {
+            loop_iterator->m_sequence = NULL;
+            Py_DECREF( sequence );
+
+            return NULL;
+        }
+
+        result = PyList_GET_ITEM( sequence, index );
+    }
+    else
+    {
+        if (unlikely( index >= PyTuple_GET_SIZE( sequence ) ))
+        {
+            loop_iterator->m_sequence = NULL;
+            Py_DECREF( sequence );
+
+            return NULL;
+        }
+
+        result = PyTuple_GET_ITEM( sequence, index );
+    }
+
+    loop_iterator->m_index = index + 1;
+
+    Py_INCREF( result );
+    return result;
+}
+
+// For "for key, value in d.items()" loops, exact dictionaries are iterated
+// directly, without creating item tuples.
+struct Nuitka_DictItemsIteratorObject {
+    PyObject_HEAD
+
+    // The exact dictionary, NULL when exhausted or for other objects.
+    PyObject *m_dict;
+    Py_ssize_t m_pos;
+    Py_ssize_t m_used;
+
+    // The iterator of items for other objects, NULL for dictionaries.
+    PyObject *m_iterator;
+
+    // The value of the item, after its key was given out.
+    PyObject *m_value;
+};
+
+extern PyObject *MAKE_DICT_ITEMS_ITERATOR( PyObject *source, PyObject *method_name );
+
+extern PyObject *_DICT_ITEMS_ITERATOR_NEXT_GENERIC( struct Nuitka_DictItemsIteratorObject *dict_iterator );
+
+// Gives the key of the next item, the value is then taken separately. Like
+// for "ITERATOR_NEXT", the end can be signaled without exception set.
+NUITKA_MAY_BE_UNUSED static PyObject *DICT_ITEMS_ITERATOR_NEXT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    struct Nuitka_DictItemsIteratorObject *dict_iterator = (struct Nuitka_DictItemsIteratorObject *)iterator;
+
+    // In case the value was not used.
+    Py_CLEAR( dict_iterator->m_value );
+
+    if (unlikely( dict_iterator->m_iterator != NULL ))
+    {
+        return _DICT_ITEMS_ITERATOR_NEXT_GENERIC( dict_iterator );
+    }
+
+    PyObject *dict = dict_iterator->m_dict;
+
+    if ( dict == NULL )
+    {
+        return NULL;
+    }
+
+    if (unlikely( dict_iterator->m_used != ((PyDictObject *)dict)->ma_used ))
+    {
+        PyErr_Format( PyExc_RuntimeError, "dictionary changed size during iteration" );
+
+        // Make sure it keeps failing.
+        dict_iterator->m_used = -1;
+
+        return NULL;
+    }
+
+    PyObject *key, *value;
+
+    if ( PyDict_Next( dict, &dict_iterator->m_pos, &key, &value ) == 0 )
+    {
+        dict_iterator->m_dict = NULL;
+        Py_DECREF( dict );
+
+        return NULL;
+    }
+
+    Py_INCREF( key );
+    Py_INCREF( value );
+
+    dict_iterator->m_value = value;
+
+    return key;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *DICT_ITEMS_ITERATOR_VALUE( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    struct Nuitka_DictItemsIteratorObject *dict_iterator = (struct Nuitka_DictItemsIteratorObject *)iterator;
+
+    PyObject *result = dict_iterator->m_value;
+    CHECK_OBJECT( result );
+
+    dict_iterator->m_value = NULL;
+
+    return result;
+}
+
 #endif
 
@@ -41,5 +41,117 @@ NUITKA_MAY_BE_UNUSED static PyObject *LIST_COPY( PyObject *list )
     return result;
 }
 
+// Subscript look-up on a value known to be an exact list, avoids the generic
+// mapping protocol dispatch for the common integer index case.
+NUITKA_MAY_BE_UNUSED static PyObject *LIST_GET_ITEM( PyObject *list, PyObject *index )
+{
+    CHECK_OBJECT( list );
+    CHECK_OBJECT( index );
+    assert( PyList_CheckExact( list ) );
+
+    Py_ssize_t i;
+
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( index ) )
+    {
+        i = PyInt_AS_LONG( index );
+    }
+    else
+#endif
+    if ( PyLong_CheckExact( index ) )
+    {
+        i = PyLong_AsSsize_t( index );
+
+        // Overflow is reported by the generic code with its own message.
+        if (unlikely( i == -1 && ERROR_OCCURRED() ))
+        {
+            CLEAR_ERROR_OCCURRED();
+
+            return LOOKUP_SUBSCRIPT( list, index );
+        }
+    }
+    else
+    {
+        return LOOKUP_SUBSCRIPT( list, index );
+    }
+
+    Py_ssize_t size = PyList_GET_SIZE( list );
+
+    if ( i < 0 )
+    {
+        i += size;
+    }
+
+    if (unlikely( i < 0 || i >= size ))
+    {
+        PyErr_Format( PyExc_IndexError, "list index out of range" );
+        return NULL;
+    }
+
+    PyObject *result = PyList_GET_ITEM( list, i );
+    Py_INCREF( result );
+
+    return result;
+}
+
+// Subscript assignment to a value known to be an exact list, avoids the generic
+// mapping protocol dispatch for the common integer index case.
+NUITKA_MAY_BE_UNUSED static bool LIST_SET_ITEM( PyObject *list, PyObject *index, PyObject *value )
+{
+    CHECK_OBJECT( list );
+    CHECK_OBJECT( index );
+    CHECK_OBJECT( value );
+    assert( PyList_CheckExact( list ) );
+
+    Py_ssize_t i;
+
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( index ) )
+    {
+        i = PyInt_AS_LONG( index );
+    }
+    else
+#endif
+    if ( PyLong_CheckExact( index ) )
+    {
+        i = PyLong_AsSsize_t( index );
+
+        // Overflow is reported by the generic code with its own message.
+        if (unlikely( i == -1 && ERROR_OCCURRED() ))
+        {
+            CLEAR_ERROR_OCCURRED();
+
+            return SET_SUBSCRIPT( list, index, value );
+        }
+    }
+    else
+    {
+        return SET_SUBSCRIPT( list, index, value );
+    }
+
+    Py_ssize_t size = PyList_GET_SIZE( list );
+
+    if ( i < 0 )
+    {
+        i += size;
+    }
+
+    if (unlikely( i < 0 || i >= size ))
+    {
+        PyErr_Format( PyExc_IndexError, "list assignment index out of range" );
+        return false;
+    }
+
+    PyObject *old = PyList_GET_ITEM( list, i );
+
+    Py_INCREF( value );
+    PyList_SET_ITEM( list, i, value );
+
+    // Releasing the old value may run arbitrary code, so do it only after the
+    // list is consistent again.
+    Py_DECREF( old );
+
+    return true;
+}
 
 #endif
@@ -367,4 +367,171 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GE( PyObject *operand1, PyObje
     return result;
 }
 
+// Comparisons where at least one operand is known to be an exact "int",
+// "float", or "str" object. If the other one has the same type, the result
+// is computed inline, without creating or checking any objects, otherwise
+// the generic helper of the operation is used. The "op" is a constant, so
+// the compiler can reduce these to the one comparison needed.
+
+#define _COMPARE_VALUES( value1, value2, op ) \
+    ( (op) == Py_LT ? (value1) < (value2) : \
+      (op) == Py_LE ? (value1) <= (value2) : \
+      (op) == Py_EQ ? (value1) == (value2) : \
+      (op) == Py_NE ? (value1) != (value2) : \
+      (op) == Py_GT ? (value1) > (value2) : \
+                      (value1) >= (value2) )
+
+// Result of the inline comparison, if the operand types did not allow it.
+#define COMPARE_INLINE_NOT_DONE -2
+
+NUITKA_MAY_BE_UNUSED static inline int _COMPARE_INLINE_INT( PyObject *operand1, PyObject *operand2, int op )
+{
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) )
+    {
+        return _COMPARE_VALUES( PyInt_AS_LONG( operand1 ), PyInt_AS_LONG( operand2 ), op );
+    }
+#else
+    if ( PyLong_CheckExact( operand1 ) && PyLong_CheckExact( operand2 ) )
+    {
+        Py_ssize_t size1 = Py_SIZE( operand1 );
+        Py_ssize_t size2 = Py_SIZE( operand2 );
+
+        // Values of at most one digit are the common case, these are
+        // compared directly. Zero has no digit stored at all.
+        if ( size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1 )
+        {
+            long value1 = size1 == 0 ? 0 : size1 * (long)( (PyLongObject *)operand1 )->ob_digit[0];
+            long value2 = size2 == 0 ? 0 : size2 * (long)( (PyLongObject *)operand2 )->ob_digit[0];
+
+            return _COMPARE_VALUES( value1, value2, op );
+        }
+
+        int overflow1, overflow2;
+
+        // Cannot fail for exact "int" values, only overflow.
+        long value1 = PyLong_AsLongAndOverflow( operand1, &overflow1 );
+        long value2 = PyLong_AsLongAndOverflow( operand2, &overflow2 );
+
+        if ( overflow1 == 0 && overflow2 == 0 )
+        {
+            return _COMPARE_VALUES( value1, value2, op );
+        }
+    }
+#endif
+
+    return COMPARE_INLINE_NOT_DONE;
+}
+
+NUITKA_MAY_BE_UNUSED static inline int _COMPARE_INLINE_FLOAT( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( PyFloat_CheckExact( operand1 ) && PyFloat_CheckExact( operand2 ) )
+    {
+        // The C comparisons behave like Python for "nan" values too.
+        return _COMPARE_VALUES( PyFloat_AS_DOUBLE( operand1 ), PyFloat_AS_DOUBLE( operand2 ), op );
+    }
+
+    return COMPARE_INLINE_NOT_DONE;
+}
+
+NUITKA_MAY_BE_UNUSED static inline int _COMPARE_INLINE_STR( PyObject *operand1, PyObject *operand2, int op )
+{
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( operand1 ) && PyString_CheckExact( operand2 ) )
+    {
+        Py_ssize_t size1 = PyString_GET_SIZE( operand1 );
+        Py_ssize_t size2 = PyString_GET_SIZE( operand2 );
+
+        if ( op == Py_EQ || op == Py_NE )
+        {
+            bool equal = size1 == size2 && (
+                operand1 == operand2 ||
+                memcmp( PyString_AS_STRING( operand1 ), PyString_AS_STRING( operand2 ), size1 ) == 0
+            );
+
+            return equal == ( op == Py_EQ );
+        }
+
+        int order = memcmp(
+            PyString_AS_STRING( operand1 ),
+            PyString_AS_STRING( operand2 ),
+            size1 < size2 ? size1 : size2
+        );
+
+        if ( order == 0 )
+        {
+            order = size1 < size2 ? -1 : size1 > size2;
+        }
+
+        return _COMPARE_VALUES( order, 0, op );
+    }
+#else
+    if ( PyUnicode_CheckExact( operand1 ) && PyUnicode_CheckExact( operand2 ) )
+    {
+        if ( operand1 == operand2 )
+        {
+            return _COMPARE_VALUES( 0, 0, op );
+        }
+
+        int order = PyUnicode_Compare( operand1, operand2 );
+
+        if (unlikely( order == -1 && ERROR_OCCURRED() ))
+        {
+            return -1;
+        }
+
+        return _COMPARE_VALUES( order, 0, op );
+    }
+#endif
+
+    return COMPARE_INLINE_NOT_DONE;
+}
+
+// The generic helper, e.g. "EQ" or "EQ_NORECURSE", keeps its shortcut for
+// identical operands.
+#define _DECLARE_RICH_COMPARE_TYPED_OP( type_name, helper, op ) \
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_##helper##_##type_name( PyObject *operand1, PyObject *operand2 ) \
+{ \
+    int result = _COMPARE_INLINE_##type_name( operand1, operand2, op ); \
+    \
+    if (unlikely( result == COMPARE_INLINE_NOT_DONE )) \
+    { \
+        return RICH_COMPARE_BOOL_##helper( operand1, operand2 ); \
+    } \
+    \
+    return result; \
+} \
+\
+NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_##helper##_##type_name( PyObject *operand1, PyObject *operand2 ) \
+{ \
+    int result = _COMPARE_INLINE_##type_name( operand1, operand2, op ); \
+    \
+    if (unlikely( result == COMPARE_INLINE_NOT_DONE )) \
+    { \
+        return RICH_COMPARE_##helper( operand1, operand2 ); \
+    } \
+    \
+    if (unlikely( result == -1 )) \
+    { \
+        return NULL; \
+    } \
+    \
+    PyObject *value = BOOL_FROM( result != 0 ); \
+    Py_INCREF( value ); \
+    return value; \
+}
+
+#define _DECLARE_RICH_COMPARE_TYPED( type_name ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, LT, Py_LT ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, LE, Py_LE ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, EQ, Py_EQ ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, EQ_NORECURSE, Py_EQ ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, NE, Py_NE ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, GT, Py_GT ) \
+_DECLARE_RICH_COMPARE_TYPED_OP( type_name, GE, Py_GE )
+
+_DECLARE_RICH_COMPARE_TYPED( INT )
+_DECLARE_RICH_COMPARE_TYPED( FLOAT )
+_DECLARE_RICH_COMPARE_TYPED( STR )
+
 #endif
@@ -65,6 +65,11 @@ extern void startProfiling( void );
 extern void stopProfiling( void );
 #endif
 
+// For instrumentation of Nuitka compiled functions
+#if _NUITKA_INSTRUMENTATION
+#include "nuitka/instrumentation.h"
+#endif
+
 
 #include "nuitka/helper/boolean.h"
 
@@ -499,6 +504,36 @@ extern PyObject *BUILTIN_ISINSTANCE( PyObject *inst, PyObject *cls );
 // The patched isinstance() functionality used for the built-in.
 extern int Nuitka_IsInstance( PyObject *inst, PyObject *cls );
 
+// For built-in isinstance() with built-in types only, after the type checks
+// of these failed already. Only a "__class__" attribute that is not the type
+// of the instance could still make it an instance.
+NUITKA_MAY_BE_UNUSED static int Nuitka_IsInstanceByClass( PyObject *inst, PyObject *cls )
+{
+    CHECK_OBJECT( inst );
+    CHECK_OBJECT( cls );
+
+    PyTypeObject *type = Py_TYPE( inst );
+
+    if (likely( type->tp_getattro == PyObject_GenericGetAttr && _PyType_Lookup( type, const_str_plain___class__ ) == _PyType_Lookup( &PyBaseObject_Type, const_str_plain___class__ ) ))
+    {
+        return 0;
+    }
+
+    return Nuitka_IsInstance( inst, cls );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BUILTIN_ISINSTANCE_BY_CLASS( PyObject *inst, PyObject *cls )
+{
+    int res = Nuitka_IsInstanceByClass( inst, cls );
+
+    if (unlikely( res < 0 ))
+    {
+        return NULL;
+    }
+
+    return BOOL_FROM( res != 0 );
+}
+
 // For built-in getattr() functionality.
 extern PyObject *BUILTIN_GETATTR( PyObject *object, PyObject *attribute, PyObject *default_value );
 
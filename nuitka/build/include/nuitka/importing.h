@@ -31,6 +31,27 @@ extern PyObject *IMPORT_MODULE4( PyObject *module_name, PyObject *globals, PyObj
 extern PyObject *IMPORT_MODULE5( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
 extern PyObject *IMPORT_MODULE_KW( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
 
+/* For absolute imports of constant names, each import site remembers the
+ * module it found in "sys.modules" and the import result. As long as the
+ * built-in import is not replaced, and that module is still present, the
+ * result is given without doing the import again.
+ */
+struct Nuitka_ImportCache {
+    PyObject *module;
+    PyObject *result;
+
+    // Without a fromlist, a dotted name gives the top level package, which
+    // must then be the one in "sys.modules" too.
+    PyObject *top_level_name;
+};
+
+extern PyObject *IMPORT_MODULE_CACHED( struct Nuitka_ImportCache *cache, PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
+
+/* For lazy imports, creates an object that does the import when an attribute
+ * of it is used first, and then binds the module to the variable in globals.
+ */
+extern PyObject *IMPORT_MODULE_LAZY( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level, PyObject *variable_name );
+
 extern bool IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module );
 
 extern PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name );
@@ -0,0 +1,162 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_INSTRUMENTATION_H__
+#define __NUITKA_INSTRUMENTATION_H__
+
+// Instrumentation of compiled functions, with counters for calls, exceptions
+// and the time spent, written at exit.
+
+#if defined(_MSC_VER)
+#define NUITKA_THREAD_LOCAL __declspec(thread)
+#else
+#define NUITKA_THREAD_LOCAL __thread
+#endif
+
+// One per compiled function, static and registered on first call. Updates
+// are done while holding the GIL.
+struct Nuitka_InstrumentationRecord {
+    char const *m_name;
+    char const *m_filename;
+    int m_line;
+
+    unsigned long long m_calls;
+    unsigned long long m_primitive_calls;
+    unsigned long long m_exceptions;
+
+    // Time spent, including and excluding called instrumented functions.
+    unsigned long long m_total_time;
+    unsigned long long m_own_time;
+
+    bool m_registered;
+    struct Nuitka_InstrumentationRecord *m_next;
+};
+
+// One per running call, on the C stack of the compiled function.
+struct Nuitka_InstrumentationFrame {
+    struct Nuitka_InstrumentationRecord *m_record;
+    struct Nuitka_InstrumentationFrame *m_parent;
+
+    unsigned long long m_start;
+    unsigned long long m_child_time;
+
+    // If the record has an active call in this thread already.
+    bool m_recursive;
+};
+
+extern NUITKA_THREAD_LOCAL struct Nuitka_InstrumentationFrame *current_instrumentation_frame;
+
+// Check the running calls of the current thread for the record, other threads
+// may run the same function at the same time without recursion.
+static inline bool isInstrumentationRecordActive( struct Nuitka_InstrumentationRecord const *record )
+{
+    struct Nuitka_InstrumentationFrame const *frame = current_instrumentation_frame;
+
+    while ( frame != NULL )
+    {
+        if ( frame->m_record == record )
+        {
+            return true;
+        }
+
+        frame = frame->m_parent;
+    }
+
+    return false;
+}
+
+extern void registerInstrumentationRecord( struct Nuitka_InstrumentationRecord *record );
+
+// Monotonic time in nanoseconds.
+#if defined(_WIN32)
+extern unsigned long long getInstrumentationTime( void );
+#else
+#include <time.h>
+
+static inline unsigned long long getInstrumentationTime( void )
+{
+    struct timespec now;
+    clock_gettime( CLOCK_MONOTONIC, &now );
+
+    return (unsigned long long)now.tv_sec * 1000000000 + now.tv_nsec;
+}
+#endif
+
+static inline void INSTRUMENTATION_ENTER( struct Nuitka_InstrumentationRecord *record, struct Nuitka_InstrumentationFrame *frame )
+{
+    if (unlikely( record->m_registered == false ))
+    {
+        registerInstrumentationRecord( record );
+    }
+
+    record->m_calls += 1;
+
+    frame->m_recursive = isInstrumentationRecordActive( record );
+
+    if ( frame->m_recursive == false )
+    {
+        record->m_primitive_calls += 1;
+    }
+
+    frame->m_record = record;
+    frame->m_parent = current_instrumentation_frame;
+    frame->m_child_time = 0;
+
+    current_instrumentation_frame = frame;
+
+    frame->m_start = getInstrumentationTime();
+}
+
+static inline void INSTRUMENTATION_LEAVE( struct Nuitka_InstrumentationFrame *frame, bool exception )
+{
+    unsigned long long elapsed = getInstrumentationTime() - frame->m_start;
+
+    struct Nuitka_InstrumentationRecord *record = frame->m_record;
+
+    // Recursive calls are part of the outermost one already.
+    if ( frame->m_recursive == false )
+    {
+        record->m_total_time += elapsed;
+    }
+
+    record->m_own_time += elapsed - frame->m_child_time;
+
+    if ( exception )
+    {
+        record->m_exceptions += 1;
+    }
+
+    current_instrumentation_frame = frame->m_parent;
+
+    if ( frame->m_parent != NULL )
+    {
+        frame->m_parent->m_child_time += elapsed;
+    }
+}
+
+// Write the collected records, as JSON and as "pstats" loadable marshal file.
+// For extension modules, the module name is added to the file names.
+extern void dumpInstrumentation( char const *module_name );
+
+#ifdef _NUITKA_MODULE
+// For extension modules, there is no main program to do it. Each one has its
+// own records and call stack, so time spent in functions of other modules is
+// not credited as child time.
+extern void registerInstrumentationDump( char const *module_name );
+#endif
+
+#endif
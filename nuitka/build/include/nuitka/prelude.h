@@ -45,6 +45,7 @@
 #include "frameobject.h"
 #include "pydebug.h"
 #include "marshal.h"
+#include "longintrepr.h"
 
 /* The bool type. From Python2 header or self defined for Python3. */
 #if PYTHON_VERSION < 300
@@ -206,10 +207,15 @@ typedef long Py_hash_t;
 #endif
 
 /* These two express if a directly called function should be exported (C level)
- * or if it can be local to the file.
+ * or if it can be local to the file. For modules split into multiple files,
+ * local things need to be visible to all of them.
  */
 #define NUITKA_CROSS_MODULE
+#ifdef _NUITKA_SPLIT_MODULE
+#define NUITKA_LOCAL_MODULE
+#else
 #define NUITKA_LOCAL_MODULE static
+#endif
 
 /* Due to ABI issues, it seems that on Windows the symbols used by
  * "_PyObject_GC_TRACK" are not exported and we need to use a function that does
@@ -26,6 +26,23 @@ extern volatile int _Py_Ticker;
 #define _Py_CheckInterval 20
 #endif
 
+// Check if another thread could be waiting for the GIL. The GIL waiters, for
+// Python3 the "gil_drop_request" and for Python2 the lock, are private to the
+// CPython core, but any thread that waits for the GIL has a thread state, so
+// without other thread states, nobody can want it.
+NUITKA_MAY_BE_UNUSED static inline bool hasOtherThreadStates( PyThreadState *tstate )
+{
+    PyInterpreterState *interp = tstate->interp;
+
+    if ( interp->tstate_head != tstate || tstate->next != NULL )
+    {
+        return true;
+    }
+
+    // Other interpreters share the GIL with us.
+    return PyInterpreterState_Head() != interp || PyInterpreterState_Next( interp ) != NULL;
+}
+
 NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING( void )
 {
     // Decrease ticker
@@ -43,11 +60,10 @@ NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING( void )
         PyThreadState *tstate = PyThreadState_GET();
         assert( tstate );
 
-        if ( PyEval_ThreadsInitialized() )
+        // Release and acquire the GIL only if another thread could be waiting
+        // for it, otherwise it's pure overhead.
+        if ( PyEval_ThreadsInitialized() && hasOtherThreadStates( tstate ) )
         {
-            // Release and acquire the GIL, it's very inefficient, because we
-            // don't even know if it makes sense to do it. A controlling thread
-            // should be used to determine if it's needed at all.
             PyEval_SaveThread();
             PyEval_AcquireThread( tstate );
         }
@@ -677,24 +677,26 @@ PyObject *BUILTIN_LEN( PyObject *value )
     return PyInt_FromSsize_t( res );
 }
 
-NUITKA_DEFINE_BUILTIN( format );
-
 PyObject *BUILTIN_FORMAT( PyObject *value, PyObject *format_spec )
 {
     CHECK_OBJECT( value );
     CHECK_OBJECT( format_spec );
 
-    NUITKA_ASSIGN_BUILTIN( format );
+#if PYTHON_VERSION >= 300
+    // The built-in checks this when parsing its arguments, the API doesn't.
+    if (unlikely( !PyUnicode_Check( format_spec ) ))
+    {
+        PyErr_Format(
+            PyExc_TypeError,
+            "format() argument 2 must be str, not %s",
+            Py_TYPE( format_spec )->tp_name
+        );
 
-    PyObject *args[2] = {
-        value,
-        format_spec
-    };
+        return NULL;
+    }
+#endif
 
-    return CALL_FUNCTION_WITH_ARGS2(
-        NUITKA_ACCESS_BUILTIN( format ),
-        args
-    );
+    return PyObject_Format( value, format_spec );
 }
 
 
@@ -864,6 +866,368 @@ PyObject *IMPORT_MODULE5( PyObject *module_name, PyObject *globals, PyObject *lo
     return import_result;
 }
 
+// The "__import__" built-in as provided by Python, only with it the result
+// of an import can be predicted from "sys.modules".
+static PyObject *builtin_import_function = NULL;
+
+static bool isBuiltinImportFunction( PyObject *import_function )
+{
+    if ( import_function == builtin_import_function )
+    {
+        return import_function != NULL;
+    }
+
+    if ( builtin_import_function == NULL &&
+         PyCFunction_Check( import_function ) &&
+         strcmp( ((PyCFunctionObject *)import_function)->m_ml->ml_name, "__import__" ) == 0 )
+    {
+        builtin_import_function = import_function;
+        Py_INCREF( builtin_import_function );
+
+        return true;
+    }
+
+    return false;
+}
+
+#if PYTHON_VERSION >= 340
+extern PyObject *const_str_plain___spec__;
+extern PyObject *const_str_plain__initializing;
+
+static bool isModuleInitializing( PyObject *module )
+{
+    PyObject *spec = PyObject_GetAttr( module, const_str_plain___spec__ );
+
+    if ( spec == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    PyObject *initializing = PyObject_GetAttr( spec, const_str_plain__initializing );
+    Py_DECREF( spec );
+
+    if ( initializing == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    int res = CHECK_IF_TRUE( initializing );
+    Py_DECREF( initializing );
+
+    if ( res == -1 )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return true;
+    }
+
+    return res == 1;
+}
+#endif
+
+// For imports without a fromlist, the name of the top level package, that is
+// the result of the import, or NULL if the name is not dotted.
+static PyObject *getImportTopLevelName( PyObject *module_name, PyObject *import_items )
+{
+    if ( import_items != NULL && import_items != Py_None )
+    {
+        int res = CHECK_IF_TRUE( import_items );
+
+        if ( res == -1 )
+        {
+            CLEAR_ERROR_OCCURRED();
+            return NULL;
+        }
+
+        if ( res == 1 )
+        {
+            return NULL;
+        }
+    }
+
+    PyObject *parts = PyObject_CallMethod( module_name, (char *)"partition", (char *)"s", "." );
+
+    if ( parts == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+
+    if ( PyTuple_Check( parts ) && PyTuple_GET_SIZE( parts ) == 3 && CHECK_IF_TRUE( PyTuple_GET_ITEM( parts, 1 ) ) == 1 )
+    {
+        result = PyTuple_GET_ITEM( parts, 0 );
+        Py_INCREF( result );
+    }
+
+    Py_DECREF( parts );
+
+    return result;
+}
+
+PyObject *IMPORT_MODULE_CACHED( struct Nuitka_ImportCache *cache, PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level )
+{
+    CHECK_OBJECT( module_name );
+
+    NUITKA_ASSIGN_BUILTIN( __import__ );
+
+    bool cachable = isBuiltinImportFunction( NUITKA_ACCESS_BUILTIN( __import__ ) );
+
+    PyObject *modules_dict = PyImport_GetModuleDict();
+
+    if ( cache->module != NULL )
+    {
+        // The import gives the same result again, if the module is still the
+        // one in "sys.modules", and so is the top level package it gave.
+        if ( cachable &&
+             PyDict_GetItem( modules_dict, module_name ) == cache->module &&
+             ( cache->top_level_name == NULL || PyDict_GetItem( modules_dict, cache->top_level_name ) == cache->result ) )
+        {
+            CHECK_OBJECT( cache->result );
+
+            Py_INCREF( cache->result );
+            return cache->result;
+        }
+
+        Py_CLEAR( cache->module );
+        Py_CLEAR( cache->result );
+        Py_CLEAR( cache->top_level_name );
+    }
+
+    PyObject *import_result = IMPORT_MODULE5( module_name, globals, locals, import_items, level );
+
+    if ( cachable && import_result != NULL )
+    {
+        PyObject *module = PyDict_GetItem( modules_dict, module_name );
+
+        // Modules still being imported, e.g. by another thread, must go
+        // through the import again, so the import lock is respected.
+#if PYTHON_VERSION >= 340
+        if ( module != NULL && !isModuleInitializing( module ) )
+#else
+        if ( module != NULL )
+#endif
+        {
+            PyObject *top_level_name = getImportTopLevelName( module_name, import_items );
+
+            if ( top_level_name == NULL || PyDict_GetItem( modules_dict, top_level_name ) == import_result )
+            {
+                cache->module = module;
+                Py_INCREF( module );
+
+                cache->result = import_result;
+                Py_INCREF( import_result );
+
+                cache->top_level_name = top_level_name;
+            }
+            else
+            {
+                Py_DECREF( top_level_name );
+            }
+        }
+    }
+
+    return import_result;
+}
+
+// Lazy modules stand in for a module until an attribute of it is used, and
+// only then the import is done.
+struct Nuitka_LazyModuleObject {
+    PyObject_HEAD
+
+    PyObject *module_name;
+    PyObject *globals;
+    PyObject *locals;
+    PyObject *import_items;
+    PyObject *level;
+
+    // The variable in globals that the import gets bound to.
+    PyObject *variable_name;
+
+    // The import result, once it was done.
+    PyObject *module;
+};
+
+static void Nuitka_LazyModule_tp_dealloc( struct Nuitka_LazyModuleObject *lazy_module )
+{
+    Nuitka_GC_UnTrack( (PyObject *)lazy_module );
+
+    Py_DECREF( lazy_module->module_name );
+    Py_DECREF( lazy_module->globals );
+    Py_DECREF( lazy_module->locals );
+    Py_DECREF( lazy_module->import_items );
+    Py_XDECREF( lazy_module->level );
+    Py_DECREF( lazy_module->variable_name );
+    Py_XDECREF( lazy_module->module );
+
+    PyObject_GC_Del( lazy_module );
+}
+
+// The globals refer to the lazy module as long as it was not used, and it
+// refers to them, so the module dictionary is in a cycle with it.
+static int Nuitka_LazyModule_tp_traverse( struct Nuitka_LazyModuleObject *lazy_module, visitproc visit, void *arg )
+{
+    Py_VISIT( lazy_module->globals );
+    Py_VISIT( lazy_module->locals );
+    Py_VISIT( lazy_module->import_items );
+    Py_VISIT( lazy_module->module );
+
+    return 0;
+}
+
+static PyObject *Nuitka_LazyModule_Load( struct Nuitka_LazyModuleObject *lazy_module )
+{
+    if ( lazy_module->module == NULL )
+    {
+        PyObject *module = IMPORT_MODULE_KW(
+            lazy_module->module_name,
+            lazy_module->globals,
+            lazy_module->locals,
+            lazy_module->import_items,
+            lazy_module->level
+        );
+
+        if (unlikely( module == NULL ))
+        {
+            return NULL;
+        }
+
+        // Another use may have done it meanwhile.
+        if ( lazy_module->module != NULL )
+        {
+            Py_DECREF( module );
+            return lazy_module->module;
+        }
+
+        lazy_module->module = module;
+
+        // Bind the module itself, so later uses need not go through us.
+        if ( PyDict_GetItem( lazy_module->globals, lazy_module->variable_name ) == (PyObject *)lazy_module )
+        {
+            int res = PyDict_SetItem( lazy_module->globals, lazy_module->variable_name, module );
+
+            if (unlikely( res == -1 ))
+            {
+                return NULL;
+            }
+        }
+    }
+
+    return lazy_module->module;
+}
+
+static PyObject *Nuitka_LazyModule_tp_getattro( struct Nuitka_LazyModuleObject *lazy_module, PyObject *attr_name )
+{
+    PyObject *module = Nuitka_LazyModule_Load( lazy_module );
+
+    if (unlikely( module == NULL ))
+    {
+        return NULL;
+    }
+
+    return PyObject_GetAttr( module, attr_name );
+}
+
+static int Nuitka_LazyModule_tp_setattro( struct Nuitka_LazyModuleObject *lazy_module, PyObject *attr_name, PyObject *value )
+{
+    PyObject *module = Nuitka_LazyModule_Load( lazy_module );
+
+    if (unlikely( module == NULL ))
+    {
+        return -1;
+    }
+
+    return PyObject_SetAttr( module, attr_name, value );
+}
+
+static PyObject *Nuitka_LazyModule_tp_repr( struct Nuitka_LazyModuleObject *lazy_module )
+{
+    PyObject *module = Nuitka_LazyModule_Load( lazy_module );
+
+    if (unlikely( module == NULL ))
+    {
+        return NULL;
+    }
+
+    return PyObject_Repr( module );
+}
+
+static PyTypeObject Nuitka_LazyModule_Type =
+{
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "compiled_lazy_module",                      // tp_name
+    sizeof(struct Nuitka_LazyModuleObject),      // tp_basicsize
+    0,                                           // tp_itemsize
+    (destructor)Nuitka_LazyModule_tp_dealloc,    // tp_dealloc
+    0,                                           // tp_print
+    0,                                           // tp_getattr
+    0,                                           // tp_setattr
+    0,                                           // tp_compare
+    (reprfunc)Nuitka_LazyModule_tp_repr,         // tp_repr
+    0,                                           // tp_as_number
+    0,                                           // tp_as_sequence
+    0,                                           // tp_as_mapping
+    0,                                           // tp_hash
+    0,                                           // tp_call
+    0,                                           // tp_str
+    (getattrofunc)Nuitka_LazyModule_tp_getattro, // tp_getattro
+    (setattrofunc)Nuitka_LazyModule_tp_setattro, // tp_setattro
+    0,                                           // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,     // tp_flags
+    0,                                           // tp_doc
+    (traverseproc)Nuitka_LazyModule_tp_traverse, // tp_traverse
+};
+
+PyObject *IMPORT_MODULE_LAZY( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level, PyObject *variable_name )
+{
+    CHECK_OBJECT( module_name );
+    CHECK_OBJECT( globals );
+    CHECK_OBJECT( locals );
+    CHECK_OBJECT( import_items );
+    if ( level ) CHECK_OBJECT( level );
+    CHECK_OBJECT( variable_name );
+
+    static bool init_done = false;
+
+    if ( init_done == false )
+    {
+        if (unlikely( PyType_Ready( &Nuitka_LazyModule_Type ) == -1 ))
+        {
+            return NULL;
+        }
+
+        init_done = true;
+    }
+
+    struct Nuitka_LazyModuleObject *result = PyObject_GC_New( struct Nuitka_LazyModuleObject, &Nuitka_LazyModule_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    result->module_name = module_name;
+    Py_INCREF( module_name );
+    result->globals = globals;
+    Py_INCREF( globals );
+    result->locals = locals;
+    Py_INCREF( locals );
+    result->import_items = import_items;
+    Py_INCREF( import_items );
+    result->level = level;
+    Py_XINCREF( level );
+    result->variable_name = variable_name;
+    Py_INCREF( variable_name );
+
+    result->module = NULL;
+
+    Nuitka_GC_Track( result );
+
+    return (PyObject *)result;
+}
+
 extern PyObject *const_str_plain___all__;
 
 bool IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module )
@@ -1885,6 +2249,277 @@ PyObject *BUILTIN_ISINSTANCE( PyObject *inst, PyObject *cls )
     return BOOL_FROM( res != 0 );
 }
 
+static void Nuitka_DictItemsIterator_tp_dealloc( struct Nuitka_DictItemsIteratorObject *dict_iterator )
+{
+    Py_XDECREF( dict_iterator->m_dict );
+    Py_XDECREF( dict_iterator->m_iterator );
+    Py_XDECREF( dict_iterator->m_value );
+
+    PyObject_Del( dict_iterator );
+}
+
+static PyTypeObject Nuitka_DictItemsIterator_Type =
+{
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "compiled_dict_items_iterator",                // tp_name
+    sizeof(struct Nuitka_DictItemsIteratorObject), // tp_basicsize
+    0,                                             // tp_itemsize
+    (destructor)Nuitka_DictItemsIterator_tp_dealloc, // tp_dealloc
+    0,                                             // tp_print
+    0,                                             // tp_getattr
+    0,                                             // tp_setattr
+    0,                                             // tp_compare
+    0,                                             // tp_repr
+    0,                                             // tp_as_number
+    0,                                             // tp_as_sequence
+    0,                                             // tp_as_mapping
+    0,                                             // tp_hash
+    0,                                             // tp_call
+    0,                                             // tp_str
+    0,                                             // tp_getattro
+    0,                                             // tp_setattro
+    0,                                             // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                            // tp_flags
+};
+
+PyObject *MAKE_DICT_ITEMS_ITERATOR( PyObject *source, PyObject *method_name )
+{
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( method_name );
+
+    static bool init_done = false;
+
+    if ( init_done == false )
+    {
+        if (unlikely( PyType_Ready( &Nuitka_DictItemsIterator_Type ) == -1 ))
+        {
+            return NULL;
+        }
+
+        init_done = true;
+    }
+
+    PyObject *iterator = NULL;
+
+    // Other objects, including dictionary sub-classes, get their method
+    // called, and the result iterated.
+    if ( !PyDict_CheckExact( source ) )
+    {
+        PyObject *items = CALL_METHOD_NO_ARGS( source, method_name );
+
+        if (unlikely( items == NULL ))
+        {
+            return NULL;
+        }
+
+        iterator = MAKE_ITERATOR( items );
+        Py_DECREF( items );
+
+        if (unlikely( iterator == NULL ))
+        {
+            return NULL;
+        }
+    }
+
+    struct Nuitka_DictItemsIteratorObject *result = PyObject_New( struct Nuitka_DictItemsIteratorObject, &Nuitka_DictItemsIterator_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        Py_XDECREF( iterator );
+        return NULL;
+    }
+
+    if ( iterator == NULL )
+    {
+        result->m_dict = source;
+        Py_INCREF( source );
+        result->m_used = ((PyDictObject *)source)->ma_used;
+    }
+    else
+    {
+        result->m_dict = NULL;
+        result->m_used = 0;
+    }
+
+    result->m_pos = 0;
+    result->m_iterator = iterator;
+    result->m_value = NULL;
+
+    return (PyObject *)result;
+}
+
+PyObject *_DICT_ITEMS_ITERATOR_NEXT_GENERIC( struct Nuitka_DictItemsIteratorObject *dict_iterator )
+{
+    PyObject *item = ITERATOR_NEXT( dict_iterator->m_iterator );
+
+    if ( item == NULL )
+    {
+        return NULL;
+    }
+
+    PyObject *key, *value;
+
+    if ( PyTuple_CheckExact( item ) && PyTuple_GET_SIZE( item ) == 2 )
+    {
+        key = PyTuple_GET_ITEM( item, 0 );
+        value = PyTuple_GET_ITEM( item, 1 );
+
+        Py_INCREF( key );
+        Py_INCREF( value );
+
+        Py_DECREF( item );
+    }
+    else
+    {
+        // Unpacking with the same errors as for the tuple assignment.
+        PyObject *unpack_iterator = MAKE_ITERATOR( item );
+        Py_DECREF( item );
+
+        if (unlikely( unpack_iterator == NULL ))
+        {
+            return NULL;
+        }
+
+#if PYTHON_VERSION < 350
+        key = UNPACK_NEXT( unpack_iterator, 0 );
+#else
+        key = UNPACK_NEXT( unpack_iterator, 0, 2 );
+#endif
+
+        if (unlikely( key == NULL ))
+        {
+            Py_DECREF( unpack_iterator );
+            return NULL;
+        }
+
+#if PYTHON_VERSION < 350
+        value = UNPACK_NEXT( unpack_iterator, 1 );
+#else
+        value = UNPACK_NEXT( unpack_iterator, 1, 2 );
+#endif
+
+        if (unlikely( value == NULL ))
+        {
+            Py_DECREF( key );
+            Py_DECREF( unpack_iterator );
+            return NULL;
+        }
+
+        PyObject *attempt = (*Py_TYPE( unpack_iterator )->tp_iternext)( unpack_iterator );
+        Py_DECREF( unpack_iterator );
+
+        if (likely( attempt == NULL ))
+        {
+            PyObject *error = GET_ERROR_OCCURRED();
+
+            if ( error != NULL )
+            {
+                if ( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) )
+                {
+                    CLEAR_ERROR_OCCURRED();
+                }
+                else
+                {
+                    Py_DECREF( key );
+                    Py_DECREF( value );
+                    return NULL;
+                }
+            }
+        }
+        else
+        {
+            Py_DECREF( attempt );
+            Py_DECREF( key );
+            Py_DECREF( value );
+
+#if PYTHON_VERSION < 300
+            PyErr_Format( PyExc_ValueError, "too many values to unpack" );
+#else
+            PyErr_Format( PyExc_ValueError, "too many values to unpack (expected 2)" );
+#endif
+            return NULL;
+        }
+    }
+
+    dict_iterator->m_value = value;
+
+    return key;
+}
+
+static void Nuitka_LoopIterator_tp_dealloc( struct Nuitka_LoopIteratorObject *loop_iterator )
+{
+    Py_XDECREF( loop_iterator->m_sequence );
+
+    PyObject_Del( loop_iterator );
+}
+
+static PyObject *Nuitka_LoopIterator_tp_iternext( PyObject *loop_iterator )
+{
+    return LOOP_ITERATOR_NEXT( loop_iterator );
+}
+
+PyTypeObject Nuitka_LoopIterator_Type =
+{
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "compiled_loop_iterator",                      // tp_name
+    sizeof(struct Nuitka_LoopIteratorObject),      // tp_basicsize
+    0,                                             // tp_itemsize
+    (destructor)Nuitka_LoopIterator_tp_dealloc,    // tp_dealloc
+    0,                                             // tp_print
+    0,                                             // tp_getattr
+    0,                                             // tp_setattr
+    0,                                             // tp_compare
+    0,                                             // tp_repr
+    0,                                             // tp_as_number
+    0,                                             // tp_as_sequence
+    0,                                             // tp_as_mapping
+    0,                                             // tp_hash
+    0,                                             // tp_call
+    0,                                             // tp_str
+    0,                                             // tp_getattro
+    0,                                             // tp_setattro
+    0,                                             // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                            // tp_flags
+    0,                                             // tp_doc
+    0,                                             // tp_traverse
+    0,                                             // tp_clear
+    0,                                             // tp_richcompare
+    0,                                             // tp_weaklistoffset
+    PyObject_SelfIter,                             // tp_iter
+    Nuitka_LoopIterator_tp_iternext,               // tp_iternext
+};
+
+PyObject *MAKE_SEQUENCE_LOOP_ITERATOR( PyObject *sequence )
+{
+    CHECK_OBJECT( sequence );
+    assert( PyList_CheckExact( sequence ) || PyTuple_CheckExact( sequence ) );
+
+    static bool init_done = false;
+
+    if ( init_done == false )
+    {
+        if (unlikely( PyType_Ready( &Nuitka_LoopIterator_Type ) == -1 ))
+        {
+            return NULL;
+        }
+
+        init_done = true;
+    }
+
+    struct Nuitka_LoopIteratorObject *result = PyObject_New( struct Nuitka_LoopIteratorObject, &Nuitka_LoopIterator_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    result->m_sequence = sequence;
+    Py_INCREF( sequence );
+    result->m_index = 0;
+
+    return (PyObject *)result;
+}
+
 
 #define ITERATOR_GENERIC 0
 #define ITERATOR_COMPILED_GENERATOR 1
@@ -3533,3 +4168,7 @@ PyObject *MY_RICHCOMPARE_NORECURSE( PyObject *a, PyObject *b, int op )
 #include "HelpersProfiling.c"
 #endif
 
+#if _NUITKA_INSTRUMENTATION
+#include "HelpersInstrumentation.c"
+#endif
+
@@ -165,7 +165,12 @@ static PyObject *Nuitka_Frame_getlocals( struct Nuitka_FrameObject *frame, void
                 case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
                 {
                     PyObject *value = *(PyObject **)t;
-                    PyDict_SetItem( result, *varnames, value );
+
+                    // Unassigned variables are not in the locals.
+                    if ( value != NULL )
+                    {
+                        PyDict_SetItem( result, *varnames, value );
+                    }
 
                     t += sizeof(value);
 
@@ -174,7 +179,12 @@ static PyObject *Nuitka_Frame_getlocals( struct Nuitka_FrameObject *frame, void
                 case NUITKA_TYPE_DESCRIPTION_CELL:
                 {
                     struct Nuitka_CellObject *value = *(struct Nuitka_CellObject **)t;
-                    PyDict_SetItem( result, *varnames, value->ob_ref );
+
+                    if ( value->ob_ref != NULL )
+                    {
+                        PyDict_SetItem( result, *varnames, value->ob_ref );
+                    }
+
                     t += sizeof(value);
 
                     break;
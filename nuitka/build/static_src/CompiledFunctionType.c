@@ -1205,14 +1205,61 @@ static void formatErrorTooFewKwOnlyArguments( struct Nuitka_FunctionObject const
 #endif
 
 
+// Find the parameter index for a keyword argument name, or -1 if there is no
+// such parameter. The parameter names are interned, and so are typically the
+// keyword names used at call sites, so pointer comparison is tried for all of
+// them first. Only then the cached hash values of exact strings are compared,
+// and the rich comparison is done only for candidates with matching hash.
+static Py_ssize_t findKeywordParameterIndex( struct Nuitka_FunctionObject const *function, PyObject *key )
+{
+    PyObject **varnames = function->m_varnames;
+    Py_ssize_t keywords_count = function->m_args_keywords_count;
+
+    for( Py_ssize_t i = 0; i < keywords_count; i++ )
+    {
+        if ( varnames[ i ] == key )
+        {
+            return i;
+        }
+    }
+
+    if ( Nuitka_String_CheckExact( key ) )
+    {
+        Py_hash_t key_hash = PyObject_Hash( key );
+
+        for( Py_ssize_t i = 0; i < keywords_count; i++ )
+        {
+            if ( PyObject_Hash( varnames[ i ] ) != key_hash )
+            {
+                continue;
+            }
+
+            if ( RICH_COMPARE_BOOL_EQ_NORECURSE( varnames[ i ], key ) )
+            {
+                return i;
+            }
+        }
+    }
+    else
+    {
+        for( Py_ssize_t i = 0; i < keywords_count; i++ )
+        {
+            if ( RICH_COMPARE_BOOL_EQ_NORECURSE( varnames[ i ], key ) )
+            {
+                return i;
+            }
+        }
+    }
+
+    return -1;
+}
+
 #if PYTHON_VERSION < 300
 static Py_ssize_t handleKeywordArgs( struct Nuitka_FunctionObject const *function, PyObject **python_pars, PyObject *kw )
 #else
 static Py_ssize_t handleKeywordArgs( struct Nuitka_FunctionObject const *function, PyObject **python_pars, Py_ssize_t *kw_only_found, PyObject *kw )
 #endif
 {
-    Py_ssize_t keywords_count = function->m_args_keywords_count;
-
 #if PYTHON_VERSION >= 300
     Py_ssize_t keyword_after_index = function->m_args_positional_count;
 #endif
@@ -1239,52 +1286,23 @@ static Py_ssize_t handleKeywordArgs( struct Nuitka_FunctionObject const *functio
             return -1;
         }
 
-        NUITKA_MAY_BE_UNUSED bool found = false;
-
         Py_INCREF( key );
         Py_INCREF( value );
 
-        for( Py_ssize_t i = 0; i < keywords_count; i++ )
-        {
-            if ( function->m_varnames[ i ] == key )
-            {
-                assert( python_pars[ i ] == NULL );
-                python_pars[ i ] = value;
-
-#if PYTHON_VERSION >= 300
-                if ( i >= keyword_after_index )
-                {
-                    *kw_only_found += 1;
-                }
-#endif
+        Py_ssize_t index = findKeywordParameterIndex( function, key );
+        bool found = index != -1;
 
-                found = true;
-                break;
-            }
-        }
-
-        if ( found == false )
+        if ( found )
         {
-            PyObject **varnames = function->m_varnames;
-
-            for( Py_ssize_t i = 0; i < keywords_count; i++ )
-            {
-                if ( RICH_COMPARE_BOOL_EQ_NORECURSE( varnames[ i ], key ) )
-                {
-                    assert( python_pars[ i ] == NULL );
-                    python_pars[ i ] = value;
+            assert( python_pars[ index ] == NULL );
+            python_pars[ index ] = value;
 
 #if PYTHON_VERSION >= 300
-                    if ( i >= keyword_after_index )
-                    {
-                        *kw_only_found += 1;
-                    }
-#endif
-
-                    found = true;
-                    break;
-                }
+            if ( index >= keyword_after_index )
+            {
+                *kw_only_found += 1;
             }
+#endif
         }
 
         if (unlikely( found == false ))
@@ -194,6 +194,12 @@ static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generato
 
             Nuitka_Generator_release_closure( generator );
 
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+            // The local variables were released by the generator code already.
+            PyMem_Free( generator->m_heap_storage );
+            generator->m_heap_storage = NULL;
+#endif
+
 #if PYTHON_VERSION < 300
             if ( saved_exception_type != NULL && saved_exception_type != Py_None )
             {
@@ -632,6 +638,12 @@ static void Nuitka_Generator_tp_dealloc( struct Nuitka_GeneratorObject *generato
 
 #ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     releaseFiber( &generator->m_yielder_context );
+#else
+    if ( generator->m_heap_storage != NULL )
+    {
+        PyMem_Free( generator->m_heap_storage );
+        generator->m_heap_storage = NULL;
+    }
 #endif
 
     // Now it is safe to release references and memory for it.
@@ -923,6 +935,7 @@ PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject
     result->m_yielded = NULL;
 #else
     result->m_yield_return_index = 0;
+    result->m_heap_storage = NULL;
 #endif
 
     result->m_frame = NULL;
@@ -1107,6 +1120,8 @@ extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
 
 extern PyObject *const_str_plain_send, *const_str_plain_throw, *const_str_plain_close;
 
+#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+
 static PyObject *_YIELD_FROM( struct Nuitka_GeneratorObject *generator, PyObject *value )
 {
     // This is the value, propagated back and forth the sub-generator and the
@@ -1524,6 +1539,218 @@ PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *genera
     }
 }
 
+#else
+
+PyObject *GENERATOR_YIELD_FROM_ITERATOR( struct Nuitka_GeneratorObject *generator, PyObject *target )
+{
+#if PYTHON_VERSION >= 350
+    if ( PyCoro_CheckExact( target ) || Nuitka_Coroutine_Check( target ))
+    {
+        if (unlikely( (generator->m_code_object->co_flags & CO_ITERABLE_COROUTINE) == 0 ))
+        {
+            PyErr_SetString(
+                PyExc_TypeError,
+                "cannot 'yield from' a coroutine object in a non-coroutine generator"
+            );
+            return NULL;
+        }
+
+        Py_INCREF( target );
+        return target;
+    }
+#endif
+
+    return MAKE_ITERATOR( target );
+}
+
+// One round of what "_YIELD_FROM" does in a loop, the caller returns the value
+// to yield and then resumes the delegation with the value sent.
+static PyObject *_YIELD_FROM_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result )
+{
+    PyObject *retval;
+
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( generator->m_exception_type )
+    {
+        // The yielding generator is being closed, but we also are tasked to
+        // immediately close the currently running sub-generator.
+        if ( EXCEPTION_MATCH_BOOL_SINGLE( generator->m_exception_type, PyExc_GeneratorExit ) )
+        {
+            PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
+
+            if ( close_method )
+            {
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
+
+                if (unlikely( close_value == NULL ))
+                {
+                    *result = NULL;
+                    return NULL;
+                }
+
+                Py_DECREF( close_value );
+            }
+            else
+            {
+                PyObject *error = GET_ERROR_OCCURRED();
+
+                if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
+                {
+                    PyErr_WriteUnraisable( (PyObject *)value );
+                }
+            }
+
+            RAISE_GENERATOR_EXCEPTION( generator );
+
+            *result = NULL;
+            return NULL;
+        }
+
+        PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
+
+        if ( throw_method )
+        {
+            retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
+
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
+        }
+        else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
+        {
+            CLEAR_ERROR_OCCURRED();
+
+            RAISE_GENERATOR_EXCEPTION( generator );
+
+            *result = NULL;
+            return NULL;
+        }
+        else
+        {
+            assert( ERROR_OCCURRED() );
+
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
+
+            *result = NULL;
+            return NULL;
+        }
+    }
+    else if ( PyGen_CheckExact( value ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)value, Py_None );
+    }
+#if PYTHON_VERSION >= 350
+    else if ( PyCoro_CheckExact( value ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)value, Py_None );
+    }
+#endif
+    else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
+    {
+        retval = Py_TYPE( value )->tp_iternext( value );
+    }
+    else
+    {
+        // Bug compatibility here, before 3.3 tuples were unrolled in calls, which is what
+        // PyObject_CallMethod does.
+#if PYTHON_VERSION >= 340
+        retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
+#else
+        retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
+#endif
+    }
+
+    // Check the sub-generator result
+    if ( retval == NULL )
+    {
+        PyObject *error = GET_ERROR_OCCURRED();
+
+        if ( error == NULL )
+        {
+            Py_INCREF( Py_None );
+            *result = Py_None;
+        }
+        // The sub-generator has given an exception. In case of StopIteration,
+        // we need to check the value, as it is going to be the expression
+        // value of this "yield from", and we are done. All other errors, we
+        // need to raise.
+        else if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+        {
+            *result = ERROR_GET_STOP_ITERATION_VALUE();
+        }
+        else
+        {
+            *result = NULL;
+        }
+
+        return NULL;
+    }
+
+#if PYTHON_VERSION >= 350
+    generator->m_yieldfrom = value;
+#endif
+
+    return retval;
+}
+
+PyObject *GENERATOR_YIELD_FROM_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result )
+{
+    if ( send_value != NULL )
+    {
+#if PYTHON_VERSION >= 350
+        generator->m_yieldfrom = NULL;
+#endif
+        Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+    }
+    else
+    {
+        send_value = Py_None;
+    }
+
+    PyObject *retval = _YIELD_FROM_STEP( generator, value, send_value, result );
+
+    if ( retval != NULL )
+    {
+        Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+    }
+
+    return retval;
+}
+
+PyObject *GENERATOR_YIELD_FROM_IN_HANDLER_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result )
+{
+    if ( send_value != NULL )
+    {
+#if PYTHON_VERSION >= 350
+        generator->m_yieldfrom = NULL;
+#endif
+        Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+        SWAP_GENERATOR_FRAME_EXCEPTION();
+    }
+    else
+    {
+        send_value = Py_None;
+    }
+
+    PyObject *retval = _YIELD_FROM_STEP( generator, value, send_value, result );
+
+    if ( retval != NULL )
+    {
+        SWAP_GENERATOR_FRAME_EXCEPTION();
+
+        Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+    }
+
+    return retval;
+}
+
+#endif
+
 #endif
 
 #endif
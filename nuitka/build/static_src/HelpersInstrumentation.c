@@ -0,0 +1,262 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for the instrumentation of compiled functions, it
+ * collects the records of called functions and writes them at exit, without
+ * needing anything from outside.
+ */
+
+#if _NUITKA_INSTRUMENTATION
+
+NUITKA_THREAD_LOCAL struct Nuitka_InstrumentationFrame *current_instrumentation_frame = NULL;
+
+static struct Nuitka_InstrumentationRecord *instrumentation_records = NULL;
+
+void registerInstrumentationRecord( struct Nuitka_InstrumentationRecord *record )
+{
+    record->m_registered = true;
+
+    record->m_next = instrumentation_records;
+    instrumentation_records = record;
+}
+
+#if defined(_WIN32)
+#include <windows.h>
+
+unsigned long long getInstrumentationTime( void )
+{
+    static LARGE_INTEGER frequency;
+
+    if ( frequency.QuadPart == 0 )
+    {
+        QueryPerformanceFrequency( &frequency );
+    }
+
+    LARGE_INTEGER now;
+    QueryPerformanceCounter( &now );
+
+    return (unsigned long long)( now.QuadPart * ( 1000000000.0 / frequency.QuadPart ) );
+}
+#endif
+
+static void writeJsonString( FILE *output, char const *value )
+{
+    fputc( '"', output );
+
+    for( ; *value; value++ )
+    {
+        if ( *value == '"' || *value == '\\' )
+        {
+            fputc( '\\', output );
+            fputc( *value, output );
+        }
+        else if ( (unsigned char)*value < 32 )
+        {
+            fprintf( output, "\\u%04x", *value );
+        }
+        else
+        {
+            fputc( *value, output );
+        }
+    }
+
+    fputc( '"', output );
+}
+
+static void dumpInstrumentationJson( char const *filename )
+{
+    FILE *output = fopen( filename, "w" );
+
+    if ( output == NULL )
+    {
+        return;
+    }
+
+    fputs( "[\n", output );
+
+    for( struct Nuitka_InstrumentationRecord *record = instrumentation_records; record != NULL; record = record->m_next )
+    {
+        fputs( "  {\"name\": ", output );
+        writeJsonString( output, record->m_name );
+        fputs( ", \"filename\": ", output );
+        writeJsonString( output, record->m_filename );
+
+        fprintf(
+            output,
+            ", \"line\": %d, \"calls\": %llu, \"primitive_calls\": %llu, \"exceptions\": %llu, \"total_time\": %.9f, \"own_time\": %.9f}%s\n",
+            record->m_line,
+            record->m_calls,
+            record->m_primitive_calls,
+            record->m_exceptions,
+            record->m_total_time / 1e9,
+            record->m_own_time / 1e9,
+            record->m_next != NULL ? "," : ""
+        );
+    }
+
+    fputs( "]\n", output );
+
+    fclose( output );
+}
+
+#if PYTHON_VERSION < 300
+#define INSTRUMENTATION_STRING( value ) PyString_FromString( value )
+#else
+#define INSTRUMENTATION_STRING( value ) PyUnicode_FromString( value )
+#endif
+
+// This is the format written by "cProfile", so "pstats" can load it.
+static void dumpInstrumentationPstats( char const *filename )
+{
+    PyObject *stats = PyDict_New();
+
+    for( struct Nuitka_InstrumentationRecord *record = instrumentation_records; record != NULL; record = record->m_next )
+    {
+        PyObject *key = Py_BuildValue(
+            "(NiN)",
+            INSTRUMENTATION_STRING( record->m_filename ),
+            record->m_line,
+            INSTRUMENTATION_STRING( record->m_name )
+        );
+
+        // Counts as "int" values, like "cProfile" does on Python2 too.
+        PyObject *value = Py_BuildValue(
+            "(nnddN)",
+            (Py_ssize_t)record->m_primitive_calls,
+            (Py_ssize_t)record->m_calls,
+            record->m_own_time / 1e9,
+            record->m_total_time / 1e9,
+            PyDict_New()
+        );
+
+        if ( key == NULL || value == NULL )
+        {
+            Py_XDECREF( key );
+            Py_XDECREF( value );
+            Py_DECREF( stats );
+
+            return;
+        }
+
+        PyDict_SetItem( stats, key, value );
+
+        Py_DECREF( key );
+        Py_DECREF( value );
+    }
+
+    FILE *output = fopen( filename, "wb" );
+
+    if ( output != NULL )
+    {
+        PyMarshal_WriteObjectToFile( stats, output, Py_MARSHAL_VERSION );
+        fclose( output );
+    }
+
+    Py_DECREF( stats );
+}
+
+void dumpInstrumentation( char const *module_name )
+{
+    // Save the current exception, if any, we must preserve it.
+    PyObject *save_exception_type, *save_exception_value;
+    PyTracebackObject *save_exception_tb;
+    FETCH_ERROR_OCCURRED( &save_exception_type, &save_exception_value, &save_exception_tb );
+
+    // Allow to control where the output goes, in case it's used in
+    // production.
+    char const *output = getenv( "NUITKA_INSTRUMENTATION_OUTPUT" );
+
+    if ( output == NULL )
+    {
+        output = "nuitka-instrumentation";
+    }
+
+    // Every extension module has records of its own, these must not
+    // overwrite each other.
+    char output_base[4096];
+
+    if ( module_name != NULL )
+    {
+        snprintf( output_base, sizeof( output_base ), "%s-%s", output, module_name );
+    }
+    else
+    {
+        snprintf( output_base, sizeof( output_base ), "%s", output );
+    }
+
+    char filename[4096 + 16];
+
+    snprintf( filename, sizeof( filename ), "%s.json", output_base );
+    dumpInstrumentationJson( filename );
+
+    snprintf( filename, sizeof( filename ), "%s.pstats", output_base );
+    dumpInstrumentationPstats( filename );
+
+    CLEAR_ERROR_OCCURRED();
+
+    RESTORE_ERROR_OCCURRED( save_exception_type, save_exception_value, save_exception_tb );
+}
+
+#ifdef _NUITKA_MODULE
+
+static char const *instrumentation_module_name;
+
+static PyObject *_dumpInstrumentationAtExit( PyObject *self, PyObject *args )
+{
+    dumpInstrumentation( instrumentation_module_name );
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
+static PyMethodDef _method_def_dump_instrumentation =
+{
+    "dumpInstrumentation",
+    (PyCFunction)_dumpInstrumentationAtExit,
+    METH_NOARGS,
+    NULL
+};
+
+void registerInstrumentationDump( char const *module_name )
+{
+    instrumentation_module_name = module_name;
+
+    PyObject *atexit_module = PyImport_ImportModule( "atexit" );
+
+    if ( atexit_module == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return;
+    }
+
+    PyObject *dump_function = PyCFunction_New( &_method_def_dump_instrumentation, NULL );
+    PyObject *result = PyObject_CallMethod( atexit_module, (char *)"register", (char *)"O", dump_function );
+
+    if ( result == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+    }
+
+    Py_XDECREF( result );
+    Py_DECREF( dump_function );
+    Py_DECREF( atexit_module );
+}
+
+#endif
+
+#endif
@@ -492,6 +492,10 @@ int main( int argc, char **argv )
     stopProfiling();
 #endif
 
+#if _NUITKA_INSTRUMENTATION
+    dumpInstrumentation( NULL );
+#endif
+
 #ifndef __NUITKA_NO_ASSERT__
     checkGlobalConstants();
 
@@ -21,9 +21,16 @@ Most the class specific stuff is solved in re-formulation. Only the selection
 of the metaclass remains as specific.
 """
 
+from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
+    long,
+    unicode
+)
 from nuitka.PythonVersions import python_version
 
-from .CodeHelpers import generateChildExpressionsCode
+from .CodeHelpers import (
+    generateChildExpressionsCode,
+    generateExpressionCode
+)
 from .ErrorCodes import getErrorExitCode, getReleaseCode, getReleaseCodes
 from .PythonAPICodes import generateCAPIObjectCode0
 
@@ -120,7 +127,132 @@ def generateBuiltinSuperCode(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def _getBuiltinTypeCheckCodes():
+    # Built-in types have no "__instancecheck__" of their own, so these
+    # checks, that include sub-classes, are exact.
+    result = {
+        float     : "PyFloat_Check( %s )",
+        complex   : "PyComplex_Check( %s )",
+        bool      : "PyBool_Check( %s )",
+        list      : "PyList_Check( %s )",
+        tuple     : "PyTuple_Check( %s )",
+        dict      : "PyDict_Check( %s )",
+        set       : "PySet_Check( %s )",
+        frozenset : "PyFrozenSet_Check( %s )",
+        bytearray : "PyByteArray_Check( %s )",
+        slice     : "PySlice_Check( %s )",
+        type      : "PyType_Check( %s )",
+    }
+
+    if python_version < 300:
+        result[int] = "PyInt_Check( %s )"
+        result[long] = "PyLong_Check( %s )"
+        result[str] = "PyString_Check( %s )"
+        result[unicode] = "PyUnicode_Check( %s )"
+    else:
+        result[int] = "PyLong_Check( %s )"
+        result[str] = "PyUnicode_Check( %s )"
+        result[bytes] = "PyBytes_Check( %s )"
+
+    return result
+
+_builtin_type_check_codes = _getBuiltinTypeCheckCodes()
+
+
+def getIsinstanceBuiltinTypes(classes):
+    """ Get the built-in types checked for, or None if it's not only those.
+
+    """
+
+    if not classes.isExpressionConstantRef():
+        return None
+
+    result = []
+
+    def addTypes(value):
+        if type(value) is tuple:
+            for element in value:
+                if not addTypes(element):
+                    return False
+
+            return True
+        elif type(value) is type and value in _builtin_type_check_codes:
+            if value not in result:
+                result.append(value)
+
+            return True
+        else:
+            return False
+
+    if not addTypes(classes.getConstant()) or not result:
+        return None
+
+    return result
+
+
+def getIsinstanceBuiltinTypesCheckCode(inst_name, builtin_types):
+    """ Unrolled checks of the types, "__class__" is to be considered only if
+        these fail.
+
+    """
+    return "( %s )" % " || ".join(
+        _builtin_type_check_codes[builtin_type] % inst_name
+        for builtin_type in
+        builtin_types
+    )
+
+
 def generateBuiltinIsinstanceCode(to_name, expression, emit, context):
+    builtin_types = getIsinstanceBuiltinTypes(expression.getCls())
+
+    if builtin_types is not None:
+        inst_name = context.allocateTempName("isinstance_inst")
+        cls_name = context.allocateTempName("isinstance_cls")
+
+        generateExpressionCode(
+            to_name    = inst_name,
+            expression = expression.getInstance(),
+            emit       = emit,
+            context    = context
+        )
+        generateExpressionCode(
+            to_name    = cls_name,
+            expression = expression.getCls(),
+            emit       = emit,
+            context    = context
+        )
+
+        context.setCurrentSourceCodeReference(
+            expression.getCompatibleSourceReference()
+        )
+
+        emit(
+            "%s = %s ? Py_True : BUILTIN_ISINSTANCE_BY_CLASS( %s, %s );" % (
+                to_name,
+                getIsinstanceBuiltinTypesCheckCode(
+                    inst_name     = inst_name,
+                    builtin_types = builtin_types
+                ),
+                inst_name,
+                cls_name
+            )
+        )
+
+        getReleaseCodes(
+            release_names = (inst_name, cls_name),
+            emit          = emit,
+            context       = context
+        )
+
+        getErrorExitCode(
+            check_name  = to_name,
+            needs_check = expression.mayRaiseException(BaseException),
+            emit        = emit,
+            context     = context
+        )
+
+        return
+
     generateCAPIObjectCode0(
         to_name    = to_name,
         capi       = "BUILTIN_ISINSTANCE",
@@ -26,6 +26,7 @@ branches and make a code block out of it. But it doesn't contain any target
 language syntax.
 """
 
+from nuitka import Options
 from nuitka.__past__ import iterItems
 
 from . import Contexts, Emission
@@ -105,6 +106,9 @@ from .DictCodes import (
     generateDictionaryCreationCode,
     generateDictOperationGetCode,
     generateDictOperationInCode,
+    generateDictOperationItemsIterCode,
+    generateDictOperationItemsIterNextKeyCode,
+    generateDictOperationItemsIterValueCode,
     generateDictOperationRemoveCode,
     generateDictOperationSetCode,
     generateDictOperationUpdateCode
@@ -174,8 +178,12 @@ from .ListCodes import (
     generateBuiltinListCode,
     generateListCreationCode,
     generateListOperationAppendCode,
+    generateListOperationAppendExpressionCode,
     generateListOperationExtendCode,
-    generateListOperationPopCode
+    generateListOperationGetCode,
+    generateListOperationLenCode,
+    generateListOperationPopCode,
+    generateListOperationSetCode
 )
 from .LoaderCodes import getMetapathLoaderBodyCode
 from .LoopCodes import (
@@ -187,6 +195,7 @@ from .ModuleCodes import (
     generateModuleFileAttributeCode,
     generateModuleLoaderRefCode,
     getModuleCode,
+    getModuleSplitCodes,
     getModuleValues
 )
 from .OperationCodes import (
@@ -390,6 +399,67 @@ def _generateFunctionDeclCode(function_body, context):
         return None
 
 
+def _getFunctionCodeParts(function_body_codes, helper_codes, split_size):
+    """ Combine function codes into one part per C file of the module.
+
+        The first part goes into the module file itself, only for modules
+        with more than "split_size" of function code, more parts are made.
+        The maker of a function goes with its body, as that is local to
+        the file.
+    """
+    total_size = sum(
+        len(code)
+        for _identifier, code in function_body_codes
+    )
+    total_size += sum(
+        len(code)
+        for code in helper_codes.values()
+    )
+
+    if not split_size or total_size <= split_size:
+        codes = [
+            code
+            for _identifier, code in function_body_codes
+        ]
+
+        for _identifier, code in sorted(iterItems(helper_codes)):
+            codes.append(code)
+
+        return ["\n\n".join(codes)]
+
+    units = []
+    paired = set()
+
+    for identifier, code in function_body_codes:
+        if identifier in helper_codes:
+            code += "\n\n" + helper_codes[identifier]
+            paired.add(identifier)
+
+        units.append(code)
+
+    for identifier, code in sorted(iterItems(helper_codes)):
+        if identifier not in paired:
+            units.append(code)
+
+    parts = []
+    part = []
+    part_size = 0
+
+    for code in units:
+        if part and part_size + len(code) > split_size:
+            parts.append("\n\n".join(part))
+
+            part = []
+            part_size = 0
+
+        part.append(code)
+        part_size += len(code)
+
+    parts.append("\n\n".join(part))
+
+    return parts
+
+
 def prepareModuleCode(global_context, module, module_name):
     # As this not only creates all modules, but also functions, it deals
     # also with its functions.
@@ -428,7 +498,9 @@ def prepareModuleCode(global_context, module, module_name):
 
         assert type(function_code) is str, type(function_code)
 
-        function_body_codes.append(function_code)
+        function_body_codes.append(
+            (function_body.getCodeName(), function_code)
+        )
 
         function_decl = _generateFunctionDeclCode(
             function_body = function_body,
@@ -459,26 +531,29 @@ def prepareModuleCode(global_context, module, module_name):
 
         function_decl_codes.append(function_decl)
 
-    for _identifier, code in sorted(iterItems(context.getHelperCodes())):
-        function_body_codes.append(code)
-
     for _identifier, code in sorted(iterItems(context.getDeclarations())):
         function_decl_codes.append(code)
 
-    function_body_codes = "\n\n".join(function_body_codes)
+    function_body_codes = _getFunctionCodeParts(
+        function_body_codes = function_body_codes,
+        helper_codes        = context.getHelperCodes(),
+        split_size          = Options.getSplitModuleSize()
+    )
+
     function_decl_codes = "\n\n".join(function_decl_codes)
 
     template_values = getModuleValues(
-        module_name         = module_name,
-        module_identifier   = module.getCodeName(),
-        codes               = codes.codes,
-        function_decl_codes = function_decl_codes,
-        function_body_codes = function_body_codes,
-        temp_variables      = module.getTempVariables(),
-        outline_variables   = module.getOutlineLocalVariables(),
-        is_main_module      = module.isMainModule(),
-        is_internal_module  = module.isInternalModule(),
-        context             = context
+        module_name          = module_name,
+        module_identifier    = module.getCodeName(),
+        codes                = codes.codes,
+        function_decl_codes  = function_decl_codes,
+        function_body_codes  = function_body_codes[0],
+        function_split_codes = function_body_codes[1:],
+        temp_variables       = module.getTempVariables(),
+        outline_variables    = module.getOutlineLocalVariables(),
+        is_main_module       = module.isMainModule(),
+        is_internal_module   = module.isInternalModule(),
+        context              = context
     )
 
     return template_values, context
@@ -491,6 +566,14 @@ def generateModuleCode(module_context, template_values):
     )
 
 
+def generateModuleSplitCodes(module_context, template_values, header_name):
+    return getModuleSplitCodes(
+        module_context  = module_context,
+        template_values = template_values,
+        header_name     = header_name
+    )
+
+
 def generateHelpersCode(other_modules):
     calls_decl_code = getCallsDecls()
 
@@ -612,13 +695,19 @@ setExpressionDispatchDict(
         "EXPRESSION_COMPARISON_EXCEPTION_MATCH"     : generateComparisonExpressionCode,
         "EXPRESSION_DICT_OPERATION_GET"             : generateDictOperationGetCode,
         "EXPRESSION_DICT_OPERATION_IN"              : generateDictOperationInCode,
+        "EXPRESSION_DICT_OPERATION_ITEMS_ITER"      : generateDictOperationItemsIterCode,
+        "EXPRESSION_DICT_OPERATION_ITEMS_ITER_NEXT_KEY" : generateDictOperationItemsIterNextKeyCode,
+        "EXPRESSION_DICT_OPERATION_ITEMS_ITER_VALUE" : generateDictOperationItemsIterValueCode,
         "EXPRESSION_DICT_OPERATION_NOT_IN"          : generateDictOperationInCode,
         "EXPRESSION_FUNCTION_CREATION"              : generateFunctionCreationCode,
         "EXPRESSION_FUNCTION_CALL"                  : generateFunctionCallCode,
         "EXPRESSION_IMPORT_MODULE_HARD"             : generateImportModuleHardCode,
         "EXPRESSION_IMPORT_MODULE_NAME_HARD"        : generateImportModuleNameHardCode,
         "EXPRESSION_IMPORT_NAME"                    : generateImportNameCode,
+        "EXPRESSION_LIST_OPERATION_APPEND"          : generateListOperationAppendExpressionCode,
         "EXPRESSION_LIST_OPERATION_EXTEND"          : generateListOperationExtendCode,
+        "EXPRESSION_LIST_OPERATION_GET"             : generateListOperationGetCode,
+        "EXPRESSION_LIST_OPERATION_LEN"             : generateListOperationLenCode,
         "EXPRESSION_LIST_OPERATION_POP"             : generateListOperationPopCode,
         "EXPRESSION_MODULE_FILE_ATTRIBUTE_REF"      : generateModuleFileAttributeCode,
         "EXPRESSION_MODULE_LOADER_REF"              : generateModuleLoaderRefCode,
@@ -691,6 +780,7 @@ setStatementDispatchDict(
         "STATEMENT_PRINT_NEWLINE"            : generatePrintNewlineCode,
         "STATEMENT_IMPORT_STAR"              : generateImportStarCode,
         "STATEMENT_LIST_OPERATION_APPEND"    : generateListOperationAppendCode,
+        "STATEMENT_LIST_OPERATION_SET"       : generateListOperationSetCode,
         "STATEMENT_SET_OPERATION_ADD"        : generateSetOperationAddCode,
         "STATEMENT_DICT_OPERATION_SET"       : generateDictOperationSetCode,
         "STATEMENT_LOOP"                     : generateLoopCode,
@@ -22,6 +22,7 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 """
 
 from . import OperatorCodes
+from .ClassCodes import getIsinstanceBuiltinTypesCheckCode
 from .CodeHelpers import generateExpressionCode
 from .ErrorCodes import (
     getErrorExitBoolCode,
@@ -31,6 +32,31 @@ from .ErrorCodes import (
 )
 from .LabelCodes import getBranchingCode
 
+# Operand type names, for which specialized rich comparison helpers exist.
+_rich_comparison_type_codes = {
+    "int"   : "INT",
+    "float" : "FLOAT",
+    "str"   : "STR"
+}
+
+
+def getRichComparisonTypeCode(left, right):
+    """ Specialized rich comparison helper to use for the operands, if any.
+
+        One operand type being known is enough, the helpers check the other
+        one at run time, and use the generic code if it is different.
+    """
+
+    left_type_name = left.getTypeShape().getTypeName()
+    right_type_name = right.getTypeShape().getTypeName()
+
+    if left_type_name is None:
+        left_type_name = right_type_name
+    elif right_type_name is not None and right_type_name != left_type_name:
+        return None
+
+    return _rich_comparison_type_codes.get(left_type_name)
+
 
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     left_name = context.allocateTempName("compexpr_left")
@@ -89,6 +115,11 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
     elif comparator in OperatorCodes.rich_comparison_codes:
         needs_check = expression.mayRaiseExceptionBool(BaseException)
 
+        type_code = getRichComparisonTypeCode(
+            left  = expression.getLeft(),
+            right = expression.getRight()
+        )
+
         helper = "RICH_COMPARE_%s" % (
             OperatorCodes.rich_comparison_codes[ comparator ]
         )
@@ -96,6 +127,9 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         if not context.mayRecurse() and comparator == "Eq":
             helper += "_NORECURSE"
 
+        if type_code is not None:
+            helper += "_" + type_code
+
         emit(
             "%s = %s( %s, %s );" % (
                 to_name,
@@ -180,8 +214,8 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         assert False, comparator
 
 
-def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_check,
-                                    emit, context):
+def getComparisonExpressionBoolCode(comparator, left_name, right_name, type_code,
+                                    needs_check, emit, context):
     if comparator in OperatorCodes.normal_comparison_codes:
         operator_res_name = context.allocateTempName("cmp_" + comparator, "int")
 
@@ -211,6 +245,9 @@ def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_che
         if not context.mayRecurse() and comparator == "Eq":
             helper += "_NORECURSE"
 
+        if type_code is not None:
+            helper += "_" + type_code
+
         emit(
              "%s = RICH_COMPARE_BOOL_%s( %s, %s );" % (
                 operator_res_name,
@@ -292,16 +329,30 @@ def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_che
     getBranchingCode(condition, emit, context)
 
 
-def getBuiltinIsinstanceBoolCode(inst_name, cls_name, emit, context):
+def getBuiltinIsinstanceBoolCode(inst_name, cls_name, builtin_types, emit,
+                                 context):
     res_name = context.getIntResName()
 
-    emit(
-        "%s = Nuitka_IsInstance( %s, %s );" % (
-            res_name,
-            inst_name,
-            cls_name
+    if builtin_types is not None:
+        emit(
+            "%s = %s ? 1 : Nuitka_IsInstanceByClass( %s, %s );" % (
+                res_name,
+                getIsinstanceBuiltinTypesCheckCode(
+                    inst_name     = inst_name,
+                    builtin_types = builtin_types
+                ),
+                inst_name,
+                cls_name
+            )
+        )
+    else:
+        emit(
+            "%s = Nuitka_IsInstance( %s, %s );" % (
+                res_name,
+                inst_name,
+                cls_name
+            )
         )
-    )
 
     getReleaseCodes(
         release_names = (inst_name, cls_name),
@@ -23,10 +23,12 @@ Branches, conditions, truth checks.
 from nuitka import Options
 
 from .AttributeCodes import getAttributeCheckBoolCode
+from .ClassCodes import getIsinstanceBuiltinTypes
 from .CodeHelpers import generateExpressionCode
 from .ComparisonCodes import (
     getBuiltinIsinstanceBoolCode,
-    getComparisonExpressionBoolCode
+    getComparisonExpressionBoolCode,
+    getRichComparisonTypeCode
 )
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitBoolCode, getReleaseCode
@@ -61,6 +63,10 @@ def generateConditionCode(condition, emit, context):
             comparator  = condition.getComparator(),
             left_name   = left_name,
             right_name  = right_name,
+            type_code   = getRichComparisonTypeCode(
+                left  = condition.getLeft(),
+                right = condition.getRight()
+            ),
             needs_check = condition.mayRaiseExceptionBool(BaseException),
             emit        = emit,
             context     = context
@@ -179,10 +185,11 @@ def generateConditionCode(condition, emit, context):
         old_source_ref = context.setCurrentSourceCodeReference(condition.getSourceReference())
 
         getBuiltinIsinstanceBoolCode(
-            inst_name = inst_name,
-            cls_name  = cls_name,
-            emit      = emit,
-            context   = context
+            inst_name     = inst_name,
+            cls_name      = cls_name,
+            builtin_types = getIsinstanceBuiltinTypes(condition.getCls()),
+            emit          = emit,
+            context       = context
         )
 
         context.setCurrentSourceCodeReference(old_source_ref)
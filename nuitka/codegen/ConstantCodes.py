@@ -1010,7 +1010,7 @@ def getConstantInitCodes(module_context):
             continue
 
         if global_context.getConstantUseCount(constant_identifier) == 1:
-            qualifier = "static"
+            qualifier = "NUITKA_LOCAL_MODULE"
 
             constant_value = global_context.constants[constant_identifier]
 
@@ -1044,11 +1044,20 @@ def getConstantInitCodes(module_context):
     return decls, inits.codes, checks.codes
 
 
-def allocateNestedConstants(module_context):
+# Constants needed to create a container constant, by its identifier. These
+# are shared by all modules using that constant.
+_nested_constants = {}
+
+def _getNestedConstants(constant_identifier, constant_value):
     # Lots of types to deal with, pylint: disable=too-many-branches
 
+    if constant_identifier in _nested_constants:
+        return _nested_constants[constant_identifier]
+
+    result = []
+
     def considerForDeferral(constant_value):
-        module_context.getConstantCode(constant_value)
+        result.append(constant_value)
 
         if isMarshalConstant(constant_value):
             return
@@ -1088,15 +1097,29 @@ def allocateNestedConstants(module_context):
                     for value in parts:
                         considerForDeferral(value)
 
+    considerForDeferral(constant_value)
+
+    _nested_constants[constant_identifier] = result
+
+    return result
+
+
+def allocateNestedConstants(module_context):
+    global_context = module_context.global_context
+
     for constant_identifier in set(module_context.getConstants()):
-        constant_value = module_context.global_context.constants[
-            constant_identifier
-        ]
+        constant_value = global_context.constants[constant_identifier]
 
         constant_type = type(constant_value)
 
         if constant_type in (tuple, dict, list, set, frozenset, slice, xrange):
-            considerForDeferral(constant_value)
+            nested_constants = _getNestedConstants(
+                constant_identifier = constant_identifier,
+                constant_value      = constant_value
+            )
+
+            for nested_constant in nested_constants:
+                module_context.getConstantCode(nested_constant)
 
 
 def getConstantsDefinitionCode(context):
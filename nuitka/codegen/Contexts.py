@@ -660,6 +660,12 @@ def _getConstantDefaultPopulation():
             "send"
         )
 
+        # For import caches to detect modules still being imported.
+        result += (
+            "__spec__",
+            "_initializing"
+        )
+
     if python_version >= 330:
         result += (
             # YIELD_FROM uses this
@@ -741,6 +747,11 @@ class PythonGlobalContext(object):
         self.constants = {}
         self.constant_use_count = {}
 
+        # Constant codes by identity of the constant value, so the same value
+        # is named only once. The value is kept alive, so its identity stays
+        # valid.
+        self.constant_codes = {}
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
 
@@ -795,8 +806,15 @@ class PythonGlobalContext(object):
 
                 key = "(PyObject *)&Py%s_Type" % type_name.title()
         else:
+            constant_code = self.constant_codes.get(id(constant))
+
+            if constant_code is not None:
+                return constant_code[1]
+
             key = "const_" + namifyConstant(constant)
 
+            self.constant_codes[id(constant)] = constant, key
+
         if key not in self.constants:
             self.constants[key] = constant
 
@@ -23,7 +23,12 @@ from nuitka import Options
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
-from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
+from .ErrorCodes import (
+    getErrorExitBoolCode,
+    getErrorExitCode,
+    getReleaseCode,
+    getReleaseCodes
+)
 
 
 def generateBuiltinDictCode(to_name, expression, emit, context):
@@ -242,6 +247,94 @@ def generateDictOperationGetCode(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def generateDictOperationItemsIterCode(to_name, expression, emit, context):
+    dict_name, = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit(
+        "%s = MAKE_DICT_ITEMS_ITERATOR( %s, %s );" % (
+            to_name,
+            dict_name,
+            context.getConstantCode(
+                constant = expression.getMethodName()
+            )
+        )
+    )
+
+    getReleaseCode(
+        release_name = dict_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = expression.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def generateDictOperationItemsIterNextKeyCode(to_name, expression, emit,
+                                              context):
+    iterator_name, = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit(
+        "%s = DICT_ITEMS_ITERATOR_NEXT( %s );" % (
+            to_name,
+            iterator_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = iterator_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getErrorExitCode(
+        check_name      = to_name,
+        quick_exception = "StopIteration",
+        emit            = emit,
+        context         = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def generateDictOperationItemsIterValueCode(to_name, expression, emit,
+                                            context):
+    iterator_name, = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit(
+        "%s = DICT_ITEMS_ITERATOR_VALUE( %s );" % (
+            to_name,
+            iterator_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = iterator_name,
+        emit         = emit,
+        context      = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateDictOperationInCode(to_name, expression, emit, context):
     inverted = expression.isExpressionDictOperationNOTIn()
 
@@ -21,6 +21,8 @@ Code generation is driven via "emit", which is to receive lines of code and
 this is to collect them, providing the emit implementation. Sometimes nested
 use of these will occur.
 
+The collected codes are fragments, which may contain multiple lines. They are
+not split into lines, the indentation works on them as a whole.
 """
 
 class SourceCodeCollector(object):
@@ -28,11 +30,10 @@ class SourceCodeCollector(object):
         self.codes = []
 
     def __call__(self, code):
-        self.emit(code)
+        self.codes.append(code)
 
-    def emit(self,code):
-        for line in code.split('\n'):
-            self.codes.append(line)
+    def emit(self, code):
+        self.codes.append(code)
 
     def emitTo(self, emit):
         for code in self.codes:
@@ -40,6 +40,9 @@ from .templates.CodeTemplatesFrames import (
     template_frame_guard_generator,
     template_frame_guard_generator_exception_handler,
     template_frame_guard_generator_return_handler,
+    template_frame_guard_lazy_block,
+    template_frame_guard_lazy_exception_handler,
+    template_frame_guard_lazy_return_handler,
     template_frame_guard_once
 )
 
@@ -85,6 +88,12 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 
     parent_exception_exit = context.getExceptionEscape()
 
+    # Frames in functions, that nothing can observe before an exception
+    # escapes, need not be created and put on the frame stack before that.
+    is_lazy = guard_mode == "full" and \
+              context.getFrameHandle() is None and \
+              statement_sequence.isLazyFrameCandidate()
+
     # For nested frames, make sure to restore set the type description.
     if context.getFrameHandle() is not None:
         real_parent_exception_exit = parent_exception_exit
@@ -172,6 +181,19 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             emit                  = emit,
             context               = context
         )
+    elif is_lazy:
+        getFrameGuardLazyCode(
+            frame_identifier      = context.getFrameHandle(),
+            code_identifier       = code_identifier,
+            type_descriptions     = type_descriptions,
+            parent_exception_exit = parent_exception_exit,
+            parent_return_exit    = parent_return_exit,
+            frame_exception_exit  = frame_exception_exit,
+            frame_return_exit     = frame_return_exit,
+            codes                 = local_emit.codes,
+            emit                  = emit,
+            context               = context
+        )
     elif guard_mode == "full":
         getFrameGuardHeavyCode(
             frame_identifier      = context.getFrameHandle(),
@@ -308,6 +330,60 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
     emit("%s:;\n" % no_exception_exit)
 
 
+def getFrameGuardLazyCode(frame_identifier, code_identifier, codes,
+                          type_descriptions, parent_exception_exit,
+                          parent_return_exit, frame_exception_exit,
+                          frame_return_exit, emit, context):
+    # We really need this many parameters here.
+
+    no_exception_exit = context.allocateLabel("frame_no_exception")
+
+    context.addFrameDeclaration(
+        template_frame_guard_cache_decl % {
+            "frame_identifier" : frame_identifier,
+        }
+    )
+    context.addFrameDeclaration(
+        template_frame_guard_frame_decl % {
+            "frame_identifier" : frame_identifier,
+        }
+    )
+
+    emit(
+        template_frame_guard_lazy_block % {
+            "codes"             : indented(codes, 0),
+            "no_exception_exit" : no_exception_exit,
+        }
+    )
+
+    if frame_return_exit is not None:
+        emit(
+            template_frame_guard_lazy_return_handler % {
+                "return_exit"       : parent_return_exit,
+                "frame_return_exit" : frame_return_exit,
+            }
+        )
+
+    if frame_exception_exit is not None:
+        emit(
+            template_frame_guard_lazy_exception_handler % {
+                "frame_identifier"      : frame_identifier,
+                "code_identifier"       : code_identifier,
+                "locals_size"           : getFrameLocalsStorageSize(type_descriptions),
+                "module_identifier"     : getModuleAccessCode(context),
+                "tb_making"             : getTracebackMakingIdentifier(
+                                              context     = context,
+                                              lineno_name = "exception_lineno"
+                                          ),
+                "parent_exception_exit" : parent_exception_exit,
+                "frame_exception_exit"  : frame_exception_exit,
+                "attach_locals"         : getFrameAttachLocalsCode(context, frame_identifier),
+            }
+        )
+
+    emit("%s:;\n" % no_exception_exit)
+
+
 def getFrameGuardOnceCode(frame_identifier, code_identifier,
                           codes, parent_exception_exit, parent_return_exit,
                           frame_exception_exit, frame_return_exit,
@@ -19,7 +19,9 @@
 
 """
 
+from nuitka import Options
 from nuitka.PythonVersions import python_version
+from nuitka.utils.CStrings import encodePythonStringToC
 
 from .c_types.CTypePyObjectPtrs import CTypeCellObject, CTypePyObjectPtrPtr
 from .CodeHelpers import generateExpressionCode, generateStatementSequenceCode
@@ -44,6 +46,7 @@ from .templates.CodeTemplatesFunction import (
     template_function_body,
     template_function_direct_declaration,
     template_function_exception_exit,
+    template_function_instrumentation_record,
     template_function_make_declaration,
     template_function_return_exit,
     template_make_function_template
@@ -572,6 +575,14 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
 
     finalizeFunctionLocalVariables(context, function_locals, function_cleanup)
 
+    if Options.isInstrumentation():
+        function_locals.append(getInstrumentationRecordCode(context))
+
+        function_codes.codes.insert(
+            0,
+            "INSTRUMENTATION_ENTER( &instrumentation_record, &instrumentation_frame );"
+        )
+
     function_doc = context.getConstantCode(
         constant = function_doc
     )
@@ -591,13 +602,21 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
 
     if needs_exception_exit:
         function_exit += template_function_exception_exit % {
-            "function_cleanup" : indented(function_cleanup),
+            "function_cleanup"         : indented(function_cleanup),
+            "function_instrumentation" : getInstrumentationLeaveCode(
+                exception = True,
+                level     = 1
+            ),
         }
 
     if context.hasTempName("return_value"):
         function_exit += indented(
             template_function_return_exit % {
-                "function_cleanup" : indented(function_cleanup),
+                "function_cleanup"         : indented(function_cleanup),
+                "function_instrumentation" : getInstrumentationLeaveCode(
+                    exception = False,
+                    level     = 0
+                ),
             }
         )
 
@@ -644,6 +663,39 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
     return result
 
 
+def getInstrumentationRecordCode(context):
+    """ Declarations of the record and frame for instrumentation of a function.
+
+    """
+    function_body = context.getOwner()
+
+    def encodeString(value):
+        if str is not bytes:
+            value = value.encode("utf8")
+
+        return encodePythonStringToC(value)
+
+    return template_function_instrumentation_record % {
+        "function_name" : encodeString(function_body.getFunctionQualname()),
+        "filename"      : encodeString(
+            function_body.getParentModule().getRunTimeFilename()
+        ),
+        "line_number"   : function_body.getSourceReference().getLineNumber()
+    }
+
+
+def getInstrumentationLeaveCode(exception, level):
+    if not Options.isInstrumentation():
+        return ""
+
+    return indented(
+        "INSTRUMENTATION_LEAVE( &instrumentation_frame, %s );\n" % (
+            "true" if exception else "false"
+        ),
+        level
+    )
+
+
 def getExportScopeCode(cross_module):
     if cross_module:
         return "NUITKA_CROSS_MODULE"
@@ -19,6 +19,8 @@
 
 """
 
+import re
+
 from nuitka import Options
 from nuitka.PythonVersions import python_version
 
@@ -51,8 +53,6 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
                            user_variables, outline_variables,
                            temp_variables, needs_exception_exit,
                            needs_generator_return):
-    # Due to the current experimental code, pylint: disable=too-many-locals
-
     function_locals, function_cleanup = setupFunctionLocalVariables(
         context           = context,
         parameters        = None,
@@ -84,59 +84,89 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
     if needs_generator_return:
         generator_exit += template_generator_return_exit % {}
 
-    function_dispatch = [
-        "case %(index)d: goto yield_return_%(index)d;" % {
-            "index" : yield_index
-        }
-        for yield_index in
-        range(context.getLabelCount("yield_return"), 0, -1)
-    ]
+    if Options.isExperimental("generator_goto"):
+        function_dispatch = [
+            "case %(index)d: goto yield_return_%(index)d;" % {
+                "index" : yield_index
+            }
+            for yield_index in
+            range(context.getLabelCount("yield_return"), 0, -1)
+        ]
+
+        if function_dispatch:
+            function_dispatch.insert(0, "switch(generator->m_yield_return_index) {")
+            function_dispatch.append('}')
+
+        local_type_decl, function_locals, local_names = \
+          _splitGeneratorHeapLocals(function_locals)
+
+        function_heap_access = [
+            "#define %s generator_heap->%s" % (local_name, local_name)
+            for local_name in
+            local_names
+        ]
+        function_heap_release = [
+            "#undef %s" % local_name
+            for local_name in
+            local_names
+        ]
+    else:
+        function_dispatch = []
+        local_type_decl = []
+        function_heap_access = []
+        function_heap_release = []
 
-    if function_dispatch:
-        function_dispatch.insert(0, "switch(generator->m_yield_return_index) {")
-        function_dispatch.append('}')
+    return template_genfunc_yielder_body_template % {
+        "function_identifier"   : function_identifier,
+        "function_body"         : indented(function_codes.codes),
+        "function_local_types"  : indented(local_type_decl),
+        "function_heap_access"  : '\n'.join(function_heap_access),
+        "function_heap_release" : '\n'.join(function_heap_release),
+        "function_var_inits"    : indented(function_locals),
+        "function_dispatch"     : indented(function_dispatch),
+        "generator_exit"        : generator_exit
+    }
 
-    local_type_decl = []
-    local_type_init = []
-    local_reals = []
 
-    for decl in function_locals:
-        if decl.startswith("NUITKA_MAY_BE_UNUSED "):
-            decl = decl[21:]
+_local_declaration_re = re.compile(
+    r"^(?:NUITKA_MAY_BE_UNUSED )?([\w ]+?[ *]+)(\w+)(\[\w*\])?(?: =(.*))?;$"
+)
 
-        if decl.startswith("static"):
-            local_reals.append(decl)
-            continue
 
-        if decl in ("char const *type_description;", "PyObject *tmp_unused;"):
-            local_reals.append(decl)
-            continue
+def _splitGeneratorHeapLocals(function_locals):
+    """ Move the local declarations of a generator to its heap storage.
 
-        parts = decl.split('=')
+    Returns the declarations for the storage structure, the initializations
+    that remain to be done in the generator code, and the names to access.
+    """
+
+    local_type_decl = []
+    local_type_init = []
+    local_names = []
+
+    for decls in function_locals:
+        # Some declarations, e.g. the locals dict setup, span multiple lines.
+        for decl in decls.split('\n'):
+            match = _local_declaration_re.match(decl)
 
-        if len(parts) == 1:
-            local_type_decl.append(decl)
-        else:
-            type_decl = parts[0].strip()
-            var_name = type_decl.split('*')[-1]
-            var_name = var_name.split(' ')[-1]
+            # Statics, comments and plain assignments are fine as they are.
+            if match is None or decl.startswith("static "):
+                local_type_init.append(decl)
+                continue
 
-            local_type_decl.append(type_decl)
-            local_type_init.append(
-                "local_variables->" + var_name + " =" + parts[1]
+            type_decl, var_name, array_size, init_value = match.groups()
+
+            local_type_decl.append(
+                "%s%s%s;" % (type_decl, var_name, array_size or "")
             )
+            local_names.append(var_name)
 
-    if Options.isExperimental("generator_goto"):
-        function_locals = local_reals + local_type_init
+            if init_value is not None:
+                local_type_init.append(
+                    "%s =%s;" % (var_name, init_value)
+                )
 
-    return template_genfunc_yielder_body_template % {
-        "function_identifier"  : function_identifier,
-        "function_body"        : indented(function_codes.codes),
-        "function_local_types" : indented(local_type_decl),
-        "function_var_inits"   : indented(function_locals),
-        "function_dispatch"    : indented(function_dispatch),
-        "generator_exit"       : generator_exit
-    }
+    return local_type_decl, local_type_init, local_names
 
 
 def getClosureCopyCode(to_name, closure_variables, closure_type, context):
@@ -40,17 +40,68 @@ def generateBuiltinImportCode(to_name, expression, emit, context):
         context    = context
     )
 
-    getBuiltinImportCode(
-        to_name          = to_name,
-        module_name      = module_name,
-        globals_name     = globals_name,
-        locals_name      = locals_name,
-        import_list_name = import_list_name,
-        level_name       = level_name,
-        needs_check      = expression.mayRaiseException(BaseException),
-        emit             = emit,
-        context          = context
-    )
+    if expression.isLazy():
+        getLazyImportCode(
+            to_name          = to_name,
+            module_name      = module_name,
+            globals_name     = globals_name,
+            locals_name      = locals_name,
+            import_list_name = import_list_name,
+            level_name       = level_name,
+            variable_name    = expression.getLazyVariableName(),
+            emit             = emit,
+            context          = context
+        )
+    elif _isCachedImport(expression):
+        getCachedImportCode(
+            to_name          = to_name,
+            module_name      = module_name,
+            globals_name     = globals_name,
+            locals_name      = locals_name,
+            import_list_name = import_list_name,
+            level_name       = level_name,
+            needs_check      = expression.mayRaiseException(BaseException),
+            emit             = emit,
+            context          = context
+        )
+    else:
+        getBuiltinImportCode(
+            to_name          = to_name,
+            module_name      = module_name,
+            globals_name     = globals_name,
+            locals_name      = locals_name,
+            import_list_name = import_list_name,
+            level_name       = level_name,
+            needs_check      = expression.mayRaiseException(BaseException),
+            emit             = emit,
+            context          = context
+        )
+
+
+def _isCachedImport(expression):
+    """ Decide if an import can use a cache at its site.
+
+        For absolute imports of a constant module name, the result only
+        depends on the module in "sys.modules" as long as the built-in
+        import is used, so it can be reused for that module.
+    """
+
+    module_name = expression.getImportName()
+    level = expression.getLevel()
+
+    if not module_name.isExpressionConstantRef() or \
+       type(module_name.getConstant()) is not str:
+        return False
+
+    if level is None or \
+       not level.isExpressionConstantRef() or \
+       type(level.getConstant()) is not int or \
+       level.getConstant() != 0:
+        return False
+
+    return expression.getGlobals() is not None and \
+           expression.getLocals() is not None and \
+           expression.getFromList() is not None
 
 
 def getCountedArgumentsHelperCallCode(helper_prefix, to_name, args, min_args,
@@ -124,6 +175,85 @@ def getBuiltinImportCode(to_name, module_name, globals_name, locals_name,
     )
 
 
+def getCachedImportCode(to_name, module_name, globals_name, locals_name,
+                        import_list_name, level_name, needs_check, emit,
+                        context):
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        """\
+{
+    static struct Nuitka_ImportCache import_cache = { NULL, NULL, NULL };
+
+    %(to_name)s = IMPORT_MODULE_CACHED( &import_cache, %(module_name)s, %(globals_name)s, %(locals_name)s, %(import_list_name)s, %(level_name)s );
+}""" % {
+            "to_name"          : to_name,
+            "module_name"      : module_name,
+            "globals_name"     : globals_name,
+            "locals_name"      : locals_name,
+            "import_list_name" : import_list_name,
+            "level_name"       : level_name
+        }
+    )
+
+    getReleaseCodes(
+        release_names = (
+            module_name,
+            globals_name,
+            locals_name,
+            import_list_name,
+            level_name
+        ),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = needs_check,
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def getLazyImportCode(to_name, module_name, globals_name, locals_name,
+                      import_list_name, level_name, variable_name, emit,
+                      context):
+    emit(
+        "%s = IMPORT_MODULE_LAZY( %s, %s, %s, %s, %s, %s );" % (
+            to_name,
+            module_name,
+            globals_name,
+            locals_name,
+            import_list_name,
+            "NULL" if level_name is None else level_name,
+            context.getConstantCode(variable_name)
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (
+            module_name,
+            globals_name,
+            locals_name,
+            import_list_name,
+            level_name
+        ),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateImportModuleHardCode(to_name, expression, emit, context):
     module_name = expression.getModuleName()
     needs_check = expression.mayRaiseException(BaseException)
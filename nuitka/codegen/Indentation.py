@@ -22,23 +22,32 @@ Language independent, the amount of the spaces is not configurable, as it needs
 to be the same as in templates.
 """
 
-def _indentedCode(codes, count):
-    return '\n'.join(
-        ' ' * count + line
-          if (line and not line.startswith('#')) else
-        line for line in codes
-    )
+import re
+
+# Lines that get indented, empty lines and preprocessor lines do not.
+_re_indented_line = re.compile(r"^(?=[^#\n])", re.M)
+
+def _indentedCode(code, count):
+    if count == 0:
+        return code
+
+    return _re_indented_line.sub(' ' * count, code)
 
 
 def indented(codes, level = 1, vert_block = False):
+    """ Indent codes, which is a string, or a list of lines or fragments.
+
+        Fragments may contain multiple lines. They are joined into one string
+        and that is indented as a whole, without splitting into lines.
+    """
+
     if type(codes) is str:
-        codes = codes.split('\n')
+        codes = [codes]
 
     if vert_block and codes != [""]:
-        codes.insert(0, "")
-        codes.append("")
+        codes = [""] + list(codes) + [""]
 
-    return _indentedCode(codes, level * 4)
+    return _indentedCode('\n'.join(codes), level * 4)
 
 
 def getCommentCode(comment, emit):
@@ -68,11 +68,12 @@ def generateBuiltinNext1Code(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
-def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
+def getBuiltinLoopBreakNextCode(to_name, next_capi, value, emit, context):
     emit(
-        "%s = %s;" % (
+        "%s = %s( %s );" % (
             to_name,
-            "ITERATOR_NEXT( %s )" % value,
+            next_capi,
+            value
         )
     )
 
@@ -230,9 +231,19 @@ def generateBuiltinNext2Code(to_name, expression, emit, context):
 
 
 def generateBuiltinIter1Code(to_name, expression, emit, context):
+    # Iterators of loops and unpacking are never visible to the program, so
+    # lists and tuples can use a cheaper iterator object there.
+    if expression.isLoopIterator():
+        if expression.isIteratingListOrTuple():
+            capi = "MAKE_SEQUENCE_LOOP_ITERATOR"
+        else:
+            capi = "MAKE_LOOP_ITERATOR"
+    else:
+        capi = "MAKE_ITERATOR"
+
     generateCAPIObjectCode(
         to_name    = to_name,
-        capi       = "MAKE_ITERATOR",
+        capi       = capi,
         arg_desc   = (
             ("iter_arg", expression.getValue()),
         ),
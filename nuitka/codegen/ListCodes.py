@@ -109,6 +109,76 @@ def generateListOperationAppendCode(statement, emit, context):
     )
 
 
+def generateListOperationAppendExpressionCode(to_name, expression, emit,
+                                              context):
+    res_name = context.getIntResName()
+
+    list_arg_name, value_arg_name = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit("assert( PyList_Check( %s ) );" % list_arg_name)
+    emit(
+        "%s = PyList_Append( %s, %s );" % (
+            res_name,
+            list_arg_name,
+            value_arg_name
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (list_arg_name, value_arg_name),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitBoolCode(
+        condition = "%s == -1" % res_name,
+        emit      = emit,
+        context   = context
+    )
+
+    # Only assign if necessary.
+    if context.isUsed(to_name):
+        emit(
+            "%s = Py_None;" % to_name
+        )
+    else:
+        context.forgetTempName(to_name)
+
+
+def generateListOperationLenCode(to_name, expression, emit, context):
+    list_arg_name, = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit("assert( PyList_Check( %s ) );" % list_arg_name)
+    emit(
+        "%s = PyInt_FromSsize_t( PyList_GET_SIZE( %s ) );" % (
+            to_name,
+            list_arg_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = list_arg_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateListOperationExtendCode(to_name, expression, emit, context):
     list_arg_name, value_arg_name = generateChildExpressionsCode(
         expression = expression,
@@ -171,6 +241,87 @@ def generateListOperationPopCode(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def generateListOperationGetCode(to_name, expression, emit, context):
+    list_arg_name, index_name = generateChildExpressionsCode(
+        expression = expression,
+        emit       = emit,
+        context    = context
+    )
+
+    emit(
+        "%s = LIST_GET_ITEM( %s, %s );" % (
+            to_name,
+            list_arg_name,
+            index_name
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (list_arg_name, index_name),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def generateListOperationSetCode(statement, emit, context):
+    value_arg_name = context.allocateTempName("listset_value", unique = True)
+    generateExpressionCode(
+        to_name    = value_arg_name,
+        expression = statement.getValue(),
+        emit       = emit,
+        context    = context
+    )
+
+    list_arg_name = context.allocateTempName("listset_list", unique = True)
+    generateExpressionCode(
+        to_name    = list_arg_name,
+        expression = statement.getList(),
+        emit       = emit,
+        context    = context
+    )
+
+    index_arg_name = context.allocateTempName("listset_index", unique = True)
+    generateExpressionCode(
+        to_name    = index_arg_name,
+        expression = statement.getIndex(),
+        emit       = emit,
+        context    = context
+    )
+
+    context.setCurrentSourceCodeReference(statement.getSourceReference())
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = LIST_SET_ITEM( %s, %s, %s );" % (
+            res_name,
+            list_arg_name,
+            index_arg_name,
+            value_arg_name
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (value_arg_name, list_arg_name, index_arg_name),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitBoolCode(
+        condition = "%s == false" % res_name,
+        emit      = emit,
+        context   = context
+    )
+
+
 def generateBuiltinListCode(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name    = to_name,
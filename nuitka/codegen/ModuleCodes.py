@@ -19,6 +19,7 @@
 
 """
 
+from nuitka import Options
 from nuitka.Version import getNuitkaVersion, getNuitkaVersionYear
 
 from .CodeObjectCodes import getCodeObjectsDeclCode, getCodeObjectsInitCode
@@ -26,9 +27,13 @@ from .ConstantCodes import allocateNestedConstants, getConstantInitCodes
 from .Indentation import indented
 from .templates.CodeTemplatesModules import (
     template_global_copyright,
+    template_header_guard,
     template_module_body_template,
     template_module_exception_exit,
-    template_module_noexception_exit
+    template_module_noexception_exit,
+    template_module_split_body_template,
+    template_module_split_define,
+    template_module_split_header_template
 )
 
 
@@ -37,8 +42,9 @@ def getModuleAccessCode(context):
 
 
 def getModuleValues(context, module_name, module_identifier, codes,
-                    function_decl_codes, function_body_codes, outline_variables,
-                    temp_variables, is_main_module, is_internal_module):
+                    function_decl_codes, function_body_codes,
+                    function_split_codes, outline_variables, temp_variables,
+                    is_main_module, is_internal_module):
     # For the module code, lots of arguments and attributes come together.
     # pylint: disable=too-many-locals
 
@@ -69,6 +75,10 @@ def getModuleValues(context, module_name, module_identifier, codes,
         "module_identifier"        : module_identifier,
         "module_functions_decl"    : function_decl_codes,
         "module_functions_code"    : function_body_codes,
+        "module_split_codes"       : function_split_codes,
+        "module_split_define"      : template_module_split_define
+                                       if function_split_codes else
+                                     "",
         "temps_decl"               : indented(local_var_inits),
         "module_code"              : indented(codes),
         "module_exit"              : module_exit,
@@ -120,7 +130,70 @@ def getModuleCode(module_context, template_values):
         1
     )
 
-    return header + template_module_body_template % template_values
+    # Format header and body in one go, so there is no copy of the large body
+    # for adding the header.
+    return (header.replace('%', "%%") + template_module_body_template) % \
+        template_values
+
+
+def getModuleSplitCodes(module_context, template_values, header_name):
+    """ Get the header and the files for function codes split from a module.
+
+        These are only present for large modules, for others the result is
+        empty. Must be used before "getModuleCode" on the template values.
+    """
+    split_codes = template_values.pop("module_split_codes")
+
+    if not split_codes:
+        return None, ()
+
+    decls = []
+
+    for constant_identifier in sorted(module_context.getConstants()):
+        if not constant_identifier.startswith("const_"):
+            continue
+
+        decls.append("extern PyObject *%s;" % constant_identifier)
+
+        if Options.isDebug():
+            decls.append("extern Py_hash_t hash_%s;" % constant_identifier)
+
+    header_code = template_header_guard % {
+        "header_guard_name" : "__NUITKA_%s_H__" % (
+            template_values["module_identifier"].upper()
+        ),
+        "header_body"       : template_module_split_header_template % {
+            "module_name"              : template_values["module_name"],
+            "module_identifier"        : template_values["module_identifier"],
+            "constant_decl_codes"      : indented(decls, 0),
+            "module_code_objects_decl" : indented(
+                [
+                    "extern PyCodeObject *%s;" % code_identifier
+                    for _code_object_key, code_identifier in
+                    module_context.getCodeObjects()
+                ],
+                0
+            ),
+            "module_functions_decl"    : template_values["module_functions_decl"]
+        }
+    }
+
+    header = template_global_copyright % {
+        "name"    : module_context.getName(),
+        "version" : getNuitkaVersion(),
+        "year"    : getNuitkaVersionYear()
+    }
+
+    split_codes = [
+        header + template_module_split_body_template % {
+            "module_split_header"   : header_name,
+            "module_functions_code" : split_code
+        }
+        for split_code in
+        split_codes
+    ]
+
+    return header + header_code, split_codes
 
 
 def generateModuleFileAttributeCode(to_name, expression, emit, context):
@@ -22,9 +22,8 @@
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateExpressionCode
-from .ErrorCodes import getErrorExitCode, getReleaseCode, getReleaseCodes
+from .ErrorCodes import getErrorExitCode, getReleaseCodes
 from .PythonAPICodes import generateCAPIObjectCode
-from .TupleCodes import getTupleCreationCode
 
 
 def generateBuiltinBytesCode(to_name, expression, emit, context):
@@ -132,24 +131,42 @@ def generateBuiltinOrdCode(to_name, expression, emit, context):
 def generateStringContenationCode(to_name, expression, emit, context):
     values = expression.getValues()
 
-    # TODO: These are bad things.
-    tuple_temp_name = context.allocateTempName("string_concat_values")
+    value_names = []
 
-    getTupleCreationCode(
-        to_name  = tuple_temp_name,
-        elements = values,
-        emit     = emit,
-        context  = context
-    )
+    for value in values:
+        value_name = context.allocateTempName("string_concat_value")
+
+        generateExpressionCode(
+            to_name    = value_name,
+            expression = value,
+            emit       = emit,
+            context    = context
+        )
+
+        value_names.append(value_name)
 
+    # The pieces are joined from a C array in one go, this avoids creating
+    # an intermediate tuple for them.
     emit(
-        "%s = PyUnicode_Join( %s, %s );" % (
+        """\
+{
+    PyObject *string_concat_values[%d] = { %s };
+    %s = _PyUnicode_JoinArray( %s, string_concat_values, %d );
+}""" % (
+            len(value_names),
+            ", ".join(value_names),
             to_name,
             context.getConstantCode(""),
-            tuple_temp_name
+            len(value_names)
         )
     )
 
+    getReleaseCodes(
+        release_names = value_names,
+        emit          = emit,
+        context       = context
+    )
+
     getErrorExitCode(
         check_name = to_name,
         emit       = emit,
@@ -158,12 +175,6 @@ def generateStringContenationCode(to_name, expression, emit, context):
 
     context.addCleanupTempName(to_name)
 
-    getReleaseCode(
-        release_name = tuple_temp_name,
-        emit         = emit,
-        context      = context
-    )
-
 
 def generateBuiltinFormatCode(to_name, expression, emit, context):
     value_name = context.allocateTempName("format_value")
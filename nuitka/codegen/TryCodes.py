@@ -270,7 +270,13 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
 
     assign_source = tried_statement.getAssignSource()
 
-    if not assign_source.isExpressionBuiltinNext1():
+    if assign_source.isExpressionBuiltinNext1():
+        next_capi = "LOOP_ITERATOR_NEXT"
+        next_source = assign_source.getValue()
+    elif assign_source.isExpressionDictOperationItemsIterNextKey():
+        next_capi = "DICT_ITEMS_ITERATOR_NEXT"
+        next_source = assign_source.getIterator()
+    else:
         return False
 
     handling_statement = handling_statements[0]
@@ -297,7 +303,7 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     tmp_name = context.allocateTempName("next_source")
 
     generateExpressionCode(
-        expression = assign_source.getValue(),
+        expression = next_source,
         to_name    = tmp_name,
         emit       = emit,
         context    = context
@@ -312,10 +318,11 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     )
 
     getBuiltinLoopBreakNextCode(
-        to_name = tmp_name2,
-        value   = tmp_name,
-        emit    = emit,
-        context = context
+        to_name   = tmp_name2,
+        next_capi = next_capi,
+        value     = tmp_name,
+        emit      = emit,
+        context   = context
     )
 
     getVariableAssignmentCode(
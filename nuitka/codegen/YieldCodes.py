@@ -27,6 +27,13 @@ from .ErrorCodes import getErrorExitCode, getReleaseCode
 from .PythonAPICodes import getReferenceExportCode
 
 
+def _isGeneratorGotoMode(context):
+    # Only generators can be resumed as state machines so far, coroutines
+    # and asyncgens use fibers.
+    return context.getContextObjectName() == "generator" and \
+           Options.isExperimental("generator_goto")
+
+
 def generateYieldCode(to_name, expression, emit, context):
     value_name, = generateChildExpressionsCode(
         expression = expression,
@@ -40,26 +47,25 @@ def generateYieldCode(to_name, expression, emit, context):
     # This will produce GENERATOR_YIELD, COROUTINE_YIELD or ASYNCGEN_YIELD.
     getReferenceExportCode(value_name, emit, context)
 
-    if Options.isExperimental("generator_goto"):
+    if _isGeneratorGotoMode(context):
         yield_return_label = context.allocateLabel("yield_return")
         yield_return_index = yield_return_label.split('_')[-1]
 
-
         emit(
-            """
-%(context_object_name)s->m_yield_return_index = %(yield_return_index)s;
-return %(yielded_value)s;
+            """\
+generator->m_yield_return_index = %(yield_return_index)s;
+return GENERATOR_%(yield_kind)s_EXIT( generator, %(yielded_value)s );
 %(yield_return_label)s:
-%(to_name)s = yield_return_value;
-""" % {
-                "context_object_name" : context.getContextObjectName(),
+%(to_name)s = GENERATOR_%(yield_kind)s_RESUME( generator, yield_return_value );""" % {
+                "yield_kind"          : "YIELD"
+                                          if not preserve_exception else
+                                        "YIELD_IN_HANDLER",
                 "yield_return_index"  : yield_return_index,
                 "yielded_value"       : value_name,
                 "yield_return_label"  : yield_return_label,
                 "to_name"             : to_name
-    }
+            }
         )
-
     else:
         emit(
             "%s = %s_%s( %s, %s );" % (
@@ -86,6 +92,59 @@ return %(yielded_value)s;
     # context.addCleanupTempName(to_name)
 
 
+def _generateYieldFromGotoCode(to_name, value_name, preserve_exception, emit,
+                               context):
+    iter_name = context.allocateTempName("yield_from_iter")
+
+    emit(
+        "%s = GENERATOR_YIELD_FROM_ITERATOR( generator, %s );" % (
+            iter_name,
+            value_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = value_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getErrorExitCode(
+        check_name = iter_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(iter_name)
+
+    yield_return_label = context.allocateLabel("yield_return")
+    yield_return_index = yield_return_label.split('_')[-1]
+
+    # Each resume continues the delegation, until there is a result.
+    emit(
+        """\
+generator->m_yield_return_index = %(yield_return_index)s;
+yield_return_value = NULL;
+%(yield_return_label)s:
+yield_return_value = GENERATOR_%(yield_kind)s_STEP( generator, %(iter_name)s, yield_return_value, &%(to_name)s );
+if ( yield_return_value != NULL ) return yield_return_value;""" % {
+            "yield_kind"          : "YIELD_FROM"
+                                      if not preserve_exception else
+                                    "YIELD_FROM_IN_HANDLER",
+            "yield_return_index"  : yield_return_index,
+            "yield_return_label"  : yield_return_label,
+            "iter_name"           : iter_name,
+            "to_name"             : to_name
+        }
+    )
+
+    getReleaseCode(
+        release_name = iter_name,
+        emit         = emit,
+        context      = context
+    )
+
+
 def generateYieldFromCode(to_name, expression, emit, context):
     value_name, = generateChildExpressionsCode(
         expression = expression,
@@ -100,26 +159,35 @@ def generateYieldFromCode(to_name, expression, emit, context):
     # ASYNCGEN_YIELD_FROM.
     getReferenceExportCode(value_name, emit, context)
 
-    emit(
-        "%s = %s_%s( %s, %s );" % (
-            to_name,
-            context.getContextObjectName().upper(),
-            "YIELD_FROM"
-              if not preserve_exception else
-            "YIELD_FROM_IN_HANDLER",
-            context.getContextObjectName(),
-            value_name
-        )
-    )
-
     if not context.needsCleanup(value_name):
         context.addCleanupTempName(value_name)
 
-    getReleaseCode(
-        release_name = value_name,
-        emit         = emit,
-        context      = context
-    )
+    if _isGeneratorGotoMode(context):
+        _generateYieldFromGotoCode(
+            to_name            = to_name,
+            value_name         = value_name,
+            preserve_exception = preserve_exception,
+            emit               = emit,
+            context            = context
+        )
+    else:
+        emit(
+            "%s = %s_%s( %s, %s );" % (
+                to_name,
+                context.getContextObjectName().upper(),
+                "YIELD_FROM"
+                  if not preserve_exception else
+                "YIELD_FROM_IN_HANDLER",
+                context.getContextObjectName(),
+                value_name
+            )
+        )
+
+        getReleaseCode(
+            release_name = value_name,
+            emit         = emit,
+            context      = context
+        )
 
     getErrorExitCode(
         check_name = to_name,
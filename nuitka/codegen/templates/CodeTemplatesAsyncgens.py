@@ -20,11 +20,11 @@
 """
 
 template_asyncgen_object_decl_template = """\
-static void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen );
+NUITKA_LOCAL_MODULE void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen );
 """
 
 template_asyncgen_object_body_template = """
-static void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen )
+NUITKA_LOCAL_MODULE void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen )
 {
     CHECK_OBJECT( (PyObject *)asyncgen );
     assert( Nuitka_Asyncgen_Check( (PyObject *)asyncgen ) );
@@ -105,6 +105,57 @@ popFrameStack();
 goto %(parent_exception_exit)s;
 """
 
+# Frame in a function, that is only created when an exception escapes.
+template_frame_guard_lazy_block = """\
+// Framed code, the frame is only created if an exception escapes:
+%(codes)s
+
+goto %(no_exception_exit)s;
+"""
+
+template_frame_guard_lazy_return_handler = """\
+%(frame_return_exit)s:;
+goto %(return_exit)s;
+"""
+
+template_frame_guard_lazy_exception_handler = """\
+%(frame_exception_exit)s:;
+
+// Create the frame only now, and put it on the frame stack, so it has the
+// caller frame as its parent.
+MAKE_OR_REUSE_FRAME( cache_%(frame_identifier)s, %(code_identifier)s, %(module_identifier)s, %(locals_size)s );
+%(frame_identifier)s = cache_%(frame_identifier)s;
+
+pushFrameStack( %(frame_identifier)s );
+
+if ( exception_tb == NULL )
+{
+    exception_tb = %(tb_making)s;
+}
+else if ( exception_tb->tb_frame != &%(frame_identifier)s->m_frame )
+{
+    exception_tb = ADD_TRACEBACK( exception_tb, %(frame_identifier)s, exception_lineno );
+}
+
+// Attachs locals to frame if any.
+%(attach_locals)s
+
+// Release cached frame.
+if ( %(frame_identifier)s == cache_%(frame_identifier)s )
+{
+    Py_DECREF( %(frame_identifier)s );
+}
+cache_%(frame_identifier)s = NULL;
+
+assertFrameObject( %(frame_identifier)s );
+
+// Put the previous frame back on top.
+popFrameStack();
+
+// Return the error.
+goto %(parent_exception_exit)s;
+"""
+
 # Frame for a module. TODO: Use it for functions called only once.
 # TODO: The once guard need not take a reference count in its frame class.
 template_frame_guard_once = """\
@@ -20,7 +20,7 @@
 """
 
 template_function_make_declaration = """\
-static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_arg_spec)s );
+NUITKA_LOCAL_MODULE PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_arg_spec)s );
 """
 
 template_function_direct_declaration = """\
@@ -28,7 +28,7 @@ template_function_direct_declaration = """\
 """
 
 template_make_function_template = """
-static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
+NUITKA_LOCAL_MODULE PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
 {
     struct Nuitka_FunctionObject *result = Nuitka_Function_New(
         %(function_impl_identifier)s,
@@ -74,6 +74,7 @@ function_exception_exit:
 %(function_cleanup)s\
     assert( exception_type );
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+%(function_instrumentation)s\
 
     return NULL;
 """
@@ -83,6 +84,7 @@ function_return_exit:
 %(function_cleanup)s
 CHECK_OBJECT( tmp_return_value );
 assert( had_error || !ERROR_OCCURRED() );
+%(function_instrumentation)s\
 return tmp_return_value;
 """
 
@@ -104,6 +106,10 @@ function_direct_body_template = """\
 }
 """
 
+template_function_instrumentation_record = """\
+static struct Nuitka_InstrumentationRecord instrumentation_record = { %(function_name)s, %(filename)s, %(line_number)d };
+struct Nuitka_InstrumentationFrame instrumentation_frame;"""
+
 function_dict_setup = """\
 // Locals dictionary setup.
 PyObject *%(locals_dict)s = PyDict_New();
@@ -21,9 +21,9 @@
 
 template_genfunc_yielder_decl_template = """\
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
+NUITKA_LOCAL_MODULE PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
 #else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator );
+NUITKA_LOCAL_MODULE void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator );
 #endif
 """
 
@@ -35,24 +35,43 @@ struct %(function_identifier)s_locals {
 #endif
 
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+NUITKA_LOCAL_MODULE PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
 #else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator )
+NUITKA_LOCAL_MODULE void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator )
 #endif
 {
     CHECK_OBJECT( (PyObject *)generator );
     assert( Nuitka_Generator_Check( (PyObject *)generator ) );
 
-    // Local variable initialization
-%(function_var_inits)s
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    // Heap access, local variables must survive the returns done for yields.
+    if ( generator->m_heap_storage == NULL )
+    {
+        generator->m_heap_storage = PyMem_Malloc( sizeof( struct %(function_identifier)s_locals ) );
+
+        if (unlikely( generator->m_heap_storage == NULL ))
+        {
+            return PyErr_NoMemory();
+        }
+    }
+
+    struct %(function_identifier)s_locals *generator_heap = (struct %(function_identifier)s_locals *)generator->m_heap_storage;
+%(function_heap_access)s
 
     // Dispatch to yield based on return label index:
 %(function_dispatch)s
+#endif
+
+    // Local variable initialization
+%(function_var_inits)s
 
     // Actual function code.
 %(function_body)s
 
 %(generator_exit)s
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+%(function_heap_release)s
+#endif
 }
 """
 
@@ -94,7 +113,11 @@ template_generator_return_exit = """\
     // The above won't return, but we need to make it clear to the compiler
     // as well, or else it will complain and/or generate inferior code.
     assert(false);
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    return NULL;
+#else
     return;
+#endif
 
     function_return_exit:
 #if PYTHON_VERSION >= 330
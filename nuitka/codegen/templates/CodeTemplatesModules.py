@@ -42,7 +42,7 @@ template_global_copyright = """\
  */
 """
 template_module_body_template = """
-#include "nuitka/prelude.h"
+%(module_split_define)s#include "nuitka/prelude.h"
 
 #include "__helpers.h"
 
@@ -186,6 +186,10 @@ MOD_INIT_DECL( %(module_identifier)s )
     patchInspectModule();
 #endif
 
+#if _NUITKA_INSTRUMENTATION
+    registerInstrumentationDump( "%(module_name)s" );
+#endif
+
 #endif
 
     /* The constants only used by this module are created now. */
@@ -266,6 +270,40 @@ MOD_INIT_DECL( %(module_identifier)s )
 %(module_exit)s
 """
 
+template_module_split_define = """\
+/* The functions of this module are split into multiple files. */
+#define _NUITKA_SPLIT_MODULE
+
+"""
+
+template_module_split_header_template = """\
+/* Declarations shared by the files of the split module '%(module_name)s'. */
+
+extern PyObject *module_%(module_identifier)s;
+extern PyDictObject *moduledict_%(module_identifier)s;
+
+/* The module constants used. */
+%(constant_decl_codes)s
+
+// The module code objects.
+%(module_code_objects_decl)s
+
+// The module function declarations.
+%(module_functions_decl)s
+"""
+
+template_module_split_body_template = """
+#define _NUITKA_SPLIT_MODULE
+#include "nuitka/prelude.h"
+
+#include "__helpers.h"
+
+#include "%(module_split_header)s"
+
+// The module function definitions.
+%(module_functions_code)s
+"""
+
 template_module_exception_exit = """\
     module_exception_exit:
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
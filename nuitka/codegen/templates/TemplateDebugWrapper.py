@@ -59,6 +59,9 @@ def enableDebug(globals_dict):
             except KeyError as e:
                 raise KeyError(self.name, *e.args)
 
+        def __radd__(self, other):
+            return TemplateWrapper(self.name, other + self.value)
+
         def split(self, sep):
             return self.value.split(sep)
 
@@ -22,11 +22,19 @@ can be computed here, so the code generation can be quick and doesn't have to
 check it many times.
 
 """
+from nuitka import Options
 from nuitka.tree import Operations
 
+from .FinalizeLazyImports import FinalizeLazyImports
 from .FinalizeMarkups import FinalizeMarkups
 
 
 def prepareCodeGeneration(tree):
     visitor = FinalizeMarkups()
     Operations.visitTree(tree, visitor)
+
+    if Options.shallUseLazyImports():
+        visitor = FinalizeLazyImports()
+        Operations.visitTree(tree, visitor)
+
+        visitor.markLazyImports()
@@ -0,0 +1,243 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Finalize lazy imports
+
+For "--lazy-imports" mode, decide which module level imports can bind a lazy
+module object, that does the import only when an attribute of it is used for
+the first time.
+
+These are plain "import x" statements on the top level of the module, i.e. not
+in a "try" block, where the import is known to find a module, and the variable
+is only ever used to look up attributes, and assigned nowhere else.
+
+Deferring an import also defers what the imported module does at import time.
+Therefore only modules, that are compiled as part of the program, and whose
+module level code is known to have no side effects, are imported lazily. That
+is assignments of values without side effects, e.g. constants and functions,
+and imports of modules that qualify themselves.
+
+"""
+
+from nuitka import ModuleRegistry
+
+from .FinalizeBase import FinalizationVisitorBase
+
+def _isModuleLevelStatement(node):
+    parent = node.getParent()
+
+    while not parent.isCompiledPythonModule():
+        if not parent.isStatementsSequence() and \
+           not parent.isStatementsFrameModule():
+            return False
+
+        parent = parent.getParent()
+
+    return True
+
+
+def _isLazyImportCandidate(node):
+    if not node.isStatementAssignmentVariable():
+        return False
+
+    import_node = node.getAssignSource()
+
+    if not import_node.isExpressionBuiltinImport():
+        return False
+
+    # Not found modules must raise at the import, and built-in modules are
+    # cheap to import anyway.
+    if import_node.finding in ("not-found", "built-in") or \
+       not import_node.recurse_attempted:
+        return False
+
+    module_name = import_node.getImportName()
+
+    if not module_name.isExpressionConstantRef() or \
+       type(module_name.getConstant()) is not str:
+        return False
+
+    from_list = import_node.getFromList()
+
+    if not from_list.isExpressionConstantRef() or \
+       from_list.getConstant() is not None:
+        return False
+
+    if not node.getVariable().isModuleVariable():
+        return False
+
+    return _isModuleLevelStatement(node)
+
+
+def _getImportedModuleNames(import_node):
+    """ Names of all modules an import executes, parent packages first. """
+
+    if import_node.finding == "built-in":
+        return ()
+
+    if import_node.imported_module is None:
+        return None
+
+    parts = import_node.imported_module.getFullName().split('.')
+
+    return tuple(
+        '.'.join(parts[:count+1])
+        for count in
+        range(len(parts))
+    ) + tuple(import_node.import_list_modules)
+
+
+class _ModuleSideEffectsChecker(object):
+    def __init__(self):
+        # Results per module name, for modules under check, no side effects
+        # are assumed, as an import cycle adds nothing new.
+        self.results = {}
+
+    def importHasSideEffects(self, import_node):
+        module_names = _getImportedModuleNames(import_node)
+
+        if module_names is None:
+            return True
+
+        for module_name in module_names:
+            if self.moduleHasSideEffects(module_name):
+                return True
+
+        return False
+
+    def moduleHasSideEffects(self, module_name):
+        if module_name not in self.results:
+            module = ModuleRegistry.getModuleByName(module_name)
+
+            if module is None or not module.isCompiledPythonModule():
+                self.results[module_name] = True
+            else:
+                self.results[module_name] = False
+                self.results[module_name] = self._statementsHaveSideEffects(
+                    module.getBody().getStatements()
+                )
+
+        return self.results[module_name]
+
+    def _statementsHaveSideEffects(self, statements):
+        for statement in statements:
+            if self._statementHasSideEffects(statement):
+                return True
+
+        return False
+
+    def _statementHasSideEffects(self, statement):
+        # Return driven, pylint: disable=too-many-return-statements
+
+        if statement.isStatementsSequence() or \
+           statement.isStatementsFrameModule():
+            return self._statementsHaveSideEffects(statement.getStatements())
+
+        if statement.isStatementReleaseVariable():
+            return not statement.getVariable().isTempVariable()
+
+        if statement.isStatementExpressionOnly():
+            return self._expressionHasSideEffects(statement.getExpression())
+
+        if statement.isStatementAssignmentVariable():
+            return self._expressionHasSideEffects(statement.getAssignSource())
+
+        return True
+
+    def _expressionHasSideEffects(self, expression):
+        if expression.isExpressionBuiltinImport():
+            return self.importHasSideEffects(expression)
+
+        if expression.isExpressionImportName():
+            return self._expressionHasSideEffects(expression.getModule())
+
+        # The module loader and spec, set up by every module.
+        if expression.isExpressionModuleLoaderRef():
+            return False
+
+        if expression.isExpressionCallNoKeywords():
+            called = expression.getCalled()
+
+            if called.isExpressionImportModuleNameHard() and \
+               called.getModuleName() == "importlib._bootstrap" and \
+               called.getImportName() == "ModuleSpec":
+                return False
+
+        if expression.isExpressionFunctionCreation():
+            # The defaults are computed when the function is created.
+            for default in expression.getDefaults():
+                if default.mayHaveSideEffects():
+                    return True
+
+            kw_defaults = expression.getKwDefaults()
+
+            if kw_defaults is not None and kw_defaults.mayHaveSideEffects():
+                return True
+
+            annotations = expression.getAnnotations()
+
+            if annotations is not None and annotations.mayHaveSideEffects():
+                return True
+
+        return expression.mayHaveSideEffects()
+
+
+class FinalizeLazyImports(FinalizationVisitorBase):
+    def __init__(self):
+        # Candidate statements by the variable they assign.
+        self.candidates = {}
+
+        # Variables used for other things than attribute look-ups.
+        self.other_used = set()
+
+        # Variables assigned or deleted by other statements.
+        self.other_assigned = set()
+
+    def onEnterNode(self, node):
+        if _isLazyImportCandidate(node):
+            self.candidates.setdefault(node.getVariable(), []).append(node)
+        elif node.isStatementAssignmentVariable() or \
+             node.isStatementDelVariable():
+            self.other_assigned.add(node.getVariable())
+        elif node.isExpressionVariableRef():
+            parent = node.getParent()
+
+            if not parent.isExpressionAttributeLookup() or \
+               parent.getLookupSource() is not node:
+                self.other_used.add(node.getVariable())
+        elif node.isExpressionLocalsVariableRef():
+            self.other_used.add(node.getFallbackVariable())
+
+    def markLazyImports(self):
+        checker = _ModuleSideEffectsChecker()
+
+        for variable, statements in self.candidates.items():
+            if variable in self.other_used or \
+               variable in self.other_assigned:
+                continue
+
+            # Several imports binding the same name, e.g. "import a.b" and
+            # "import a.c", would each replace the lazy object of the other.
+            if len(statements) > 1:
+                continue
+
+            import_node = statements[0].getAssignSource()
+
+            if checker.importHasSideEffects(import_node):
+                continue
+
+            import_node.markAsLazy(variable.getName())
@@ -217,33 +217,77 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
-def _detectImports(command, user_provided, technical):
-    # This is pretty complicated stuff, with variants to deal with.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+def _getImportDetectionsCacheFilename(command):
+    hashed_value = command + sys.version + sys.executable
 
-    # Print statements for stuff to show, the modules loaded.
-    if python_version >= 300:
-        command += '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + ' \
-                   'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and ' \
-                   'module.__file__ != "<frozen>")), file = sys.stderr)'  # do not read it
+    # Installing or removing modules in the standard library changes the
+    # modification times of its directories.
+    for stdlib_dir in sorted(getStandardLibraryPaths()):
+        if os.path.isdir(stdlib_dir):
+            hashed_value += "%s:%r" % (stdlib_dir, os.path.getmtime(stdlib_dir))
 
-    reduced_path = [
-        path_element
-        for path_element in
-        sys.path
-        if not areSamePaths(
-            path_element,
-            '.'
-        )
-        if not areSamePaths(
-            path_element,
-            os.path.dirname(sys.modules["__main__"].__file__)
+    hashed_value += repr(os.path.getmtime(sys.executable))
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(
+        getCacheDir(),
+        "import_detections",
+    )
+
+    makePath(cache_dir)
+
+    return os.path.join(
+        cache_dir,
+        hashlib.md5(hashed_value).hexdigest()
+    )
+
+
+def _readImportDetectionsCache(cache_filename):
+    if not os.path.exists(cache_filename):
+        return None
+
+    detections = []
+
+    for line in open(cache_filename):
+        module_name, prio, kind, filename = line.rstrip("\n").split("\t")
+
+        # Cheap validation, files removed since, make the cache unusable.
+        if not os.path.exists(filename):
+            return None
+
+        detections.append(
+            (module_name, int(prio), kind, filename)
         )
-    ]
 
-    # Make sure the right import path (the one Nuitka binary is running with)
-    # is used.
-    command = ("import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)) + command
+    return detections
+
+
+def _writeImportDetectionsCache(cache_filename, detections):
+    with open(cache_filename, 'w') as cache_file:
+        for detection in detections:
+            cache_file.write("%s\t%d\t%s\t%s\n" % detection)
+
+
+def _detectImportsDetections(command):
+    """ Run CPython on the command, and report the modules it imported.
+
+        This only depends on the Python installation, and therefore it's
+        cached, as it can take a long time to do.
+    """
+
+    # This is pretty complicated stuff, with variants to deal with.
+    # pylint: disable=too-many-branches
+
+    cache_filename = _getImportDetectionsCacheFilename(command)
+
+    detections = _readImportDetectionsCache(cache_filename)
+
+    if detections is not None:
+        debug("Using cached import detections from '%s'.", cache_filename)
+
+        return detections
 
     import tempfile
     tmp_file, tmp_filename = tempfile.mkstemp()
@@ -270,8 +314,6 @@ def _detectImports(command, user_provided, technical):
             Tracing.printError(line)
         sys.exit("Error, please report the issue with above output.")
 
-    result = []
-
     debug("Detecting imports:")
 
     detections = []
@@ -341,6 +383,40 @@ def _detectImports(command, user_provided, technical):
                     (module_name, 1, "shlib", filename)
                 )
 
+    _writeImportDetectionsCache(cache_filename, detections)
+
+    return detections
+
+
+def _detectImports(command, user_provided, technical):
+    # Print statements for stuff to show, the modules loaded.
+    if python_version >= 300:
+        command += '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + ' \
+                   'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and ' \
+                   'module.__file__ != "<frozen>")), file = sys.stderr)'  # do not read it
+
+    reduced_path = [
+        path_element
+        for path_element in
+        sys.path
+        if not areSamePaths(
+            path_element,
+            '.'
+        )
+        if not areSamePaths(
+            path_element,
+            os.path.dirname(sys.modules["__main__"].__file__)
+        )
+    ]
+
+    # Make sure the right import path (the one Nuitka binary is running with)
+    # is used.
+    command = ("import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)) + command
+
+    result = []
+
+    detections = _detectImportsDetections(command)
+
     for module_name, _prio, kind, filename in sorted(detections):
         if kind == "precompiled":
             _detectedPrecompiledFile(
@@ -47,7 +47,6 @@ from nuitka.containers.oset import OrderedSet
 from nuitka.importing import StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
-from nuitka.utils.FileOperations import listDir
 
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 from .Whitelisting import isWhiteListedNotExistingModule
@@ -304,8 +303,51 @@ def findModule(importing, module_name, parent_package, level, warn):
     return None, None, "not-found"
 
 
-# Some platforms are case insensitive.
-case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+# Directory contents, shared by all module lookups, "None" for things that are
+# not directories. Listing a directory once is much cheaper than checking each
+# possible file name in it, and it gives exact casing for free.
+_directory_entries_cache = {}
+
+# Statistic, how many file system queries module finding did.
+_file_system_query_count = 0
+
+def _getDirectoryEntries(dirname):
+    # Counting the queries, pylint: disable=global-statement
+    global _file_system_query_count
+
+    if dirname not in _directory_entries_cache:
+        _file_system_query_count += 1
+
+        try:
+            entries = frozenset(os.listdir(dirname or os.curdir))
+        except OSError:
+            entries = None
+
+        _directory_entries_cache[dirname] = entries
+
+    return _directory_entries_cache[dirname]
+
+
+def _isFileEntry(dirname, filename):
+    # Counting the queries, pylint: disable=global-statement
+    global _file_system_query_count
+
+    entries = _getDirectoryEntries(dirname)
+
+    if entries is None or filename not in entries:
+        return False
+
+    # Only names that exist get checked, to exclude directories.
+    _file_system_query_count += 1
+
+    return os.path.isfile(os.path.join(dirname, filename))
+
+
+def getFileSystemQueryCount():
+    """ Statistic, how many file system queries module finding did. """
+
+    return _file_system_query_count
+
 
 def _findModuleInPath2(module_name, search_path):
     """ This is out own module finding low level implementation.
@@ -314,15 +356,18 @@ def _findModuleInPath2(module_name, search_path):
         tasked to raise "ImportError" or return a path if it finds it, or
         None, if it is a built-in.
     """
-    # We have many branches here, because there are a lot of cases to try.
-    # pylint: disable=too-many-branches
-
     # We may have to decide between package and module, therefore build
     # a list of candidates.
     candidates = OrderedSet()
 
     considered = set()
 
+    suffixes = [
+        suffix
+        for suffix, _mode, _type in
+        imp.get_suffixes()
+    ]
+
     for entry in search_path:
         # Don't try again, just with an entry of different casing or complete
         # duplicate.
@@ -330,17 +375,21 @@ def _findModuleInPath2(module_name, search_path):
             continue
         considered.add(os.path.normcase(entry))
 
+        # Directory listings contain the exact casing only, so there is no
+        # need to check for case insensitive matches anymore.
+        entries = _getDirectoryEntries(entry)
+
+        if entries is None:
+            continue
+
         package_directory = os.path.join(entry, module_name)
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        if module_name in entries and \
+           _getDirectoryEntries(package_directory) is not None:
             for suffix in (".py", ".pyc"):
-                package_file_name = "__init__" + suffix
-
-                file_path = os.path.join(package_directory, package_file_name)
-
-                if os.path.isfile(file_path):
+                if _isFileEntry(package_directory, "__init__" + suffix):
                     candidates.add(
                         (entry, 1, package_directory)
                     )
@@ -352,11 +401,10 @@ def _findModuleInPath2(module_name, search_path):
                     )
 
         # Then, check out suffixes of all kinds.
-        for suffix, _mode, _type in imp.get_suffixes():
-            file_path = os.path.join(entry, module_name + suffix)
-            if os.path.isfile(file_path):
+        for suffix in suffixes:
+            if _isFileEntry(entry, module_name + suffix):
                 candidates.add(
-                    (entry, 1, file_path)
+                    (entry, 1, os.path.join(entry, module_name + suffix))
                 )
                 break
 
@@ -374,17 +422,7 @@ def _findModuleInPath2(module_name, search_path):
             if candidate[1] == min_prio
         ]
 
-        # On case sensitive systems, no resolution needed.
-        if case_sensitive:
-            return candidates[0][2]
-        else:
-            for candidate in candidates:
-                for fullname, _filename in listDir(candidate[0]):
-                    if fullname == candidate[2]:
-                        return candidate[2]
-
-            # Only exact case matches matter, all candidates were ignored,
-            # lets just fall through to raising the import error.
+        return candidates[0][2]
 
     # Nothing found.
     raise ImportError
@@ -36,6 +36,7 @@ and annotation is happening in the nodes that implement these compute slots.
 
 from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
 
+from .ContainerOperationNodes import ExpressionListOperationAppend
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
 from .NodeMakingHelpers import wrapExpressionWithNodeSideEffects
@@ -218,6 +219,44 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
             trace_collection = trace_collection
         )
 
+    def computeExpressionCall(self, call_node, call_args, call_kw,
+                              trace_collection):
+        source = self.getLookupSource()
+
+        if self.attribute_name == "append" and \
+           source.isExpressionVariableRef() and \
+           source.hasShapeListExact() and \
+           call_kw is None and \
+           call_args is not None and \
+           (call_args.isExpressionMakeTuple() or \
+            call_args.isExpressionConstantRef()) and \
+           call_args.getIterationLength() == 1:
+            value, = call_args.getIterationValues()
+
+            # The value is computed after the list variable was referenced, so
+            # it must not be able to change that variable.
+            variable = source.getVariable()
+
+            if not value.mayHaveSideEffects() or \
+               (variable.isLocalVariable() and \
+                variable.isSharedTechnically() is False):
+                result = ExpressionListOperationAppend(
+                    list_arg   = source,
+                    value      = value,
+                    source_ref = call_node.getSourceReference()
+                )
+
+                return result, "new_expression", """\
+Call to 'append' of list lowered to list append."""
+
+        return ExpressionChildrenHavingBase.computeExpressionCall(
+            self,
+            call_node        = call_node,
+            call_args        = call_args,
+            call_kw          = call_kw,
+            trace_collection = trace_collection
+        )
+
     def mayRaiseException(self, exception_type):
         return self.getLookupSource().mayRaiseExceptionAttributeLookup(
             exception_type = exception_type,
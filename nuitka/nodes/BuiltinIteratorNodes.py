@@ -39,12 +39,33 @@ from .NodeMakingHelpers import (
     makeRaiseExceptionReplacementStatement,
     wrapExpressionWithSideEffects
 )
+from .shapes.BuiltinTypeShapes import ShapeTypeList, ShapeTypeTuple
 from .shapes.StandardShapes import ShapeIterator
 
 
 class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
     kind = "EXPRESSION_BUILTIN_ITER1"
 
+    def __init__(self, value, source_ref, loop_iterator = False):
+        ExpressionBuiltinSingleArgBase.__init__(
+            self,
+            value      = value,
+            source_ref = source_ref
+        )
+
+        # Iterators of loops, contractions and unpacking only live in
+        # temporary variables, and are never visible to the program.
+        self.loop_iterator = loop_iterator
+
+    def getDetails(self):
+        return {
+            "loop_iterator" : self.loop_iterator
+        }
+
+    def isLoopIterator(self):
+        """ Is this iterator only used by a re-formulation, never visible. """
+        return self.loop_iterator
+
     def computeExpression(self, trace_collection):
         trace_collection.initIteratorValue(self)
         value = self.getValue()
@@ -55,7 +76,10 @@ class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
         )
 
     def computeExpressionIter1(self, iter_node, trace_collection):
-        # Iteration over an iterator is that iterator.
+        # Iteration over an iterator is that iterator. It then takes the
+        # place of the iterator node, including its role.
+        if iter_node.isLoopIterator():
+            self.loop_iterator = True
 
         return (
             self,
@@ -66,6 +90,10 @@ class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
     def getTypeShape(self):
         return self.getValue().getTypeShape().getShapeIter()
 
+    def isIteratingListOrTuple(self):
+        """ Is the iterated value known to be an exact list or tuple. """
+        return self.getValue().getTypeShape() in (ShapeTypeList, ShapeTypeTuple)
+
     def computeExpressionNext1(self, next_node, trace_collection):
         value = self.getValue()
 
@@ -27,6 +27,16 @@ from .NodeMakingHelpers import (
     makeConstantReplacementNode,
     wrapExpressionWithSideEffects
 )
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeStr
+)
+
+# Operand shapes for which rich comparisons are done inline by the generated
+# code, cannot raise, and give a "bool" result.
+_inline_comparison_shapes = (ShapeTypeInt, ShapeTypeFloat, ShapeTypeStr)
 
 
 class ExpressionComparisonBase(ExpressionChildrenHavingBase):
@@ -138,6 +148,62 @@ class ExpressionComparison(ExpressionComparisonBase):
             source_ref = source_ref
         )
 
+        # Decided when computing, as only then the operands have their
+        # shapes, until then the generic comparison is assumed.
+        self.inline_shape = None
+
+    def _computeInlineOperandShape(self):
+        """ Shape of both operands, if these can be compared inline. """
+
+        left_shape = self.getLeft().getTypeShape()
+
+        if left_shape in _inline_comparison_shapes and \
+           self.getRight().getTypeShape() is left_shape:
+            return left_shape
+        else:
+            return None
+
+    def getTypeShape(self):
+        if self.inline_shape is not None:
+            return ShapeTypeBool
+        else:
+            return ExpressionComparisonBase.getTypeShape(self)
+
+    def mayRaiseException(self, exception_type):
+        if self.inline_shape is not None:
+            return self.getLeft().mayRaiseException(exception_type) or \
+                   self.getRight().mayRaiseException(exception_type)
+        else:
+            return ExpressionComparisonBase.mayRaiseException(
+                self,
+                exception_type = exception_type
+            )
+
+    def mayRaiseExceptionBool(self, exception_type):
+        if self.inline_shape is not None:
+            return False
+        else:
+            return ExpressionComparisonBase.mayRaiseExceptionBool(
+                self,
+                exception_type = exception_type
+            )
+
+    def computeExpression(self, trace_collection):
+        left = self.getLeft()
+        right = self.getRight()
+
+        self.inline_shape = self._computeInlineOperandShape()
+
+        # Comparing these runs no code of the program, so there is no escape.
+        if self.inline_shape is not None and \
+           not (left.isCompileTimeConstant() and right.isCompileTimeConstant()):
+            return self, None, None
+
+        return ExpressionComparisonBase.computeExpression(
+            self,
+            trace_collection = trace_collection
+        )
+
 
 class ExpressionComparisonIsIsNotBase(ExpressionComparisonBase):
     def __init__(self, left, right, comparator, source_ref):
@@ -156,6 +222,10 @@ class ExpressionComparisonIsIsNotBase(ExpressionComparisonBase):
     def getDetails(self):
         return {}
 
+    @staticmethod
+    def getTypeShape():
+        return ShapeTypeBool
+
     def mayRaiseException(self, exception_type):
         return self.getLeft().mayRaiseException(exception_type) or \
                self.getRight().mayRaiseException(exception_type)
@@ -23,6 +23,21 @@ from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeNoneType
+)
+
+# Index shapes that list operations handle directly, without running any code.
+list_index_shapes = (
+    ShapeTypeBool,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong
+)
 
 
 class StatementListOperationAppend(StatementChildrenHavingBase):
@@ -63,6 +78,102 @@ class StatementListOperationAppend(StatementChildrenHavingBase):
         return self, None, None
 
 
+class ExpressionListOperationAppend(ExpressionChildrenHavingBase):
+    """ Append to a list, with the "None" result of "list.append" as value.
+
+        Typically from code like this: x.append(y)
+    """
+
+    kind = "EXPRESSION_LIST_OPERATION_APPEND"
+
+    named_children = (
+        "list",
+        "value"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, list_arg, value, source_ref):
+        assert list_arg is not None
+        assert value is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "list"  : list_arg,
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getList = ExpressionChildrenHavingBase.childGetter("list")
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def computeExpression(self, trace_collection):
+        # Appending to an exact list cannot run any code, so unlike the
+        # method call, this keeps knowledge about all variables.
+        trace_collection.removeKnowledge(self.getList())
+
+        return self, None, None
+
+    def computeExpressionDrop(self, statement, trace_collection):
+        result = StatementListOperationAppend(
+            list_arg   = self.getList(),
+            value      = self.getValue(),
+            source_ref = self.source_ref
+        )
+
+        return result, "new_statements", """\
+Removed unused result of list append."""
+
+    @staticmethod
+    def getTypeShape():
+        return ShapeTypeNoneType
+
+    def mayRaiseException(self, exception_type):
+        return self.getList().mayRaiseException(exception_type) or \
+               self.getValue().mayRaiseException(exception_type)
+
+
+class ExpressionListOperationLen(ExpressionChildrenHavingBase):
+    """ Length of a list, as with "len" but without going through slots.
+
+        Typically from code like this: len(x)
+    """
+
+    kind = "EXPRESSION_LIST_OPERATION_LEN"
+
+    named_children = (
+        "list",
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, list_arg, source_ref):
+        assert list_arg is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "list" : list_arg,
+            },
+            source_ref = source_ref
+        )
+
+    getList = ExpressionChildrenHavingBase.childGetter("list")
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    @staticmethod
+    def getTypeShape():
+        return ShapeTypeIntOrLong
+
+    def mayHaveSideEffects(self):
+        return self.getList().mayHaveSideEffects()
+
+    def mayRaiseException(self, exception_type):
+        return self.getList().mayRaiseException(exception_type)
+
+
 class ExpressionListOperationExtend(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_LIST_OPERATION_EXTEND"
 
@@ -123,6 +234,88 @@ class ExpressionListOperationPop(ExpressionChildrenHavingBase):
         return self, None, None
 
 
+class ExpressionListOperationGet(ExpressionChildrenHavingBase):
+    kind = "EXPRESSION_LIST_OPERATION_GET"
+
+    named_children = (
+        "list",
+        "index"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, list_arg, index, source_ref):
+        assert list_arg is not None
+        assert index is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "list"  : list_arg,
+                "index" : index
+            },
+            source_ref = source_ref
+        )
+
+    getList = ExpressionChildrenHavingBase.childGetter("list")
+    getIndex = ExpressionChildrenHavingBase.childGetter("index")
+
+    def computeExpression(self, trace_collection):
+        # Non-integer indexes go the generic way and can run any code, and
+        # integer ones may still be out of range.
+        if self.getIndex().getTypeShape() not in list_index_shapes:
+            trace_collection.onControlFlowEscape(self)
+
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class StatementListOperationSet(StatementChildrenHavingBase):
+    kind = "STATEMENT_LIST_OPERATION_SET"
+
+    named_children = (
+        "value",
+        "list",
+        "index"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, list_arg, index, value, source_ref):
+        assert list_arg is not None
+        assert index is not None
+        assert value is not None
+
+        StatementChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "list"  : list_arg,
+                "index" : index,
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getList = StatementChildrenHavingBase.childGetter("list")
+    getIndex = StatementChildrenHavingBase.childGetter("index")
+    getValue = StatementChildrenHavingBase.childGetter("value")
+
+    def computeStatement(self, trace_collection):
+        result, change_tags, change_desc = self.computeStatementSubExpressions(
+            trace_collection = trace_collection
+        )
+
+        if result is not self:
+            return result, change_tags, change_desc
+
+        # Releasing the replaced element can run any code, and the index may
+        # be out of range.
+        trace_collection.onControlFlowEscape(self)
+
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
 class StatementSetOperationAdd(StatementChildrenHavingBase):
     kind = "STATEMENT_SET_OPERATION_ADD"
 
@@ -560,3 +560,117 @@ class ExpressionDictOperationNOTIn(ExpressionChildrenHavingBase):
         trace_collection.onExceptionRaiseExit(BaseException)
 
         return self, None, None
+
+
+class ExpressionDictOperationItemsIter(ExpressionChildrenHavingBase):
+    """ Iterator for "for key, value in d.items()" loops.
+
+        Exact dictionaries are iterated directly, for other values, the
+        method is called, and the items given are unpacked.
+    """
+
+    kind = "EXPRESSION_DICT_OPERATION_ITEMS_ITER"
+
+    named_children = (
+        "dict",
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, dict_arg, method_name, source_ref):
+        assert dict_arg is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "dict" : dict_arg,
+            },
+            source_ref = source_ref
+        )
+
+        self.method_name = method_name
+
+    def getDetails(self):
+        return {
+            "method_name" : self.method_name
+        }
+
+    def getMethodName(self):
+        return self.method_name
+
+    getDict = ExpressionChildrenHavingBase.childGetter("dict")
+
+    def computeExpression(self, trace_collection):
+        if not self.getDict().hasShapeDictionaryExact():
+            # The method call could do anything.
+            trace_collection.onControlFlowEscape(self)
+
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        dict_arg = self.getDict()
+
+        return dict_arg.mayRaiseException(exception_type) or \
+               not dict_arg.hasShapeDictionaryExact()
+
+
+class ExpressionDictOperationItemsIterNextKey(ExpressionChildrenHavingBase):
+    """ Key of the next item of a "for key, value in d.items()" loop.
+
+        Signals the end like "next" does, with "StopIteration".
+    """
+
+    kind = "EXPRESSION_DICT_OPERATION_ITEMS_ITER_NEXT_KEY"
+
+    named_children = (
+        "iterator",
+    )
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "iterator" : iterator,
+            },
+            source_ref = source_ref
+        )
+
+    getIterator = ExpressionChildrenHavingBase.childGetter("iterator")
+
+    def computeExpression(self, trace_collection):
+        # Items of other objects than dictionaries could run any code.
+        trace_collection.onControlFlowEscape(self)
+
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionDictOperationItemsIterValue(ExpressionChildrenHavingBase):
+    """ Value of the item, whose key was given last.
+
+    """
+
+    kind = "EXPRESSION_DICT_OPERATION_ITEMS_ITER_VALUE"
+
+    named_children = (
+        "iterator",
+    )
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "iterator" : iterator,
+            },
+            source_ref = source_ref
+        )
+
+    getIterator = ExpressionChildrenHavingBase.childGetter("iterator")
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.getIterator().mayRaiseException(exception_type)
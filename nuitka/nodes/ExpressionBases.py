@@ -37,6 +37,7 @@ from .NodeMakingHelpers import (
 )
 from .shapes.BuiltinTypeShapes import (
     ShapeTypeDict,
+    ShapeTypeList,
     ShapeTypeStr,
     ShapeTypeUnicode
 )
@@ -585,6 +586,12 @@ class ExpressionBase(NodeBase):
 
         return self.getTypeShape() is ShapeTypeDict
 
+    def hasShapeListExact(self):
+        """ Does an expression have exactly a list shape.
+
+        """
+        return self.getTypeShape() is ShapeTypeList
+
     def hasShapeStrExact(self):
         """ Does an expression have exactly a string shape.
 
@@ -30,8 +30,71 @@ from nuitka.PythonVersions import python_version
 
 from .CodeObjectSpecs import CodeObjectSpec
 from .FutureSpecs import fromFlags
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeBytes,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeNoneType,
+    ShapeTypeStr,
+    ShapeTypeUnicode
+)
 from .StatementNodes import StatementsSequence
 
+# Operations on values of these shapes can raise, but never run user code.
+_number_shapes = (
+    ShapeTypeBool,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeNoneType
+)
+
+# Operations of these shapes with each other may give warnings, that can be
+# hooked, so they are only good when the operands all have the same shape.
+_string_shapes = (
+    ShapeTypeBytes,
+    ShapeTypeStr,
+    ShapeTypeUnicode
+)
+
+
+def _mayRunUserCode(expression):
+    if expression.isExpressionVariableRef() or \
+       expression.isExpressionTempVariableRef() or \
+       expression.isExpressionConstantRef():
+        return False
+
+    if expression.isExpressionComparisonIs() or \
+       expression.isExpressionComparisonIsNOT():
+        # Identity checks do not care about shapes.
+        pass
+    elif expression.isExpressionOperationBinary() or \
+         expression.isExpressionOperationUnary() or \
+         expression.isExpressionComparison() or \
+         expression.isExpressionComparisonIn() or \
+         expression.isExpressionComparisonNOTIn():
+        shapes = set(
+            operand.getTypeShape()
+            for operand in
+            expression.getOperands()
+        )
+
+        if not shapes.issubset(_number_shapes) and \
+           (len(shapes) != 1 or not shapes.issubset(_string_shapes)):
+            return True
+    else:
+        return True
+
+    for operand in expression.getOperands():
+        if _mayRunUserCode(operand):
+            return True
+
+    return False
+
 
 def checkFrameStatements(value):
     """ Check that frames statements list value proper.
@@ -304,6 +367,30 @@ class StatementsFrameFunction(StatementsFrameBase):
     def hasStructureMember():
         return False
 
+    def isLazyFrameCandidate(self):
+        """ Can the frame be created only when an exception escapes it.
+
+        That is possible, when nothing but the exception raise itself could
+        observe the frame, e.g. when only returning values of variables, that
+        may be unassigned, or operations on them, which cannot run any user
+        code due to their shapes.
+        """
+
+        if self.needsFrameExceptionPreserving():
+            return False
+
+        for statement in self.getStatements():
+            if not statement.needsFrame():
+                continue
+
+            if not statement.isStatementReturn():
+                return False
+
+            if _mayRunUserCode(statement.getExpression()):
+                return False
+
+        return True
+
 
 class StatementsFrameGenerator(StatementsFrameBase):
     kind = "STATEMENTS_FRAME_GENERATOR"
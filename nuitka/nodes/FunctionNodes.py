@@ -31,7 +31,7 @@ classes.
 
 from nuitka import Options, Variables
 from nuitka.PythonVersions import python_version
-from nuitka.tree.Extractions import updateVariableUsage
+from nuitka.tree.Extractions import getFunctionRefs, updateVariableUsage
 
 from .Checkers import checkStatementsSequenceOrNone
 from .CodeObjectSpecs import CodeObjectSpec
@@ -854,15 +854,39 @@ class ExpressionFunctionRef(ExpressionBase):
         from nuitka.ModuleRegistry import addUsedModule
         addUsedModule(owning_module)
 
+        # Helper functions from the internal module depend on nothing but
+        # their arguments, once optimized without change, they are final. The
+        # functions they use, e.g. other helpers, still need to be marked.
+        function_refs = function_body.getFinishedFunctionRefs()
+
+        if function_refs is not None:
+            if function_body not in owning_module.getUsedFunctions():
+                owning_module.addUsedFunction(function_body)
+
+                for function_ref in function_refs:
+                    function_ref.computeExpressionRaw(trace_collection)
+
+            return self, None, None
+
         owning_module.addUsedFunction(function_body)
 
-        from nuitka.optimizations.TraceCollections import \
-            TraceCollectionFunction
+        # Functions with multiple references, e.g. the helper functions used
+        # for complex calls, need to be computed only once per module pass.
+        # The next pass will pick up any changes.
+        old_collection = function_body.getTraceCollection()
+
+        if old_collection is not None and \
+           old_collection.getModuleTraceCollection() is \
+           trace_collection.getModuleTraceCollection():
+            return self, None, None
+
+        from nuitka.optimizations.TraceCollections import (
+            TraceCollectionFunction,
+            getChangeCount
+        )
+
+        change_count = getChangeCount()
 
-        # TODO: Doesn't this mean, we can do this multiple times by doing it
-        # in the reference. We should do it in the body, and there we should
-        # limit us to only doing it once per module run, e.g. being based on
-        # presence in used functions of the module already.
         trace_collection = TraceCollectionFunction(
             parent        = trace_collection,
             function_body = function_body
@@ -886,6 +910,13 @@ class ExpressionFunctionRef(ExpressionBase):
 
         trace_collection.updateVariablesFromCollection(old_collection)
 
+        if owning_module.isInternalModule() and \
+           Variables.complete and \
+           change_count == getChangeCount():
+            function_body.markAsOptimizationFinished(
+                getFunctionRefs(function_body)
+            )
+
         # TODO: Function collection may now know something.
         return self, None, None
 
@@ -169,6 +169,9 @@ class ExpressionBuiltinImport(ExpressionChildrenHavingBase):
 
         self.builtin_module = None
 
+        # For lazy imports, the variable name the import is bound to.
+        self.lazy_variable_name = None
+
     getImportName = ExpressionChildrenHavingBase.childGetter("name")
     getFromList = ExpressionChildrenHavingBase.childGetter("fromlist")
     getGlobals = ExpressionChildrenHavingBase.childGetter("globals")
@@ -381,6 +384,15 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
 
     # TODO: Add computeExpressionImportName
 
+    def markAsLazy(self, variable_name):
+        self.lazy_variable_name = variable_name
+
+    def isLazy(self):
+        return self.lazy_variable_name is not None
+
+    def getLazyVariableName(self):
+        return self.lazy_variable_name
+
     def mayRaiseException(self, exception_type):
         return self.finding != "built-in"
 
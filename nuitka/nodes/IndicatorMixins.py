@@ -88,6 +88,10 @@ class EntryPointMixin(object):
     def __init__(self):
         self.trace_collection = None
 
+        # When computing again cannot change anything anymore, the function
+        # references it contains, otherwise None.
+        self.finished_function_refs = None
+
     def setTraceCollection(self, trace_collection):
         previous = self.trace_collection
         self.trace_collection = trace_collection
@@ -95,3 +99,12 @@ class EntryPointMixin(object):
 
     def getTraceCollection(self):
         return self.trace_collection
+
+    def markAsOptimizationFinished(self, function_refs):
+        self.finished_function_refs = function_refs
+
+    def markAsOptimizationUnfinished(self):
+        self.finished_function_refs = None
+
+    def getFinishedFunctionRefs(self):
+        return self.finished_function_refs
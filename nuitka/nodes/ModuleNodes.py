@@ -284,7 +284,7 @@ class CompiledPythonModule(ChildrenHavingMixin, ClosureGiverNodeMixin,
         for function_body in self.active_functions:
             trace_collection = function_body.trace_collection
 
-            for (_variable, _version), variable_trace in trace_collection.getVariableTracesAll().items():
+            for variable_trace in trace_collection.getVariableTracesAll():
                 node = makeTraceNodeName(variable_trace)
 
                 previous = variable_trace.getPrevious()
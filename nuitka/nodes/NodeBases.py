@@ -659,19 +659,20 @@ class ChildrenHavingMixin(object):
         return setter
 
     def getVisitableNodes(self):
-        # TODO: Consider if a generator would be faster.
+        # This is called very often, by every tree visit, so the check for
+        # illegal children is only done in debug mode.
+        is_debug = Options.isDebug()
+
         result = []
 
         for name in self.named_children:
-            attr_name = "subnode_" + name
-
-            value = getattr(self, attr_name)
+            value = getattr(self, "subnode_" + name)
 
             if value is None:
                 pass
             elif type(value) is tuple:
-                result += list(value)
-            elif isinstance(value, NodeBase):
+                result.extend(value)
+            elif not is_debug or isinstance(value, NodeBase):
                 result.append(value)
             else:
                 raise AssertionError(
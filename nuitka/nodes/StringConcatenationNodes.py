@@ -22,6 +22,7 @@ code alternative to actually looking up that method from the empty string
 object, so it got a dedicated node, also to perform optimizations specific
 to this.
 """
+from .ConstantRefNodes import makeConstantRefNode
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .shapes.BuiltinTypeShapes import ShapeTypeStrOrUnicode
 
@@ -46,9 +47,56 @@ class ExpressionStringConcatenation(ExpressionChildrenHavingBase):
         return ShapeTypeStrOrUnicode
 
     def computeExpression(self, trace_collection):
-        # TODO: Could remove itself if only one argument or merge arguments
-        # of mergable types.
-        return self, None, None
+        values = self.getValues()
+
+        # Merge adjacent constant strings, and drop empty ones, they need not
+        # be built at run time.
+        new_values = []
+
+        for value in values:
+            if value.isExpressionConstantStrRef():
+                constant = value.getCompileTimeConstant()
+
+                if not constant:
+                    continue
+
+                if new_values and new_values[-1].isExpressionConstantStrRef():
+                    new_values[-1] = makeConstantRefNode(
+                        constant   = new_values[-1].getCompileTimeConstant() + constant,
+                        source_ref = new_values[-1].getSourceReference()
+                    )
+
+                    continue
 
+            new_values.append(value)
+
+        if not new_values:
+            return (
+                makeConstantRefNode(
+                    constant   = "",
+                    source_ref = self.getSourceReference()
+                ),
+                "new_constant",
+                "Removed concatenation of empty strings."
+            )
+
+        if len(new_values) == 1:
+            return (
+                new_values[0],
+                "new_expression",
+                "Removed concatenation of only one string."
+            )
+
+        if len(new_values) != len(values):
+            self.setValues(tuple(new_values))
+
+            return (
+                self,
+                "new_expression",
+                "Merged constant parts of string concatenation."
+            )
+
+        return self, None, None
 
     getValues = ExpressionChildrenHavingBase.childGetter("values")
+    setValues = ExpressionChildrenHavingBase.childSetter("values")
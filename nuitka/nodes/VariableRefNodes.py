@@ -22,10 +22,16 @@ and its expressions, changing the meaning of course dramatically.
 
 """
 
-from nuitka import Builtins, Variables
+from nuitka import Builtins, Options, Variables
 from nuitka.ModuleRegistry import getOwnerFromCodeName
 
 from .ConstantRefNodes import makeConstantRefNode
+from .ContainerOperationNodes import (
+    ExpressionListOperationGet,
+    ExpressionListOperationLen,
+    StatementListOperationSet,
+    list_index_shapes
+)
 from .DictionaryNodes import (
     ExpressionDictOperationGet,
     ExpressionDictOperationIn,
@@ -256,6 +262,24 @@ local variable '%s' referenced before assignment""" % variable_name
     def computeExpressionCall(self, call_node, call_args, call_kw,
                               trace_collection):
 
+        if self.variable.isModuleVariable() and \
+           self.variable_trace.isAssignTrace() and \
+           Options.isExperimental("compile_time_functions"):
+            assign_source = self.variable_trace.getAssignNode().getAssignSource()
+
+            if assign_source.isExpressionFunctionCreation():
+                from nuitka.optimizations.FunctionEvaluation import computeFunctionCallAtCompileTime
+
+                result = computeFunctionCallAtCompileTime(
+                    call_node         = call_node,
+                    function_creation = assign_source,
+                    call_args         = call_args,
+                    call_kw           = call_kw
+                )
+
+                if result is not None:
+                    return result
+
         trace_collection.onExceptionRaiseExit(BaseException)
 
         trace_collection.onControlFlowEscape(self)
@@ -268,6 +292,37 @@ local variable '%s' referenced before assignment""" % variable_name
 
         return call_node, None, None
 
+    def computeExpressionAttribute(self, lookup_node, attribute_name,
+                                   trace_collection):
+        # Looking up the "append" method of a list cannot run any code, and
+        # the call of it is then lowered to a list operation.
+        if attribute_name == "append" and \
+           self.variable_trace.hasShapeListExact():
+            return lookup_node, None, None
+
+        return ExpressionBase.computeExpressionAttribute(
+            self,
+            lookup_node      = lookup_node,
+            attribute_name   = attribute_name,
+            trace_collection = trace_collection
+        )
+
+    def computeExpressionLen(self, len_node, trace_collection):
+        if self.variable_trace.hasShapeListExact():
+            result = ExpressionListOperationLen(
+                list_arg   = self,
+                source_ref = len_node.getSourceReference()
+            )
+
+            return result, "new_expression", """\
+Call to 'len' on list lowered to list length."""
+
+        return ExpressionBase.computeExpressionLen(
+            self,
+            len_node         = len_node,
+            trace_collection = trace_collection
+        )
+
     def computeExpressionSetSubscript(self, set_node, subscript, value_node,
                                       trace_collection):
         tags = None
@@ -286,6 +341,17 @@ local variable '%s' referenced before assignment""" % variable_name
             tags = "new_statements"
             message = """\
 Subscript assignment to dictionary lowered to dictionary assignment."""
+        elif self.variable_trace.hasShapeListExact():
+            set_node = StatementListOperationSet(
+                list_arg   = self,
+                index      = subscript,
+                value      = value_node,
+                source_ref = set_node.getSourceReference()
+            )
+
+            tags = "new_statements"
+            message = """\
+Subscript assignment to list lowered to list assignment."""
 
         # Any code could be run, note that.
         trace_collection.onControlFlowEscape(self)
@@ -328,8 +394,11 @@ Subscript del to dictionary lowered to dictionary del."""
         tags = None
         message = None
 
-        # Any code could be run, note that.
-        trace_collection.onControlFlowEscape(self)
+        # Any code could be run, note that, unless it's a list indexed with
+        # an integer, which cannot run anything.
+        if not self.variable_trace.hasShapeListExact() or \
+           subscript.getTypeShape() not in list_index_shapes:
+            trace_collection.onControlFlowEscape(self)
 
         if self.variable_trace.hasShapeDictionaryExact():
             lookup_node = ExpressionDictOperationGet(
@@ -341,6 +410,16 @@ Subscript del to dictionary lowered to dictionary del."""
             tags = "new_expression"
             message = """\
 Subscript look-up to dictionary lowered to dictionary look-up."""
+        elif self.variable_trace.hasShapeListExact():
+            lookup_node = ExpressionListOperationGet(
+                list_arg   = self,
+                index      = subscript,
+                source_ref = lookup_node.getSourceReference()
+            )
+
+            tags = "new_expression"
+            message = """\
+Subscript look-up to list lowered to list look-up."""
 
         # Any exception might be raised.
         if lookup_node.mayRaiseException(BaseException):
@@ -386,6 +465,9 @@ Check '%s' on dictionary lowered to dictionary '%s'.""" % (
     def hasShapeDictionaryExact(self):
         return self.variable_trace.hasShapeDictionaryExact()
 
+    def hasShapeListExact(self):
+        return self.variable_trace.hasShapeListExact()
+
     def onContentEscapes(self, trace_collection):
         trace_collection.onVariableContentEscapes(self.variable)
 
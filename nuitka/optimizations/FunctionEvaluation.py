@@ -0,0 +1,377 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compile time evaluation of calls to pure functions.
+
+This is experimental, and enabled with "--experimental=compile_time_functions"
+only. Calls of module level functions with constant arguments, e.g. a table
+built with "CRC_TABLE = makeTable()", are done at compile time, and the result
+is used as a constant, so the work is not done at import time anymore.
+
+Only functions that use nothing but their arguments, their local variables,
+and built-ins without side effects are candidates. These are executed by a
+separate Python process, that has only these built-ins available, and that is
+limited in time and memory. Anything unexpected, e.g. an exception, or a
+result that is no constant, makes us leave the call alone.
+"""
+
+import __future__
+import ast
+import marshal
+import pickle
+import subprocess
+import sys
+import threading
+
+from nuitka.Builtins import builtin_exception_names
+from nuitka.Constants import getConstantWeight, isConstant, isMutable
+from nuitka.nodes.NodeMakingHelpers import makeConstantReplacementNode
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+from nuitka.tree.SourceReading import readSourceCodeFromFilename
+
+# Built-ins that neither have side effects, nor give different results at
+# run time, e.g. "hash" and "id" are not allowed for that reason.
+_pure_builtin_names = (
+    "True", "False", "None", "abs", "all", "any", "bin", "bool", "bytes",
+    "chr", "complex", "dict", "divmod", "enumerate", "filter", "float",
+    "frozenset", "hex", "int", "isinstance", "iter", "len", "list", "long",
+    "map", "max", "min", "next", "oct", "ord", "pow", "range", "repr",
+    "reversed", "round", "set", "slice", "sorted", "str", "sum", "tuple",
+    "unichr", "unicode", "xrange", "zip"
+) + tuple(builtin_exception_names)
+
+# Budget of the evaluation, seconds, bytes of address space of the process,
+# and weight of the resulting constant.
+_time_limit = 2.0
+_memory_limit = 512 * 1024 * 1024
+_weight_limit = 100000
+
+# Nodes with side effects the restricted built-ins cannot prevent, or that
+# depend on the module.
+_impure_kinds = (
+    "STATEMENT_PRINT_VALUE",
+    "STATEMENT_PRINT_NEWLINE",
+    "STATEMENT_EXEC",
+    "EXPRESSION_VARIABLE_NAME_REF",
+    "EXPRESSION_LOCALS_VARIABLE_REF",
+)
+
+# Statements of the source code, that make the function depend on more than
+# its arguments, not all of these exist in every Python version.
+_impure_statement_names = (
+    "Import",
+    "ImportFrom",
+    "Global",
+    "Nonlocal",
+    "Exec",
+    "Print",
+)
+
+# Executed by the separate Python process, given the compiled module code that
+# defines the function, and the call arguments.
+_evaluation_code = """
+import marshal, pickle, sys
+
+real_stdout = sys.stdout
+
+stdin = getattr(sys.stdin, "buffer", sys.stdin)
+stdout = getattr(real_stdout, "buffer", real_stdout)
+
+code, module_name, function_name, builtin_names, args, kw, memory_limit = \\
+    pickle.load(stdin)
+
+try:
+    import resource
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+except (ImportError, ValueError):
+    pass
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+namespace = {
+    "__builtins__" : dict(
+        (name, getattr(builtins, name))
+        for name in builtin_names
+        if hasattr(builtins, name)
+    ),
+    "__name__"     : module_name
+}
+
+sys.stdout = sys.stderr = None
+
+exec(marshal.loads(code), namespace)
+result = namespace[function_name](*args, **kw)
+
+pickle.dump(result, stdout, 2)
+stdout.flush()
+"""
+
+# Results per function and arguments, "None" if not possible.
+_evaluation_cache = {}
+
+
+class PurityVisitor(VisitorNoopMixin):
+    def __init__(self):
+        self.pure = True
+
+    def onEnterNode(self, node):
+        if node.kind in _impure_kinds:
+            self.pure = False
+        elif node.isExpressionVariableRef():
+            variable = node.getVariable()
+
+            # Module variables make the result depend on the module, unless
+            # these are never written, and refer to allowed built-ins.
+            if variable.isModuleVariable() and \
+               (variable.getName() not in _pure_builtin_names or \
+                variable.hasDefiniteWrites() is not False):
+                self.pure = False
+        elif node.isStatementAssignmentVariable() or \
+             node.isStatementDelVariable():
+            if node.getVariable().isModuleVariable():
+                self.pure = False
+        elif node.isExpressionFunctionRef():
+            visitTree(node.getFunctionBody(), self)
+
+
+def isPureFunctionBody(function_body):
+    """ Does the function depend on nothing but its arguments. """
+
+    if not function_body.isExpressionFunctionBody() or \
+       function_body.getClosureVariables():
+        return False
+
+    visitor = PurityVisitor()
+    visitTree(function_body, visitor)
+
+    return visitor.pure
+
+
+def hasImmutableDefaults(function_creation):
+    """ Are the default values immutable constants.
+
+        Mutable defaults, e.g. a list or a dictionary, can carry state from
+        one call to the next, which an evaluation in a new process does not
+        see.
+    """
+
+    default_values = []
+
+    for default in function_creation.getDefaults():
+        if not default.isCompileTimeConstant():
+            return False
+
+        default_values.append(default.getCompileTimeConstant())
+
+    kw_defaults = function_creation.getKwDefaults()
+
+    if kw_defaults is not None:
+        if not kw_defaults.isCompileTimeConstant():
+            return False
+
+        default_values.extend(kw_defaults.getCompileTimeConstant().values())
+
+    for default_value in default_values:
+        if isMutable(default_value):
+            return False
+
+    return True
+
+
+def _isSelfContainedFunctionDef(function_def):
+    """ Does the function source read only local names and allowed built-ins.
+
+        Built-ins the tree optimization turned into nodes, e.g. "exec" or
+        "open", are no longer visible as variable references, so this is
+        checked on the source code, which is also what gets executed.
+    """
+
+    local_names = set()
+    used_names = set()
+
+    for node in ast.walk(function_def):
+        node_type = type(node)
+
+        if node_type.__name__ in _impure_statement_names:
+            return False
+        elif node_type in (ast.FunctionDef, ast.ClassDef):
+            local_names.add(node.name)
+        elif node_type is ast.Name:
+            if type(node.ctx) in (ast.Load, ast.AugLoad):
+                used_names.add(node.id)
+            else:
+                local_names.add(node.id)
+        elif node_type is ast.ExceptHandler:
+            if type(node.name) is str:
+                local_names.add(node.name)
+        elif node_type is ast.arguments:
+            for arg_name in (node.vararg, node.kwarg):
+                if type(arg_name) is str:
+                    local_names.add(arg_name)
+        elif node_type.__name__ == "arg":
+            local_names.add(node.arg)
+
+    return all(
+        name in local_names or name in _pure_builtin_names
+        for name in used_names
+    )
+
+
+def _getFunctionModuleCode(function_body):
+    module = function_body.getParentModule()
+    source_ref = function_body.getSourceReference()
+
+    source_code = readSourceCodeFromFilename(
+        module_name     = module.getFullName(),
+        source_filename = module.getCompileTimeFilename()
+    )
+
+    module_ast = ast.parse(source_code, source_ref.getFilename())
+
+    # Future imports must be kept, they change what the code means.
+    flags = 0
+
+    for statement in module_ast.body:
+        if type(statement) is ast.ImportFrom and \
+           statement.module == "__future__":
+            for alias in statement.names:
+                flags |= getattr(__future__, alias.name).compiler_flag
+
+    for node in ast.walk(module_ast):
+        if type(node) is ast.FunctionDef and \
+           node.name == function_body.getFunctionName() and \
+           node.lineno == source_ref.getLineNumber() and \
+           not node.decorator_list:
+            module_ast.body = [node]
+            break
+    else:
+        return None
+
+    if not _isSelfContainedFunctionDef(module_ast.body[0]):
+        return None
+
+    return compile(
+        module_ast,
+        source_ref.getFilename(),
+        "exec",
+        flags,
+        True
+    )
+
+
+def _evaluateFunctionCall(function_body, args, kw):
+    code = _getFunctionModuleCode(function_body)
+
+    if code is None:
+        return None
+
+    process = subprocess.Popen(
+        args   = [sys.executable, "-s", "-S", "-c", _evaluation_code],
+        stdin  = subprocess.PIPE,
+        stdout = subprocess.PIPE,
+        stderr = subprocess.PIPE,
+    )
+
+    timer = threading.Timer(_time_limit, process.kill)
+    timer.start()
+
+    try:
+        stdout, _stderr = process.communicate(
+            pickle.dumps(
+                (
+                    marshal.dumps(code),
+                    function_body.getParentModule().getFullName(),
+                    function_body.getFunctionName(),
+                    _pure_builtin_names,
+                    args,
+                    kw,
+                    _memory_limit
+                ),
+                2
+            )
+        )
+    finally:
+        timer.cancel()
+
+    if process.returncode != 0:
+        return None
+
+    return (pickle.loads(stdout),)
+
+
+def computeFunctionCallAtCompileTime(call_node, function_creation, call_args,
+                                     call_kw):
+    """ Replace a call of a pure function with constant arguments by result.
+
+        Returns "None" if that is not possible, otherwise the usual tuple of
+        new node, tags, and message.
+    """
+
+    if call_args is not None and not call_args.isCompileTimeConstant():
+        return None
+
+    if call_kw is not None and not call_kw.isCompileTimeConstant():
+        return None
+
+    if not hasImmutableDefaults(function_creation):
+        return None
+
+    function_body = function_creation.getFunctionRef().getFunctionBody()
+
+    if not isPureFunctionBody(function_body):
+        return None
+
+    args = call_args.getCompileTimeConstant() if call_args is not None else ()
+    kw = call_kw.getCompileTimeConstant() if call_kw is not None else {}
+
+    key = function_body.getCodeName(), repr(args), repr(sorted(kw.items()))
+
+    if key not in _evaluation_cache:
+        # Problems of any kind just mean we cannot do it,
+        # pylint: disable=broad-except
+        try:
+            result = _evaluateFunctionCall(function_body, args, kw)
+        except Exception:
+            result = None
+
+        if result is not None and \
+           (not isConstant(result[0]) or \
+            getConstantWeight(result[0]) > _weight_limit):
+            result = None
+
+        _evaluation_cache[key] = result
+
+    result = _evaluation_cache[key]
+
+    if result is None:
+        return None
+
+    new_node = makeConstantReplacementNode(
+        constant = result[0],
+        node     = call_node
+    )
+
+    return (
+        new_node,
+        "new_constant",
+        """\
+Call to pure function '%s' with constant arguments computed at compile \
+time.""" % function_body.getFunctionName()
+    )
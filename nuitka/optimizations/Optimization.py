@@ -85,9 +85,13 @@ def optimizeCompiledPythonModule(module):
     if _progress and Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
+    pass_count = 0
+
     while True:
         tag_set.clear()
 
+        pass_count += 1
+
         try:
             module.computeModule()
         except BaseException:
@@ -108,6 +112,14 @@ def optimizeCompiledPythonModule(module):
         # Otherwise we did stuff, so note that for return value.
         touched = True
 
+    if _progress:
+        info(
+            "Optimization passes for '{module_name}': {count}.".format(
+                module_name = module.getFullName(),
+                count       = pass_count
+            )
+        )
+
     if _progress and Options.isShowMemory():
         memory_watch.finish()
 
@@ -296,13 +308,19 @@ def optimizeVariables(module):
         if Variables.complete:
             try:
                 for function_body in module.getUsedFunctions():
+                    function_changed = False
+
                     if optimizeUnusedUserVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                     if optimizeUnusedClosureVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                     if optimizeUnusedTempVariables(function_body):
+                        function_changed = True
+
+                    if function_changed:
+                        function_body.markAsOptimizationUnfinished()
                         changed = True
             except Exception:
                 print("Problem with", function_body)
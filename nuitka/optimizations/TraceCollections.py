@@ -49,21 +49,49 @@ from .VariableTraces import (
 
 signalChange = None
 
+# Count of changes signalled by trace collections, allows to detect if a
+# computation changed anything.
+change_count = 0
+
+def getChangeCount():
+    return change_count
+
 
 class CollectionTracingMixin(object):
     def __init__(self):
         # For functions, when we are in here, the currently active one,
         self.variable_actives = {}
 
+        # The active versions may be shared with other collections, which is
+        # the case for branches, and then must be copied before changing them.
+        self.variable_actives_shared = False
+
     def getVariableCurrentTrace(self, variable):
         return self.getVariableTrace(
             variable = variable,
             version  = self.getCurrentVariableVersion(variable)
         )
 
+    def _unshareVariableActives(self):
+        if self.variable_actives_shared:
+            self.variable_actives = dict(self.variable_actives)
+            self.variable_actives_shared = False
+
     def markCurrentVariableTrace(self, variable, version):
+        self._unshareVariableActives()
         self.variable_actives[variable] = version
 
+    def shareVariableActives(self):
+        """ Get the active versions, to be used unchanged by another collection.
+
+            Both collections will copy them, before making a change, so that
+            creating branches is cheap, as most of them are never changed.
+        """
+
+        self.variable_actives_shared = True
+
+        return self.variable_actives
+
     def getCurrentVariableVersion(self, variable):
         try:
             return self.variable_actives[variable]
@@ -135,7 +163,7 @@ class CollectionStartpointMixin(object):
         self.variable_versions = {}
 
         # The full trace of a variable with a version for the function or module
-        # this is.
+        # this is, grouped per variable, and then by version.
         self.variable_traces = {}
 
         self.break_collections = None
@@ -206,30 +234,30 @@ class CollectionStartpointMixin(object):
         return self.exception_collections
 
     def hasVariableTrace(self, variable, version):
-        return (variable, version) in self.variable_traces
+        return version in self.variable_traces.get(variable, ())
 
     def getVariableTrace(self, variable, version):
-        return self.variable_traces[(variable, version)]
+        return self.variable_traces[variable][version]
 
     def getVariableTraces(self, variable):
-        result = []
-
-        for key, variable_trace in iterItems(self.variable_traces):
-            candidate = key[0]
-
-            if variable is candidate:
-                result.append(variable_trace)
-
-        return result
+        if variable in self.variable_traces:
+            return list(self.variable_traces[variable].values())
+        else:
+            return []
 
     def getVariableTracesAll(self):
-        return self.variable_traces
+        for variable_traces in self.variable_traces.values():
+            for variable_trace in variable_traces.values():
+                yield variable_trace
 
     def addVariableTrace(self, variable, version, trace):
-        key = variable, version
+        if variable not in self.variable_traces:
+            self.variable_traces[variable] = {}
+
+        variable_traces = self.variable_traces[variable]
 
-        assert key not in self.variable_traces, (key, self)
-        self.variable_traces[key] = trace
+        assert version not in variable_traces, (variable, version, self)
+        variable_traces[version] = trace
 
     def addVariableMergeMultipleTrace(self, variable, traces):
         version = variable.allocateTargetNumber()
@@ -247,8 +275,7 @@ class CollectionStartpointMixin(object):
 
     def dumpTraces(self):
         debug("Constraint collection state: %s", self)
-        for _variable_desc, variable_trace in sorted(iterItems(self.variable_traces)):
-
+        for variable_trace in self.getVariableTracesAll():
             # debug( "%r: %r", variable_trace )
             variable_trace.dump()
 
@@ -387,11 +414,17 @@ class TraceCollectionBase(CollectionTracingMixin):
     @staticmethod
     def signalChange(tags, source_ref, message):
         # This is monkey patched from another module.
+        global change_count # pylint: disable=global-statement
+        change_count += 1
+
         signalChange(tags, source_ref, message)
 
     def onUsedModule(self, module_name):
         return self.parent.onUsedModule(module_name)
 
+    def getModuleTraceCollection(self):
+        return self.parent.getModuleTraceCollection()
+
     @staticmethod
     def mustAlias(a, b):
         if a.isExpressionVariableRef() and b.isExpressionVariableRef():
@@ -612,21 +645,43 @@ class TraceCollectionBase(CollectionTracingMixin):
             self.replaceBranch(collections[0])
             return None
 
-        variable_versions = {}
+        # Branches that made no changes share their active versions, only
+        # look at each of these once.
+        variable_actives_list = []
+        variable_actives_ids = set()
 
         for collection in collections:
-            for variable, version in iterItems(collection.variable_actives):
+            variable_actives = collection.variable_actives
+
+            if id(variable_actives) not in variable_actives_ids:
+                variable_actives_ids.add(id(variable_actives))
+                variable_actives_list.append(variable_actives)
+
+        if len(variable_actives_list) == 1:
+            for collection in collections:
+                collection.variable_actives_shared = True
+
+            self.variable_actives = variable_actives_list[0]
+            self.variable_actives_shared = True
+
+            return None
+
+        variable_versions = {}
+
+        for variable_actives in variable_actives_list:
+            for variable, version in iterItems(variable_actives):
                 if variable not in variable_versions:
                     variable_versions[variable] = set([version])
                 else:
                     variable_versions[variable].add(version)
 
-        for collection in collections:
+        for variable_actives in variable_actives_list:
             for variable, versions in iterItems(variable_versions):
-                if variable not in collection.variable_actives:
+                if variable not in variable_actives:
                     versions.add(0)
 
         self.variable_actives = {}
+        self.variable_actives_shared = False
 
 #         merge_traces = None
 
@@ -654,7 +709,10 @@ class TraceCollectionBase(CollectionTracingMixin):
 #         return merge_traces and tuple(merge_traces)
 
     def replaceBranch(self, collection_replace):
-        self.variable_actives.update(collection_replace.variable_actives)
+        if collection_replace.variable_actives is not self.variable_actives:
+            self._unshareVariableActives()
+            self.variable_actives.update(collection_replace.variable_actives)
+
         collection_replace.variable_actives = None
 
     def onLoopBreak(self, collection = None):
@@ -742,7 +800,8 @@ class TraceCollectionBranch(TraceCollectionBase):
             parent = parent
         )
 
-        self.variable_actives = dict(parent.variable_actives)
+        self.variable_actives = parent.shareVariableActives()
+        self.variable_actives_shared = True
 
     def computeBranch(self, branch):
         if branch.isStatementsSequence():
@@ -761,7 +820,7 @@ class TraceCollectionBranch(TraceCollectionBase):
         variable_trace = self.parent.initVariable(variable)
         assert variable_trace.getVersion() == 0
 
-        self.variable_actives[variable] = 0
+        self.markCurrentVariableTrace(variable, 0)
 
         return variable_trace
 
@@ -832,3 +891,6 @@ class TraceCollectionModule(CollectionStartpointMixin,
 
     def getUsedModules(self):
         return self.used_modules
+
+    def getModuleTraceCollection(self):
+        return self
@@ -197,6 +197,10 @@ class VariableTraceBase(object):
         # Virtual method, pylint: disable=no-self-use
         return False
 
+    def hasShapeListExact(self):
+        # Virtual method, pylint: disable=no-self-use
+        return False
+
 
 
 class VariableTraceUninit(VariableTraceBase):
@@ -274,6 +278,8 @@ class VariableTraceInit(VariableTraceBase):
 
 
 class VariableTraceUnknown(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -381,6 +387,9 @@ class VariableTraceAssign(VariableTraceBase):
     def hasShapeDictionaryExact(self):
         return self.assign_node.getAssignSource().hasShapeDictionaryExact()
 
+    def hasShapeListExact(self):
+        return self.assign_node.getAssignSource().hasShapeListExact()
+
 
 class VariableTraceMerge(VariableTraceBase):
     """ Merge of two or more traces.
@@ -475,6 +484,13 @@ class VariableTraceMerge(VariableTraceBase):
 
         return True
 
+    def hasShapeListExact(self):
+        for previous in self.previous:
+            if not previous.hasShapeListExact():
+                return False
+
+        return True
+
 
 class VariableTraceLoopMerge(VariableTraceBase):
     """ Merge of loop wrap around with loop start value.
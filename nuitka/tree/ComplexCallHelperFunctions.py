@@ -614,11 +614,12 @@ def _makeStarDictArgumentToDictStatement(result, called_variable,
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionTempVariableRef(
+                value         = ExpressionTempVariableRef(
                     variable   = tmp_keys_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -849,11 +850,12 @@ def _makeStarDictArgumentMergeToKwStatement(result, called_variable, kw_variable
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionTempVariableRef(
+                value         = ExpressionTempVariableRef(
                     variable   = tmp_keys_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -973,7 +975,7 @@ def _makeStarDictArgumentMergeToKwStatement(result, called_variable, kw_variable
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = makeCallNode(
+                value         = makeCallNode(
                     _makeNameAttributeLookup(
                         ExpressionVariableRef(
                             variable   = star_dict_variable,
@@ -985,7 +987,8 @@ def _makeStarDictArgumentMergeToKwStatement(result, called_variable, kw_variable
                     ),
                     internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -2542,7 +2545,7 @@ def getFunctionCallHelperDictionaryUnpacking():
                 StatementAssignmentVariable(
                     variable   = tmp_iter2_variable,
                     source     = ExpressionBuiltinIter1(
-                        value      = makeCallNode(
+                        value         = makeCallNode(
                             _makeNameAttributeLookup(
                                 ExpressionTempVariableRef(
                                     variable   = tmp_item_variable,
@@ -2552,7 +2555,8 @@ def getFunctionCallHelperDictionaryUnpacking():
                             ),
                             internal_source_ref
                         ),
-                        source_ref = internal_source_ref
+                        source_ref    = internal_source_ref,
+                        loop_iterator = True
                     ),
                     source_ref = internal_source_ref
                 ),
@@ -2630,11 +2634,12 @@ def getFunctionCallHelperDictionaryUnpacking():
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionVariableRef(
+                value         = ExpressionVariableRef(
                     variable   = args_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -61,6 +61,28 @@ class VariableUsageUpdater(VisitorNoopMixin):
                 node.setVariable(self.new_variable)
 
 
+class FunctionRefExtractor(VisitorNoopMixin):
+    """ Extract function references.
+
+    """
+    def __init__(self):
+        self.function_refs = []
+
+    def onEnterNode(self, node):
+        if node.isExpressionFunctionRef():
+            self.function_refs.append(node)
+
+    def getResult(self):
+        return self.function_refs
+
+
+def getFunctionRefs(node):
+    visitor = FunctionRefExtractor()
+    visitTree(node, visitor)
+
+    return visitor.getResult()
+
+
 def updateVariableUsage(provider, old_variable, new_variable):
     visitor = VariableUsageUpdater(
         old_variable = old_variable,
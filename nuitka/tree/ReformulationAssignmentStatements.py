@@ -277,8 +277,9 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
             StatementAssignmentVariable(
                 variable   = source_iter_var,
                 source     = ExpressionBuiltinIter1(
-                    value      = source,
-                    source_ref = source_ref
+                    value         = source,
+                    source_ref    = source_ref,
+                    loop_iterator = True
                 ),
                 source_ref = source_ref
             ),
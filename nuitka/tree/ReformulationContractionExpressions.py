@@ -225,12 +225,13 @@ def buildGeneratorExpressionNode(provider, node, source_ref):
             StatementAssignmentVariable(
                 variable   = iter_tmp,
                 source     = ExpressionBuiltinIter1(
-                    value      = buildNode(
+                    value         = buildNode(
                         provider   = provider,
                         node       = node.generators[0].iter,
                         source_ref = source_ref
                     ),
-                    source_ref = source_ref
+                    source_ref    = source_ref,
+                    loop_iterator = True
                 ),
                 source_ref = source_ref
             ),
@@ -316,12 +317,13 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
             StatementAssignmentVariable(
                 variable   = iter_tmp,
                 source     = ExpressionBuiltinIter1(
-                    value      = buildNode(
+                    value         = buildNode(
                         provider   = provider,
                         node       = node.generators[0].iter,
                         source_ref = source_ref
                     ),
-                    source_ref = source_ref
+                    source_ref    = source_ref,
+                    loop_iterator = True
                 ),
                 source_ref = source_ref.atInternal()
             )
@@ -417,12 +419,13 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
         else:
             # First create the iterator and store it, next should be loop body
             value_iterator = ExpressionBuiltinIter1(
-                value      = buildNode(
+                value         = buildNode(
                     provider   = function_body,
                     node       = qual.iter,
                     source_ref = source_ref
                 ),
-                source_ref = source_ref
+                source_ref    = source_ref,
+                loop_iterator = True
             )
 
             tmp_iter_variable = function_body.allocateTempVariable(
@@ -571,12 +574,13 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
 
     assign_iter_statement = StatementAssignmentVariable(
         source     = ExpressionBuiltinIter1(
-            value      = buildNode(
+            value         = buildNode(
                 provider   = provider,
                 node       = node.generators[0].iter,
                 source_ref = source_ref
             ),
-            source_ref = source_ref
+            source_ref    = source_ref,
+            loop_iterator = True
         ),
         variable   = iter_tmp,
         source_ref = source_ref
@@ -218,11 +218,12 @@ def getDictUnpackingHelper():
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionVariableRef(
+                value         = ExpressionVariableRef(
                     variable   = args_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -35,9 +35,15 @@ from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
 from nuitka.nodes.ComparisonNodes import ExpressionComparisonIs
 from nuitka.nodes.ConditionalNodes import StatementConditional
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.DictionaryNodes import (
+    ExpressionDictOperationItemsIter,
+    ExpressionDictOperationItemsIterNextKey,
+    ExpressionDictOperationItemsIterValue
+)
 from nuitka.nodes.LoopNodes import StatementLoop, StatementLoopBreak
 from nuitka.nodes.StatementNodes import StatementsSequence
 from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.PythonVersions import python_version
 
 from .ReformulationAssignmentStatements import buildAssignmentStatements
 from .ReformulationTryExceptStatements import makeTryExceptSingleHandlerNode
@@ -45,6 +51,7 @@ from .ReformulationTryFinallyStatements import makeTryFinallyStatement
 from .TreeHelpers import (
     buildNode,
     buildStatementsNode,
+    getKind,
     makeStatementsSequence,
     makeStatementsSequenceFromStatements,
     popBuildContext,
@@ -52,6 +59,44 @@ from .TreeHelpers import (
 )
 
 
+def _getDictItemsLoopMethodName(node):
+    """ For "for key, value in something.items()" loops, the method name.
+
+        These can iterate dictionaries without creating item tuples. With
+        Python2, "items" gives a list, and the dictionary may be modified
+        while looping over it, so only the iterating variants qualify.
+    """
+
+    target = node.target
+
+    if getKind(target) not in ("Tuple", "List") or len(target.elts) != 2:
+        return None
+
+    if any(getKind(element) == "Starred" for element in target.elts):
+        return None
+
+    call = node.iter
+
+    if getKind(call) != "Call" or call.args or call.keywords:
+        return None
+
+    if python_version < 350 and (call.starargs or call.kwargs):
+        return None
+
+    if getKind(call.func) != "Attribute":
+        return None
+
+    if python_version < 300:
+        method_names = ("iteritems", "viewitems")
+    else:
+        method_names = ("items",)
+
+    if call.func.attr not in method_names:
+        return None
+
+    return call.func.attr
+
+
 def _buildForLoopNode(provider, node, sync, source_ref):
     # The for loop is re-formulated according to developer manual. An iterator
     # is created, and looped until it gives StopIteration. The else block is
@@ -60,7 +105,15 @@ def _buildForLoopNode(provider, node, sync, source_ref):
 
     # We handle async and sync both here, leading to cases, pylint: disable=too-many-locals
 
-    source = buildNode(provider, node.iter, source_ref)
+    if sync:
+        dict_items_method_name = _getDictItemsLoopMethodName(node)
+    else:
+        dict_items_method_name = None
+
+    if dict_items_method_name is not None:
+        source = buildNode(provider, node.iter.func.value, source_ref)
+    else:
+        source = buildNode(provider, node.iter, source_ref)
 
     # Temporary variables, we need one for the iterator, and one for the current
     # value.
@@ -112,7 +165,15 @@ def _buildForLoopNode(provider, node, sync, source_ref):
         source_ref = source_ref
     )
 
-    if sync:
+    if dict_items_method_name is not None:
+        next_node = ExpressionDictOperationItemsIterNextKey(
+            iterator   = ExpressionTempVariableRef(
+                variable   = tmp_iter_variable,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+    elif sync:
         next_node = ExpressionBuiltinNext1(
             value      = ExpressionTempVariableRef(
                 variable   = tmp_iter_variable,
@@ -140,16 +201,46 @@ def _buildForLoopNode(provider, node, sync, source_ref):
             handler_body   = handler_body,
             source_ref     = source_ref
         ),
-        buildAssignmentStatements(
-            provider   = provider,
-            node       = node.target,
-            source     = ExpressionTempVariableRef(
-                variable   = tmp_value_variable,
+    )
+
+    if dict_items_method_name is not None:
+        # The key is the value of the iteration, and the value of the item is
+        # taken from the iterator.
+        statements += (
+            buildAssignmentStatements(
+                provider   = provider,
+                node       = node.target.elts[0],
+                source     = ExpressionTempVariableRef(
+                    variable   = tmp_value_variable,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+            buildAssignmentStatements(
+                provider   = provider,
+                node       = node.target.elts[1],
+                source     = ExpressionDictOperationItemsIterValue(
+                    iterator   = ExpressionTempVariableRef(
+                        variable   = tmp_iter_variable,
+                        source_ref = source_ref
+                    ),
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+    else:
+        statements += (
+            buildAssignmentStatements(
+                provider   = provider,
+                node       = node.target,
+                source     = ExpressionTempVariableRef(
+                    variable   = tmp_value_variable,
+                    source_ref = source_ref
+                ),
                 source_ref = source_ref
             ),
-            source_ref = source_ref
         )
-    )
 
     pushBuildContext("loop_body")
     statements += (
@@ -192,10 +283,17 @@ def _buildForLoopNode(provider, node, sync, source_ref):
     else:
         statements = []
 
-    if sync:
+    if dict_items_method_name is not None:
+        iter_source = ExpressionDictOperationItemsIter(
+            dict_arg    = source,
+            method_name = dict_items_method_name,
+            source_ref  = source.getSourceReference()
+        )
+    elif sync:
         iter_source = ExpressionBuiltinIter1(
-            value      = source,
-            source_ref = source.getSourceReference()
+            value         = source,
+            source_ref    = source.getSourceReference(),
+            loop_iterator = True
         )
     else:
         iter_source = ExpressionAsyncIter(
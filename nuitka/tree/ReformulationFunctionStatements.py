@@ -633,8 +633,9 @@ def buildFunctionWithParsing(provider, function_kind, name, function_doc, flags,
                 StatementAssignmentVariable(
                     variable   = iter_var,
                     source     = ExpressionBuiltinIter1(
-                        value      = source,
-                        source_ref = source_ref
+                        value         = source,
+                        source_ref    = source_ref,
+                        loop_iterator = True
                     ),
                     source_ref = source_ref
                 )
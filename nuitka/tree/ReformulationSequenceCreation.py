@@ -183,11 +183,12 @@ def getListUnpackingHelper():
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionVariableRef(
+                value         = ExpressionVariableRef(
                     variable   = args_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -310,11 +311,12 @@ def getSetUnpackingHelper():
         StatementAssignmentVariable(
             variable   = tmp_iter_variable,
             source     = ExpressionBuiltinIter1(
-                value      = ExpressionVariableRef(
+                value         = ExpressionVariableRef(
                     variable   = args_variable,
                     source_ref = internal_source_ref
                 ),
-                source_ref = internal_source_ref
+                source_ref    = internal_source_ref,
+                loop_iterator = True
             ),
             source_ref = internal_source_ref
         ),
@@ -22,6 +22,7 @@ source code comments with developer manual sections.
 
 """
 
+from nuitka.Builtins import builtin_exception_names
 from nuitka.nodes.AssignNodes import (
     StatementAssignmentVariable,
     StatementReleaseVariable
@@ -57,6 +58,7 @@ from .SyntaxErrors import raiseSyntaxError
 from .TreeHelpers import (
     buildNode,
     buildStatementsNode,
+    getKind,
     makeReraiseExceptionStatement,
     makeStatementsSequence,
     makeStatementsSequenceFromStatement,
@@ -250,6 +252,60 @@ def makeTryExceptSingleHandlerNodeWithPublish(provider, public_exc, tried,
     )
 
 
+def _isConstantValueNode(node):
+    return getKind(node) in ("Num", "Str", "Bytes", "NameConstant", "Ellipsis")
+
+
+def _isUnobservedExceptionHandler(handler):
+    """ Decide if the exception caught by a handler cannot be observed.
+
+    For Python3, the published exception is only visible to code executed
+    while handling, and to exceptions newly raised in the handler, which get
+    it attached as their context. Handlers that match built-in exceptions by
+    name, do not bind the exception, and consist of simple statements that
+    cannot raise, therefore do not need it published at all.
+    """
+
+    if handler.name is not None:
+        return False
+
+    if handler.type is not None:
+        kind = getKind(handler.type)
+
+        if kind == "Name":
+            exception_names = (handler.type,)
+        elif kind == "Tuple":
+            exception_names = handler.type.elts
+        else:
+            return False
+
+        for exception_name in exception_names:
+            if getKind(exception_name) != "Name":
+                return False
+
+            if exception_name.id not in builtin_exception_names:
+                return False
+
+    for statement in handler.body:
+        kind = getKind(statement)
+
+        if kind in ("Pass", "Break", "Continue"):
+            continue
+
+        if kind == "Return":
+            if statement.value is None or _isConstantValueNode(statement.value):
+                continue
+
+        if kind == "Assign":
+            if _isConstantValueNode(statement.value) and \
+               all(getKind(target) == "Name" for target in statement.targets):
+                continue
+
+        return False
+
+    return True
+
+
 def buildTryExceptionNode(provider, node, source_ref):
     # Try/except nodes. Re-formulated as described in the developer
     # manual. Exception handlers made the assignment to variables explicit. Same
@@ -411,6 +467,13 @@ def buildTryExceptionNode(provider, node, source_ref):
                 ),
                 source_ref = source_ref.atInternal()
             )
+    elif python_version >= 300 and \
+         not provider.isExpressionClassBody() and \
+         all(_isUnobservedExceptionHandler(handler) for handler in node.handlers):
+        # Nothing could see the published exception, so handle it like the
+        # internal re-formulations do, without making a traceback for it, or
+        # normalizing it.
+        pass
     else:
         if python_version < 300:
             exception_handling.setStatements(
@@ -29,6 +29,7 @@ from nuitka.Tracing import printIndented, printLine
 
 counted_inits = {}
 counted_dels = {}
+counted_peaks = {}
 
 def counted_init(init):
     if isShowMemory():
@@ -41,6 +42,12 @@ def counted_init(init):
 
             counted_inits[name] += 1
 
+            # Highest number of instances alive at the same time.
+            alive = counted_inits[name] - counted_dels.get(name, 0)
+
+            if alive > counted_peaks.get(name, 0):
+                counted_peaks[name] = alive
+
             init(self, *args, **kw)
 
         return wrapped_init
@@ -73,8 +80,8 @@ def counted_del(del_func = empty_del):
         return empty_del
 
 def printStats():
-    printLine("Init/del calls:")
+    printLine("Init/del calls, alive and peak alive counts:")
 
     for name, count in sorted(counted_inits.items()):
         dels = counted_dels.get(name, 0)
-        printIndented(1, name, count, dels, count - dels)
+        printIndented(1, name, count, dels, count - dels, counted_peaks[name])
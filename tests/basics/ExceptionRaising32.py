@@ -23,3 +23,29 @@ try:
     raisy()
 except (ValueError,TypeError) as e:
     print("Caught as", repr(e))
+
+import sys
+
+def swallowKeyError(d, k):
+    try:
+        return d[k]
+    except (KeyError, IndexError):
+        pass
+
+    return sys.exc_info()
+
+def raiseAfterHandled():
+    try:
+        raise ValueError("handled")
+    except ValueError:
+        x = 1
+
+    raise TypeError("unhandled")
+
+print("Swallowed exception info after handler:", swallowKeyError({}, 1))
+
+try:
+    print("Raising exception after a swallowed exception:")
+    raiseAfterHandled()
+except TypeError as e:
+    print("Caught as", repr(e), "with context", repr(e.__context__))
@@ -90,3 +90,29 @@ def importBuiltinTupleFailure():
 print("The __import__ built-in optimization can handle tuples:", end = ' ')
 
 importBuiltinTupleFailure()
+
+import sys
+
+def importDottedName():
+    import xml.dom
+    return xml
+
+def importDottedNameFrom():
+    from xml import dom
+    return dom
+
+print("Repeated dotted import gives package:", importDottedName() is importDottedName())
+
+# Replacing the top level package in "sys.modules" must be seen by the next
+# import, even if the dotted module is still there.
+original_xml = sys.modules["xml"]
+replacement_xml = type(sys)("xml")
+replacement_xml.dom = sys.modules["xml.dom"]
+sys.modules["xml"] = replacement_xml
+
+print("Dotted import gives replaced package:", importDottedName() is replacement_xml)
+print("From import gives replaced attribute:", importDottedNameFrom() is replacement_xml.dom)
+
+sys.modules["xml"] = original_xml
+
+print("Dotted import gives restored package:", importDottedName() is original_xml)
@@ -0,0 +1,184 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+def check(func):
+    try:
+        result = func()
+    except Exception as e:
+        result = repr(e)
+
+    print(func.__name__, result)
+
+class IndexLike(object):
+    def __index__(self):
+        return 2
+
+class IntSubclass(int):
+    pass
+
+print("List index look-ups:")
+
+def lookupPositive():
+    l = [1, 3, 5, 7]
+    return l[1]
+
+def lookupNegative():
+    l = [1, 3, 5, 7]
+    return l[-1]
+
+def lookupNegativeFirst():
+    l = [1, 3, 5, 7]
+    return l[-4]
+
+def lookupOutOfRange():
+    l = [1, 3, 5, 7]
+    return l[4]
+
+def lookupNegativeOutOfRange():
+    l = [1, 3, 5, 7]
+    return l[-5]
+
+def lookupTooLarge():
+    l = [1, 3, 5, 7]
+    return l[2**100]
+
+def lookupTooSmall():
+    l = [1, 3, 5, 7]
+    return l[-2**100]
+
+def lookupBool():
+    l = [1, 3, 5, 7]
+    return l[True], l[False]
+
+def lookupIndexLike():
+    l = [1, 3, 5, 7]
+    return l[IndexLike()]
+
+def lookupIntSubclass():
+    l = [1, 3, 5, 7]
+    return l[IntSubclass(3)]
+
+def lookupString():
+    l = [1, 3, 5, 7]
+    return l["1"]
+
+def lookupFloat():
+    l = [1, 3, 5, 7]
+    return l[1.0]
+
+for func in (lookupPositive, lookupNegative, lookupNegativeFirst,
+             lookupOutOfRange, lookupNegativeOutOfRange, lookupTooLarge,
+             lookupTooSmall, lookupBool, lookupIndexLike, lookupIntSubclass,
+             lookupString, lookupFloat):
+    check(func)
+
+def lookupVariable(index):
+    l = [1, 3, 5]
+    return l[index]
+
+print("Variable index look-ups:")
+for index in (0, 2, 3, -3, -4, True, 2**100):
+    check(lambda: lookupVariable(index))
+
+print("List index assignments:")
+
+def assignPositive():
+    l = [1, 3, 5, 7]
+    l[1] = 4
+    return l
+
+def assignNegative():
+    l = [1, 3, 5, 7]
+    l[-1] = 8
+    return l
+
+def assignOutOfRange():
+    l = [1, 3, 5, 7]
+    l[4] = 9
+    return l
+
+def assignNegativeOutOfRange():
+    l = [1, 3, 5, 7]
+    l[-5] = 0
+    return l
+
+def assignTooLarge():
+    l = [1, 3, 5, 7]
+    l[2**100] = 9
+    return l
+
+def assignBool():
+    l = [1, 3, 5, 7]
+    l[True] = 4
+    return l
+
+def assignIndexLike():
+    l = [1, 3, 5, 7]
+    l[IndexLike()] = 6
+    return l
+
+def assignString():
+    l = [1, 3, 5, 7]
+    l["1"] = 4
+    return l
+
+for func in (assignPositive, assignNegative, assignOutOfRange,
+             assignNegativeOutOfRange, assignTooLarge, assignBool,
+             assignIndexLike, assignString):
+    check(func)
+
+class Destructed(object):
+    def __init__(self, l):
+        self.l = l
+
+    def __del__(self):
+        print("Released old value, list is now", self.l)
+
+def assignReleasing():
+    l = [1, 2]
+    l[1] = Destructed(l)
+    l[1] = "replaced"
+    return l
+
+check(assignReleasing)
+
+def appendValues():
+    l = [1]
+    l.append(2)
+    r = l.append("three")
+    return l, r, len(l), l[2]
+
+def appendAfterRebind():
+    l = [1]
+
+    def rebind():
+        return 7
+
+    l.append(rebind())
+    l.append(len(l))
+    return l
+
+def appendAlias():
+    l = []
+    a = l
+    l.append(a)
+    return len(l), len(a), l[0] is l
+
+for func in (appendValues, appendAfterRebind, appendAlias):
+    check(func)
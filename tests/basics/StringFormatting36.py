@@ -0,0 +1,39 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+def formatValues(name, value, width):
+    print(f"Hello {name}, value {value!r} is {value:>{width}} wide.")
+    print(f"{name}{value}")
+    print(f"{name}")
+    print(f"{''}" + f"")
+    print(f"constant" f" parts" f" {name!s}" " merged")
+
+formatValues("world", 42, 6)
+formatValues("", 3.5, 0)
+
+class FormatsOddly:
+    def __format__(self, spec):
+        return "odd:" + spec
+
+print(f"{FormatsOddly()} and {FormatsOddly():spec}")
+
+try:
+    format(1, 5)
+except TypeError as e:
+    print("Non-string format spec gives", repr(e))
+
+print(format(7, "03"), format("text"), format(2.5))
@@ -73,4 +73,82 @@ def catcher():
 
 catcher()
 
+# These functions only return variables that may be unassigned, so their
+# frame only needs to exist, once the exception is raised.
+def getUnassignedLocal(cond):
+    if cond is not None:
+        value = "assigned"
+
+    return value
+
+def getLateGlobal():
+    return late_global
+
+# Operations on values of known shapes cannot run code either, so these
+# also only need their frame once the exception is raised.
+def divideByIdentity(a, b):
+    return 1 // (a is b)
+
+def checkAccessorFrame(accessor, *args):
+    caller_frame = sys._getframe()
+    caller_back = caller_frame.f_back
+
+    try:
+        accessor(*args)
+    except (NameError, UnboundLocalError, ZeroDivisionError) as e:
+        print("Accessor raised", type(e).__name__, e)
+
+        tb = sys.exc_info()[2]
+
+        entries = []
+        while tb is not None:
+            entries.append((tb.tb_frame.f_code.co_name, tb.tb_lineno))
+
+            if tb.tb_frame is not caller_frame:
+                print("Frame locals of", tb.tb_frame.f_code.co_name, sorted(tb.tb_frame.f_locals))
+
+            tb = tb.tb_next
+
+        print("Traceback entries", entries)
+        print("Traceback starts with caller frame", sys.exc_info()[2].tb_frame is caller_frame)
+
+    print("Caller frame unchanged", sys._getframe() is caller_frame, caller_frame.f_back is caller_back)
+
+checkAccessorFrame(getUnassignedLocal, None)
+checkAccessorFrame(getUnassignedLocal, None)
+checkAccessorFrame(getLateGlobal)
+checkAccessorFrame(divideByIdentity, 1, 2)
+
+# Not an accessor, but unassigned closure variables must be left out of the
+# frame locals too.
+def getUnassignedCell(cond):
+    if cond is not None:
+        value = "assigned"
+
+    def inner():
+        return value
+
+    return inner()
+
+checkAccessorFrame(getUnassignedCell, None)
+
+def checkAccessorChain():
+    try:
+        checkAccessorFrame(getUnassignedLocal, None)
+        getUnassignedLocal(None)
+    except UnboundLocalError:
+        tb = sys.exc_info()[2]
+
+        names = []
+        while tb is not None:
+            names.append(tb.tb_frame.f_code.co_name)
+            tb = tb.tb_next
+
+        print("Accessor traceback from outer caller", names)
+
+checkAccessorChain()
+
+late_global = "late"
+print("Accessors without exception", getUnassignedLocal(True), getLateGlobal(), divideByIdentity(1, 1))
+
 print("Good bye.")
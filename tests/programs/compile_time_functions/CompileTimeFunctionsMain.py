@@ -0,0 +1,103 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test of "--experimental=compile_time_functions" mode.
+
+Calls of pure functions with constant arguments are done at compile time,
+the output must still be the same as with CPython.
+"""
+
+from __future__ import print_function
+
+
+def makeCrcTable(poly = 0xEDB88320):
+    table = []
+
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ poly
+            else:
+                crc >>= 1
+
+        table.append(crc)
+
+    return table
+
+# The result is mutable, changing it must not change other results.
+crc_table = makeCrcTable()
+crc_table.append(0)
+crc_table[0] = -1
+
+print("Changed table:", len(crc_table), crc_table[0], crc_table[-1])
+print("Fresh table:", len(makeCrcTable()), makeCrcTable()[0], makeCrcTable()[1])
+
+
+def makeRange(start, stop, step = 1):
+    return list(range(start, stop, step))
+
+print("Keyword arguments:", makeRange(1, stop = 10, step = 3))
+print("Only keyword arguments:", makeRange(stop = 4, start = 0))
+
+
+def reciprocal(value):
+    return 1 // value
+
+# Raising functions stay calls done at run time.
+try:
+    reciprocal(0)
+except ZeroDivisionError as e:
+    print("Raised at run time:", type(e).__name__)
+
+
+offset = 10
+
+def addOffset(value):
+    return value + offset
+
+offset = 20
+
+print("Module variable read at call time:", addOffset(1))
+
+
+def len(value):
+    return -1
+
+def countItems(value):
+    return len(value)
+
+# Built-in names that the module sets are module variables too.
+print("Module overloaded built-in used:", countItems((1, 2, 3)))
+
+
+def counter(acc = []):
+    acc.append(1)
+    return sum(acc)
+
+# Mutable defaults carry state from one call to the next.
+print("Mutable default state:", counter(), counter())
+
+
+def memoized(value, memo = {}):
+    if value in memo:
+        return "cached"
+
+    memo[value] = True
+    return "fresh"
+
+print("Memo dictionary default:", memoized(1), memoized(1))
@@ -0,0 +1,130 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test of "--instrument" mode.
+
+The program runs itself as a child, once compiled with instrumentation and
+with CPython using "cProfile" instead, and then loads the written "pstats"
+file. Counts of calls must be the same for both, exceptions and threads are
+only checked for compiled code.
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import pstats
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+def fib(n):
+    if n < 2:
+        return n
+
+    return fib(n - 1) + fib(n - 2)
+
+def raiser(value):
+    raise ValueError(value)
+
+def worker(started, release):
+    started.set()
+    release.wait()
+
+def runChild():
+    fib(15)
+
+    for count in range(3):
+        try:
+            raiser(count)
+        except ValueError:
+            pass
+
+    # The function being active in another thread is no recursion.
+    started = threading.Event()
+    release = threading.Event()
+
+    thread = threading.Thread(target = worker, args = (started, release))
+    thread.start()
+    started.wait()
+
+    done = threading.Event()
+    done.set()
+    worker(done, done)
+
+    release.set()
+    thread.join()
+
+def getCounts(stats, function_name):
+    for key, value in stats.stats.items():
+        if os.path.basename(key[0]) == "InstrumentationMain.py" and \
+           key[2] == function_name:
+            return value[0], value[1]
+
+    return None
+
+def runParent():
+    is_compiled = type(fib).__name__ == "compiled_function"
+
+    output_dir = tempfile.mkdtemp()
+    output = os.path.join(output_dir, "instrumentation")
+
+    if is_compiled:
+        # Also used by this process at exit, which then fails to write into
+        # the removed directory, instead of leaving files behind.
+        os.environ["NUITKA_INSTRUMENTATION_OUTPUT"] = output
+
+        subprocess.check_call([sys.argv[0], "child"])
+    else:
+        subprocess.check_call(
+            [
+                sys.executable, "-m", "cProfile", "-o", output + ".pstats",
+                os.path.abspath(__file__), "child"
+            ]
+        )
+
+    stats = pstats.Stats(output + ".pstats")
+
+    print("Primitive calls and calls of fib:", getCounts(stats, "fib"))
+    print("Primitive calls and calls of raiser:", getCounts(stats, "raiser"))
+
+    if is_compiled:
+        with open(output + ".json") as json_file:
+            records = dict(
+                (record["name"], record)
+                for record in
+                json.load(json_file)
+            )
+
+        print("Exceptions of raiser counted:", records["raiser"]["exceptions"] == 3)
+        print(
+            "Calls in two threads not recursive:",
+            records["worker"]["primitive_calls"] == records["worker"]["calls"] == 2
+        )
+    else:
+        print("Exceptions of raiser counted:", True)
+        print("Calls in two threads not recursive:", True)
+
+    shutil.rmtree(output_dir)
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["child"]:
+        runChild()
+    else:
+        runParent()
@@ -0,0 +1,103 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test of "--lazy-imports" mode.
+
+The output must be the same as with CPython, which imports eagerly, so the
+checks compare against what is expected for compiled or not compiled code.
+"""
+
+from __future__ import print_function
+
+import sys
+
+import lazy_used
+import lazy_raising
+import eager_value
+import eager_side_effects
+import lazy_package.b
+import lazy_package.c
+
+try:
+    import eager_in_try
+except ImportError:
+    eager_in_try = None
+
+
+def someFunction():
+    pass
+
+is_compiled = type(someFunction).__name__ == "compiled_function"
+
+print(
+    "Not imported before first use as expected:",
+    ("lazy_used" not in sys.modules) is is_compiled
+)
+print(
+    "Lazy object bound before first use as expected:",
+    (type(globals()["lazy_used"]) is not type(sys)) is is_compiled
+)
+
+# Values and "try" blocks make imports eager.
+print("Eager for value usage:", "eager_value" in sys.modules)
+print("Eager in try block:", "eager_in_try" in sys.modules)
+print("Eager for side effects:", "eager_side_effects" in sys.modules)
+print("Eager for same name:", "lazy_package.b" in sys.modules)
+
+print("First attribute use gives:", lazy_used.value)
+print("Imported on first use:", "lazy_used" in sys.modules)
+print(
+    "Rebound to real module:",
+    globals()["lazy_used"] is sys.modules["lazy_used"]
+)
+print("Second attribute use gives:", lazy_used.value)
+
+# From now on, importing the module fails.
+class FailingImporter(object):
+    @staticmethod
+    def _fail(fullname):
+        if fullname == "lazy_raising":
+            raise ImportError("lazy_raising cannot be imported anymore")
+
+    def find_module(self, fullname, path = None):
+        self._fail(fullname)
+
+    def find_spec(self, fullname, path, target = None):
+        self._fail(fullname)
+
+sys.meta_path.insert(0, FailingImporter())
+
+try:
+    lazy_raising.value
+except ImportError:
+    error_line = sys.exc_info()[2].tb_lineno
+else:
+    error_line = None
+
+# Without lazy imports, it was imported before, and there is no error.
+print(
+    "ImportError raised by the line of first use as expected:",
+    error_line == (85 if is_compiled else None)
+)
+
+print(
+    "Eager modules:",
+    [eager_value][0].__name__,
+    eager_in_try.__name__,
+    eager_side_effects.value
+)
+print("Same name modules:", lazy_package.b.value, lazy_package.c.value)
@@ -111,6 +111,18 @@ for filename in sorted(os.listdir('.')):
               )
 
         extra_flags.append("ignore_warnings")
+    elif filename == "compile_time_functions":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --experimental=compile_time_functions"
+    elif filename == "instrumentation":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --instrument"
+    elif filename == "lazy_imports":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --lazy-imports"
+    elif filename == "split_module":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --split-module-size=1"
     else:
         os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
 
@@ -0,0 +1,54 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test of "--split-module-size" mode.
+
+Compiled with a tiny split size, the C code of both modules is spread over
+many files, which then have to share the module object, constants, code
+objects and functions through the module header.
+"""
+
+from __future__ import print_function
+
+import sys
+
+import split_functions
+
+module_value = "main module value"
+
+def useModuleValue():
+    return module_value.upper()
+
+def useOtherModule():
+    return split_functions.makeAdder(40)(2)
+
+print("Module value:", useModuleValue())
+print("Other module:", useOtherModule())
+
+split_functions.runAll()
+
+try:
+    split_functions.raiseFromNested()
+except ValueError as e:
+    tb = sys.exc_info()[2]
+
+    names = []
+    while tb is not None:
+        names.append(tb.tb_frame.f_code.co_name)
+        tb = tb.tb_next
+
+    print("Raised:", repr(e), "through", names)
@@ -0,0 +1,125 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module with many small functions of all kinds, for splitting its C code.
+
+"""
+
+from __future__ import print_function
+
+shared_constant = ("shared", "constant", 1, 2.5, None)
+
+counter = 0
+
+def countCall():
+    global counter
+    counter += 1
+
+    return counter
+
+def withDefaults(a, b = shared_constant, c = {"key" : "value"}):
+    countCall()
+    return a, b[0], c["key"]
+
+def withStarArgs(*args, **kwargs):
+    countCall()
+    return len(args), sorted(kwargs)
+
+def makeAdder(offset):
+    def adder(value):
+        return value + offset
+
+    return adder
+
+def makeCounter():
+    count = [0]
+
+    def increment():
+        count[0] += 1
+        return count[0]
+
+    return increment
+
+def generateSquares(limit):
+    for value in range(limit):
+        yield value * value
+
+def generateClosure(factor):
+    def multiply(value):
+        return value * factor
+
+    for value in range(3):
+        yield multiply(value)
+
+def useLambdas():
+    functions = [lambda x, n=n: x + n for n in range(3)]
+
+    return [f(10) for f in functions]
+
+def useContractions(values):
+    return (
+        [v for v in values if v % 2],
+        set(v % 3 for v in values),
+        dict((v, str(v)) for v in values)
+    )
+
+class SplitClass(object):
+    class_constant = "class constant"
+
+    def __init__(self, value):
+        self.value = value
+
+    def method(self):
+        return self.value, self.class_constant
+
+    @staticmethod
+    def static(value):
+        return value * 2
+
+    @classmethod
+    def create(cls, value):
+        return cls(value)
+
+    def __repr__(self):
+        return "<SplitClass %r>" % (self.value,)
+
+class DerivedClass(SplitClass):
+    def method(self):
+        return ("derived",) + SplitClass.method(self)
+
+def raiseFromNested():
+    def inner():
+        raise ValueError("from nested function", shared_constant)
+
+    inner()
+
+def runAll():
+    print("With defaults:", withDefaults(1), withDefaults(1, "other", {"key" : 2}))
+    print("With star args:", withStarArgs(1, 2, 3, x = 1, y = 2))
+    print("Closure:", makeAdder(5)(10))
+
+    counter_func = makeCounter()
+    counter_func()
+    print("Closure cell:", counter_func())
+
+    print("Generator:", list(generateSquares(5)))
+    print("Generator closure:", list(generateClosure(7)))
+    print("Lambdas:", useLambdas())
+    print("Contractions:", useContractions(range(6)))
+    print("Class:", SplitClass(1).method(), SplitClass.static(4), SplitClass.create(3))
+    print("Derived class:", DerivedClass(2).method())
+    print("Module global counter:", counter)